@@ -6,9 +6,9 @@ import os
 import tempfile
 import uuid
 
-from fastapi import APIRouter, UploadFile, File, status
+from fastapi import APIRouter, Response, UploadFile, File, status
 
-from apps.public_api.dependencies import CurrentUser, DbSession
+from apps.public_api.dependencies import CurrentUser, DbSession, ReadDbSession
 from packages.common.schemas.beautify import (
     UploadResponse,
     BeautifySessionResponse,
@@ -19,6 +19,8 @@ from packages.common.schemas.beautify import (
     SlideIR,
 )
 from packages.common.schemas.auth import MessageResponse
+from packages.common.services.load_profiles import LoadProfile
+from packages.common.services.beautify_progress import current_progress
 from packages.common.services.beautify_service import (
     create_session,
     get_session,
@@ -29,6 +31,7 @@ from packages.common.services.beautify_service import (
 )
 from packages.common.tasks.beautify_tasks import process_pptx_upload
 from packages.common.core.exceptions import ValidationError
+from packages.common.core.serialization import model_json_response
 
 router = APIRouter()
 
@@ -96,9 +99,9 @@ def get_beautify_session(
     session_id: uuid.UUID,
     current_user: CurrentUser,
     db: DbSession,
-) -> BeautifySessionResponse:
+) -> Response:
     """Get session status and slides."""
-    session = get_session(db, session_id, current_user)
+    session = get_session(db, session_id, current_user, profile=LoadProfile.FULL)
 
     # Convert slides_data to SlideIR objects
     slides = []
@@ -106,7 +109,9 @@ def get_beautify_session(
         for slide_data in session.slides_data:
             slides.append(SlideIR(**slide_data))
 
-    return BeautifySessionResponse(
+    session_status, progress = current_progress(session)
+
+    return model_json_response(BeautifySessionResponse(
         id=session.id,
         owner_id=session.owner_id,
         file_name=session.file_name,
@@ -117,11 +122,11 @@ def get_beautify_session(
         intensity=session.intensity,
         theme_id=session.theme_id,
         overall_mess_score=session.overall_mess_score,
-        status=session.status,
-        progress=session.progress,
+        status=session_status,
+        progress=progress,
         error_message=session.error_message,
         share_id=session.share_id,
-    )
+    ))
 
 
 @router.post(
@@ -135,7 +140,7 @@ def transform_deck(
     data: TransformRequest,
     current_user: CurrentUser,
     db: DbSession,
-) -> TransformResponse:
+) -> Response:
     """Transform slides with selected style and intensity."""
     transformed = transform_session(
         db=db,
@@ -145,7 +150,7 @@ def transform_deck(
         intensity=data.intensity,
     )
 
-    return TransformResponse(slides=transformed)
+    return model_json_response(TransformResponse(slides=transformed))
 
 
 @router.post(
@@ -176,18 +181,18 @@ def create_share(
 )
 def get_share_view(
     share_id: str,
-    db: DbSession,
-) -> ShareViewData:
+    db: ReadDbSession,
+) -> Response:
     """Get public share view data."""
     data = get_share_data(db, share_id)
 
-    return ShareViewData(
+    return model_json_response(ShareViewData(
         file_name=data["file_name"],
         before_slides=[SlideIR(**s) for s in data["before_slides"]],
         after_slides=data["after_slides"],
         theme_id=data["theme_id"],
         created_at=data["created_at"],
-    )
+    ))
 
 
 @router.delete(
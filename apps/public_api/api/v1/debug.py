@@ -5,11 +5,13 @@ For diagnosing data issues - only enabled in development mode
 import uuid
 from typing import Any
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy import func
 
-from apps.public_api.dependencies import CurrentUser, DbSession
+from apps.public_api.dependencies import CurrentUser, DbSession, get_current_user
 from packages.common.core.config import settings
+from packages.common.core.pool_metrics import get_pool_stats
+from packages.common.middleware.sql_profiler import get_recent_profiles
 from packages.common.models.user import User
 from packages.common.models.presentation import Presentation
 from packages.common.core.exceptions import AuthorizationError
@@ -289,3 +291,48 @@ def debug_stats(
             "email": current_user.email,
         },
     }
+
+
+@router.get(
+    "/sql-profiles",
+    summary="Debug: Recent SQL profiles",
+    description="Per-request statement counts, DB time and N+1 suspects (requires SQL_PROFILER_ENABLED)",
+    dependencies=[Depends(get_current_user)],
+)
+def debug_sql_profiles(
+    path_prefix: str | None = Query(None, description="Only include requests under this path"),
+    suspects_only: bool = Query(False, description="Only include requests flagged as N+1"),
+) -> dict[str, Any]:
+    """List recently profiled requests, newest first"""
+    require_debug_mode()
+
+    profiles = get_recent_profiles()
+    if path_prefix:
+        profiles = [p for p in profiles if p["path"].startswith(path_prefix)]
+    if suspects_only:
+        profiles = [p for p in profiles if p["n_plus_one_suspects"]]
+
+    return {
+        "enabled": settings.sql_profiler_enabled,
+        "n_plus_one_threshold": settings.sql_profiler_n_plus_one_threshold,
+        "count": len(profiles),
+        "profiles": profiles,
+    }
+
+
+@router.get(
+    "/db-pool",
+    summary="Debug: Database pool metrics",
+    description="Pool size, checked-out connections and checkout wait/hold times per engine",
+    dependencies=[Depends(get_current_user)],
+)
+def debug_db_pool() -> dict[str, Any]:
+    """Report connection pool state for this process"""
+    require_debug_mode()
+
+    return {
+        "role": settings.database_role,
+        "pgbouncer_mode": settings.database_pgbouncer_mode,
+        "slow_checkout_ms": settings.database_slow_checkout_ms,
+        "pools": get_pool_stats(),
+    }
@@ -8,7 +8,7 @@ import uuid
 
 from fastapi import APIRouter, UploadFile, File, Query, status
 
-from apps.public_api.dependencies import CurrentUser, DbSession
+from apps.public_api.dependencies import CurrentUser, DbSession, ReadDbSession
 from packages.common.schemas.document import (
     UploadResponse,
     DocumentResponse,
@@ -100,7 +100,7 @@ async def upload_document(
 )
 def list_documents(
     current_user: CurrentUser,
-    db: DbSession,
+    db: ReadDbSession,
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100, alias="pageSize"),
     status: str | None = Query(None),
@@ -6,6 +6,7 @@ import uuid
 
 from fastapi import APIRouter, Query, status
 from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from apps.public_api.dependencies import CurrentUser, DbSession
 from packages.common.schemas.ideation import (
@@ -29,6 +30,7 @@ from packages.common.models.ideation import (
     NoteConnection,
     IdeationJournalEntry,
 )
+from packages.common.services.presentation_mappers import bulk_insert
 from packages.common.core.exceptions import NotFoundError, AuthorizationError
 
 router = APIRouter()
@@ -54,6 +56,44 @@ def require_session_ownership(session: IdeationSession, user) -> IdeationSession
     return session
 
 
+def _note_values(session_id: uuid.UUID, note_data: IdeaNoteCreate) -> dict:
+    """Build IdeaNote column values for bulk insert"""
+    return {
+        "session_id": session_id,
+        "content": note_data.content,
+        "note_type": note_data.note_type,
+        "source_url": note_data.source_url,
+        "parent_id": note_data.parent_id,
+        "column_index": note_data.column_index,
+        "row_index": note_data.row_index,
+        "color": note_data.color,
+        "approved": note_data.approved,
+    }
+
+
+def _connection_values(session_id: uuid.UUID, conn_data: NoteConnectionCreate) -> dict:
+    """Build NoteConnection column values for bulk insert"""
+    return {
+        "session_id": session_id,
+        "from_note_id": conn_data.from_note_id,
+        "to_note_id": conn_data.to_note_id,
+    }
+
+
+def _journal_entry_values(session_id: uuid.UUID, entry_data: JournalEntryCreate) -> dict:
+    """Build IdeationJournalEntry column values for bulk insert"""
+    return {
+        "session_id": session_id,
+        "stage": entry_data.stage,
+        "title": entry_data.title,
+        "narrative": entry_data.narrative,
+        "decision": entry_data.decision,
+        "confidence": entry_data.confidence,
+        "related_note_ids": entry_data.related_note_ids,
+        "related_slide_ids": entry_data.related_slide_ids,
+    }
+
+
 # Session CRUD
 
 def _serialize_note(note: IdeaNote) -> dict:
@@ -153,46 +193,19 @@ def create_session(
     db.add(session)
     db.flush()  # Get the ID
 
-    # Add notes if provided
-    for note_data in data.notes:
-        note = IdeaNote(
-            session_id=session.id,
-            content=note_data.content,
-            note_type=note_data.note_type,
-            source_url=note_data.source_url,
-            parent_id=note_data.parent_id,
-            column_index=note_data.column_index,
-            row_index=note_data.row_index,
-            color=note_data.color,
-            approved=note_data.approved,
-        )
-        db.add(note)
-
-    # Add connections if provided
-    for conn_data in data.connections:
-        conn = NoteConnection(
-            session_id=session.id,
-            from_note_id=conn_data.from_note_id,
-            to_note_id=conn_data.to_note_id,
-        )
-        db.add(conn)
-
-    # Add journal entries if provided
-    for entry_data in data.journal_entries:
-        entry = IdeationJournalEntry(
-            session_id=session.id,
-            stage=entry_data.stage,
-            title=entry_data.title,
-            narrative=entry_data.narrative,
-            decision=entry_data.decision,
-            confidence=entry_data.confidence,
-            related_note_ids=entry_data.related_note_ids,
-            related_slide_ids=entry_data.related_slide_ids,
-        )
-        db.add(entry)
+    # Add notes, connections and journal entries in one round trip each
+    notes = bulk_insert(db, IdeaNote, [_note_values(session.id, n) for n in data.notes])
+    connections = bulk_insert(db, NoteConnection, [_connection_values(session.id, c) for c in data.connections])
+    journal_entries = bulk_insert(
+        db, IdeationJournalEntry, [_journal_entry_values(session.id, e) for e in data.journal_entries]
+    )
+
+    # Populate relationships from the inserted rows (no reload needed)
+    set_committed_value(session, "notes", notes)
+    set_committed_value(session, "connections", connections)
+    set_committed_value(session, "journal_entries", journal_entries)
 
     db.commit()
-    db.refresh(session)
     return IdeationSessionDetailResponse.model_validate(session)
 
 
@@ -243,34 +256,17 @@ def update_session(
     if data.notes is not None:
         # Delete existing notes
         db.query(IdeaNote).filter(IdeaNote.session_id == session_id).delete()
-        # Add new notes
-        for note_data in data.notes:
-            note = IdeaNote(
-                session_id=session.id,
-                content=note_data.content,
-                note_type=note_data.note_type,
-                column_index=note_data.column_index,
-                row_index=note_data.row_index,
-                color=note_data.color,
-                approved=note_data.approved,
-                source_url=note_data.source_url,
-                parent_id=note_data.parent_id,
-            )
-            db.add(note)
+        # Add new notes in one round trip
+        notes = bulk_insert(db, IdeaNote, [_note_values(session.id, n) for n in data.notes])
+        set_committed_value(session, "notes", notes)
 
     # Handle connections (replace all)
     if data.connections is not None:
         db.query(NoteConnection).filter(NoteConnection.session_id == session_id).delete()
-        for conn_data in data.connections:
-            conn = NoteConnection(
-                session_id=session.id,
-                from_note_id=conn_data.from_note_id,
-                to_note_id=conn_data.to_note_id,
-            )
-            db.add(conn)
+        connections = bulk_insert(db, NoteConnection, [_connection_values(session.id, c) for c in data.connections])
+        set_committed_value(session, "connections", connections)
 
     db.commit()
-    db.refresh(session)
     return IdeationSessionDetailResponse.model_validate(session)
 
 
@@ -324,7 +320,6 @@ def add_note(
     )
     db.add(note)
     db.commit()
-    db.refresh(note)
     return IdeaNoteResponse.model_validate(note)
 
 
@@ -375,7 +370,6 @@ def update_note(
         note.approved = data.approved
 
     db.commit()
-    db.refresh(note)
     return IdeaNoteResponse.model_validate(note)
 
 
@@ -436,7 +430,6 @@ def add_connection(
     )
     db.add(conn)
     db.commit()
-    db.refresh(conn)
     return NoteConnectionResponse.model_validate(conn)
 
 
@@ -502,5 +495,4 @@ def add_journal_entry(
     )
     db.add(entry)
     db.commit()
-    db.refresh(entry)
     return JournalEntryResponse.model_validate(entry)
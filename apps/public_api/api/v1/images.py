@@ -19,6 +19,8 @@ from packages.common.schemas.image_generation import (
     ImageTaskStatus,
 )
 from packages.common.services.authorization_service import require_presentation_ownership
+from packages.common.services.load_profiles import LoadProfile
+from packages.common.services.presentation_events import presentation_changed
 from packages.common.services.presentation_service import (
     get_presentation_by_id,
     get_slide_by_id,
@@ -65,6 +67,7 @@ def generate_single_image(
     # Store task_id on slide
     slide.image_task_id = task.id
     db.commit()
+    presentation_changed(presentation_id)
 
     return ImageGenerationResponse(
         task_id=task.id,
@@ -87,7 +90,7 @@ def generate_all_images(
     db: DbSession,
 ) -> BatchImageGenerationResponse:
     """Queue image generation for multiple slides."""
-    presentation = get_presentation_by_id(db, presentation_id)
+    presentation = get_presentation_by_id(db, presentation_id, profile=LoadProfile.IMAGES)
     presentation = require_presentation_ownership(presentation, current_user)
 
     # Determine which slides to process
@@ -169,7 +172,7 @@ def get_presentation_image_status(
     db: DbSession,
 ) -> BatchStatusResponse:
     """Get status of all image generation tasks for a presentation."""
-    presentation = get_presentation_by_id(db, presentation_id)
+    presentation = get_presentation_by_id(db, presentation_id, profile=LoadProfile.IMAGES)
     presentation = require_presentation_ownership(presentation, current_user)
 
     slide_statuses: dict[str, ImageTaskStatus] = {}
@@ -269,6 +272,7 @@ def regenerate_slide_image(
 
     slide.image_task_id = task.id
     db.commit()
+    presentation_changed(presentation_id)
 
     return ImageGenerationResponse(
         task_id=task.id,
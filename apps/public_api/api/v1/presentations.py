@@ -3,10 +3,18 @@ Presentations API Endpoints
 CRUD operations for presentations
 """
 import uuid
-
-from fastapi import APIRouter, Query, status
-
-from apps.public_api.dependencies import CurrentUser, DbSession
+from collections.abc import Callable
+
+from fastapi import APIRouter, Header, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from sqlalchemy.orm import Session
+
+from apps.public_api.dependencies import CurrentUser, DbSession, ReadDbSession
+from packages.common.core.database import get_db_context, reads_from_primary
+from packages.common.core.serialization import model_json_response
+from packages.common.models.presentation import Presentation
+from packages.common.models.user import User
 from packages.common.schemas.presentation import (
     PresentationCreate,
     PresentationUpdate,
@@ -23,11 +31,28 @@ from packages.common.schemas.presentation_version import (
     VersionCreate,
     VersionResponse,
     VersionDetailResponse,
+    VersionDiffResponse,
     VersionListResponse,
 )
 from packages.common.schemas.auth import MessageResponse
+from packages.common.services.http_cache import (
+    PRESENTATION_VARY,
+    etag_matches,
+    presentation_cache_control,
+    presentation_etag,
+)
+from packages.common.services.load_profiles import LoadProfile
+from packages.common.services.presentation_cache import (
+    CachedPresentationMeta,
+    get_body,
+    get_generation,
+    get_meta,
+    store_body,
+    store_meta,
+)
 from packages.common.services.presentation_service import (
     get_presentation_by_id,
+    load_presentation_slides,
     list_presentations,
     create_presentation,
     update_presentation,
@@ -38,8 +63,14 @@ from packages.common.services.presentation_service import (
     delete_slide,
     get_slide_by_id,
     import_presentation,
+    import_presentation_stream,
     export_presentation,
+    stream_export_presentation,
+    ExportStreamFormat,
 )
+from packages.common.services.slide_bodies import expand_snapshot
+from packages.common.services.version_diff import get_version_diff
+from packages.common.services.version_snapshots import load_snapshot
 from packages.common.services.version_service import (
     create_version,
     list_versions,
@@ -56,6 +87,56 @@ from packages.common.core.exceptions import NotFoundError
 router = APIRouter()
 
 
+def _cached_presentation_response(
+    db: Session,
+    presentation_id: uuid.UUID,
+    current_user: User,
+    representation: str,
+    render: Callable[[Presentation], BaseModel],
+    if_none_match: str | None,
+) -> Response:
+    """
+    Serve a presentation representation via ETags and the Redis cache.
+
+    A cached meta pointer answers the access check and If-None-Match without
+    Postgres; slides are only loaded when the serialized body is not cached.
+    Meta read from a replica is used for this request but never published.
+    """
+    presentation = None
+    meta = get_meta(presentation_id)
+    if meta is None:
+        # Only the primary may publish meta: a lagging replica would serve
+        # the pre-edit deck to everyone until the meta expires
+        primary = reads_from_primary(db)
+        generation = get_generation(presentation_id) if primary else None
+        presentation = check_presentation_access(get_presentation_by_id(db, presentation_id), current_user)
+        meta = CachedPresentationMeta.from_presentation(presentation)
+        store_meta(meta, generation)
+    else:
+        check_presentation_access(meta, current_user)
+
+    headers = {
+        "ETag": presentation_etag(meta, representation),
+        "Cache-Control": presentation_cache_control(meta, current_user),
+        "Vary": PRESENTATION_VARY,
+    }
+    if etag_matches(if_none_match, headers["ETag"]):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    body = get_body(meta, representation)
+    if body is None:
+        if presentation is None:
+            # Meta was cached but the body was evicted: rebuild from Postgres
+            presentation = check_presentation_access(get_presentation_by_id(db, presentation_id), current_user)
+            meta = CachedPresentationMeta.from_presentation(presentation)
+            headers["ETag"] = presentation_etag(meta, representation)
+        load_presentation_slides(db, presentation)
+        body = render(presentation).model_dump_json().encode()
+        store_body(meta, representation, body)
+
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
 # Presentation CRUD
 @router.get(
     "",
@@ -65,12 +146,12 @@ router = APIRouter()
 )
 def list_user_presentations(
     current_user: CurrentUser,
-    db: DbSession,
+    db: ReadDbSession,
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
-) -> PresentationListResponse:
+) -> Response:
     """List user's presentations with pagination"""
-    return list_presentations(db, current_user, page, page_size)
+    return model_json_response(list_presentations(db, current_user, page, page_size))
 
 
 @router.post(
@@ -94,17 +175,23 @@ def create_new_presentation(
     "/{presentation_id}",
     response_model=PresentationDetailResponse,
     summary="Get presentation",
-    description="Get a presentation by ID with all slides",
+    description="Get a presentation by ID with all slides. Supports If-None-Match.",
 )
 def get_presentation(
     presentation_id: uuid.UUID,
     current_user: CurrentUser,
-    db: DbSession,
-) -> PresentationDetailResponse:
-    """Get a presentation with slides"""
-    presentation = get_presentation_by_id(db, presentation_id)
-    presentation = check_presentation_access(presentation, current_user)
-    return PresentationDetailResponse.model_validate(presentation)
+    db: ReadDbSession,
+    if_none_match: str | None = Header(None),
+) -> Response:
+    """Get a presentation with slides (304 without loading slides if unchanged)"""
+    return _cached_presentation_response(
+        db,
+        presentation_id,
+        current_user,
+        "detail",
+        PresentationDetailResponse.model_validate,
+        if_none_match,
+    )
 
 
 @router.put(
@@ -181,21 +268,76 @@ def import_presentation_endpoint(
     return PresentationDetailResponse.model_validate(presentation)
 
 
+@router.post(
+    "/import/stream",
+    response_model=PresentationResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Stream import presentation",
+    description=(
+        "Import a presentation from an NDJSON body (application/x-ndjson): a "
+        "PresentationImport header on the first line, then one SlideImport per "
+        "line. Slides are validated and committed in batches; while the upload "
+        "runs the presentation reports import_status='importing' and "
+        "import_slide_count."
+    ),
+)
+async def stream_import_presentation_endpoint(
+    request: Request,
+    current_user: CurrentUser,
+    db: DbSession,
+) -> PresentationResponse:
+    """Import a presentation slide by slide from a streamed body"""
+    presentation = await import_presentation_stream(db, current_user, request.stream())
+    return PresentationResponse.model_validate(presentation)
+
+
 @router.get(
     "/{presentation_id}/export",
     response_model=PresentationExport,
     summary="Export presentation",
-    description="Export a presentation to JSON format for frontend",
+    description="Export a presentation to JSON format for frontend. Supports If-None-Match.",
 )
 def export_presentation_endpoint(
     presentation_id: uuid.UUID,
     current_user: CurrentUser,
     db: DbSession,
-) -> PresentationExport:
-    """Export a presentation"""
+    if_none_match: str | None = Header(None),
+) -> Response:
+    """Export a presentation (304 without loading slides if unchanged)"""
+    return _cached_presentation_response(
+        db,
+        presentation_id,
+        current_user,
+        "export",
+        export_presentation,
+        if_none_match,
+    )
+
+
+@router.get(
+    "/{presentation_id}/export/stream",
+    summary="Stream presentation export",
+    description=(
+        "Stream an export with constant server memory. format=json yields the same "
+        "document as /export; format=ndjson yields the presentation header on the "
+        "first line and one slide per line."
+    ),
+)
+def stream_export_presentation_endpoint(
+    presentation_id: uuid.UUID,
+    current_user: CurrentUser,
+    db: ReadDbSession,
+    export_format: ExportStreamFormat = Query("json", alias="format"),
+) -> StreamingResponse:
+    """Stream a presentation export from a server-side cursor"""
     presentation = get_presentation_by_id(db, presentation_id)
     presentation = check_presentation_access(presentation, current_user)
-    return export_presentation(presentation)
+
+    media_type = "application/x-ndjson" if export_format == "ndjson" else "application/json"
+    return StreamingResponse(
+        stream_export_presentation(db.get_bind(), presentation, export_format),
+        media_type=media_type,
+    )
 
 
 # Slide operations
@@ -273,17 +415,19 @@ def delete_existing_slide(
     "/{presentation_id}/versions",
     response_model=VersionListResponse,
     summary="List versions",
-    description="Get all version checkpoints for a presentation",
+    description="Get version checkpoints for a presentation, newest first, paginated by version number",
 )
 def list_presentation_versions(
     presentation_id: uuid.UUID,
     current_user: CurrentUser,
-    db: DbSession,
+    db: ReadDbSession,
+    before: int | None = Query(None, ge=1, description="Only versions older than this version_number"),
+    limit: int = Query(50, ge=1, le=200, description="Versions per page"),
 ) -> VersionListResponse:
-    """List all versions for a presentation"""
+    """List versions for a presentation (metadata only), newest first"""
     presentation = get_presentation_by_id(db, presentation_id)
     require_presentation_ownership(presentation, current_user)
-    return list_versions(db, presentation_id)
+    return list_versions(db, presentation_id, before=before, limit=limit)
 
 
 @router.post(
@@ -291,7 +435,7 @@ def list_presentation_versions(
     response_model=VersionResponse,
     status_code=status.HTTP_201_CREATED,
     summary="Create version checkpoint",
-    description="Save the current state as a new version checkpoint",
+    description="Save the current state as a new version checkpoint (the latest version is returned if nothing changed)",
 )
 def create_version_checkpoint(
     presentation_id: uuid.UUID,
@@ -300,7 +444,7 @@ def create_version_checkpoint(
     db: DbSession,
 ) -> VersionResponse:
     """Create a new version checkpoint"""
-    presentation = get_presentation_by_id(db, presentation_id)
+    presentation = get_presentation_by_id(db, presentation_id, profile=LoadProfile.IMAGES)
     presentation = require_presentation_ownership(presentation, current_user)
     version = create_version(db, presentation, data)
     return VersionResponse.model_validate(version)
@@ -322,14 +466,72 @@ def get_version_detail(
     presentation = get_presentation_by_id(db, presentation_id)
     require_presentation_ownership(presentation, current_user)
 
-    version = get_version(db, version_id)
+    version = get_version(db, version_id, include_snapshot=True)
     if not version or version.presentation_id != presentation_id:
         raise NotFoundError(
             message="Version not found",
             resource_type="version",
             resource_id=str(version_id),
         )
-    return VersionDetailResponse.model_validate(version)
+    response = VersionDetailResponse.model_validate(version)
+    response.snapshot = expand_snapshot(db, load_snapshot(db, version))
+    return response
+
+
+@router.get(
+    "/{presentation_id}/versions/{version_id}/diff/{other_version_id}",
+    response_model=VersionDiffResponse,
+    summary="Compare versions",
+    description="Slide- and field-level changes from one version to another",
+)
+def get_version_diff_endpoint(
+    presentation_id: uuid.UUID,
+    version_id: uuid.UUID,
+    other_version_id: uuid.UUID,
+    current_user: CurrentUser,
+    db: ReadDbSession,
+) -> Response:
+    """Diff from version_id to other_version_id"""
+    version_ids = (version_id, other_version_id)
+    try:
+        content = _version_diff(db, presentation_id, version_ids, current_user)
+    except NotFoundError:
+        if reads_from_primary(db):
+            raise
+        # A version created moments ago may not have reached the replica yet
+        with get_db_context() as primary_db:
+            content = _version_diff(primary_db, presentation_id, version_ids, current_user)
+
+    # Both versions are immutable, so the diff is too
+    return Response(
+        content=content,
+        media_type="application/json",
+        headers={"Cache-Control": "private, max-age=86400, immutable"},
+    )
+
+
+def _version_diff(
+    db: Session,
+    presentation_id: uuid.UUID,
+    version_ids: tuple[uuid.UUID, uuid.UUID],
+    current_user: User,
+) -> bytes:
+    """Serialized diff between two of the presentation's versions"""
+    presentation = get_presentation_by_id(db, presentation_id)
+    require_presentation_ownership(presentation, current_user)
+
+    versions = []
+    for requested_id in version_ids:
+        # Snapshot loaded up front: keyframes would lazy-load it one by one
+        version = get_version(db, requested_id, include_snapshot=True)
+        if not version or version.presentation_id != presentation_id:
+            raise NotFoundError(
+                message="Version not found",
+                resource_type="version",
+                resource_id=str(requested_id),
+            )
+        versions.append(version)
+    return get_version_diff(db, *versions)
 
 
 @router.post(
@@ -348,7 +550,7 @@ def restore_to_version(
     presentation = get_presentation_by_id(db, presentation_id)
     presentation = require_presentation_ownership(presentation, current_user)
 
-    version = get_version(db, version_id)
+    version = get_version(db, version_id, include_snapshot=True)
     if not version or version.presentation_id != presentation_id:
         raise NotFoundError(
             message="Version not found",
@@ -356,7 +558,7 @@ def restore_to_version(
             resource_id=str(version_id),
         )
 
-    restore_version(db, presentation, version)
+    restore_version(db, presentation, version, user_id=current_user.id)
     return MessageResponse(message=f"Restored to version {version.version_number}")
 
 
@@ -5,6 +5,7 @@ CRUD operations for rough draft presentations
 import uuid
 
 from fastapi import APIRouter, Query, status
+from sqlalchemy.orm.attributes import set_committed_value
 
 from apps.public_api.dependencies import CurrentUser, DbSession
 from packages.common.schemas.rough_draft import (
@@ -22,16 +23,27 @@ from packages.common.schemas.auth import MessageResponse
 from packages.common.schemas.presentation import PresentationDetailResponse
 from packages.common.models.rough_draft import RoughDraft, RoughDraftSlide
 from packages.common.models.presentation import Presentation
-from packages.common.models.slide import Slide
+from packages.common.services.load_profiles import LoadProfile, rough_draft_load_options
+from packages.common.services.presentation_mappers import bulk_insert_slides, slide_values_from_draft
+from packages.common.services.thumbnail_service import schedule_thumbnail
 from packages.common.core.exceptions import NotFoundError, AuthorizationError
 
 router = APIRouter()
 
 
 # Helper functions
-def get_draft_by_id(db, draft_id: uuid.UUID) -> RoughDraft:
+def get_draft_by_id(
+    db,
+    draft_id: uuid.UUID,
+    profile: LoadProfile = LoadProfile.SUMMARY,
+) -> RoughDraft:
     """Get a draft by ID or raise NotFoundError"""
-    draft = db.query(RoughDraft).filter(RoughDraft.id == draft_id).first()
+    draft = (
+        db.query(RoughDraft)
+        .options(*rough_draft_load_options(profile))
+        .filter(RoughDraft.id == draft_id)
+        .first()
+    )
     if not draft:
         raise NotFoundError(
             message="Rough draft not found",
@@ -110,8 +122,8 @@ def create_draft(
     db.flush()  # Get the ID
 
     # Add slides if provided
-    for slide_data in data.slides:
-        slide = RoughDraftSlide(
+    slides = [
+        RoughDraftSlide(
             rough_draft_id=draft.id,
             position=slide_data.position,
             title=slide_data.title,
@@ -123,10 +135,14 @@ def create_draft(
             alignment=slide_data.alignment,
             approval_state=slide_data.approval_state,
         )
-        db.add(slide)
+        for slide_data in data.slides
+    ]
+    db.add_all(slides)
 
     db.commit()
-    db.refresh(draft)
+    # Server defaults came back via RETURNING; seed the collection (in
+    # relationship order) instead of reloading it
+    set_committed_value(draft, "slides", sorted(slides, key=lambda slide: slide.position))
     return RoughDraftDetailResponse.model_validate(draft)
 
 
@@ -142,7 +158,7 @@ def get_draft(
     db: DbSession,
 ) -> RoughDraftDetailResponse:
     """Get a rough draft with all slides"""
-    draft = get_draft_by_id(db, draft_id)
+    draft = get_draft_by_id(db, draft_id, profile=LoadProfile.FULL)
     draft = require_draft_ownership(draft, current_user)
     return RoughDraftDetailResponse.model_validate(draft)
 
@@ -174,7 +190,6 @@ def update_draft(
         draft.status = data.status
 
     db.commit()
-    db.refresh(draft)
     return RoughDraftResponse.model_validate(draft)
 
 
@@ -212,7 +227,7 @@ def approve_draft(
     db: DbSession,
 ) -> PresentationDetailResponse:
     """Approve a rough draft and create a presentation"""
-    draft = get_draft_by_id(db, draft_id)
+    draft = get_draft_by_id(db, draft_id, profile=LoadProfile.FULL)
     draft = require_draft_ownership(draft, current_user)
 
     if draft.status == "approved":
@@ -230,27 +245,19 @@ def approve_draft(
     db.add(presentation)
     db.flush()  # Get the ID
 
-    # Copy slides from draft to presentation
-    for draft_slide in draft.slides:
-        slide = Slide(
-            presentation_id=presentation.id,
-            position=draft_slide.position,
-            title=draft_slide.title,
-            content=draft_slide.content,
-            speaker_notes=draft_slide.speaker_notes,
-            image_prompt=draft_slide.image_prompt,
-            image_url=draft_slide.image_url,
-            layout_type=draft_slide.layout_type,
-            alignment=draft_slide.alignment,
-        )
-        db.add(slide)
+    # Copy slides from draft to presentation in one round trip
+    bulk_insert_slides(
+        db,
+        presentation,
+        [slide_values_from_draft(presentation.id, draft_slide) for draft_slide in draft.slides],
+    )
 
     # Update draft status and link to presentation
     draft.status = "approved"
     draft.presentation_id = presentation.id
 
     db.commit()
-    db.refresh(presentation)
+    schedule_thumbnail(presentation.id)
     return PresentationDetailResponse.model_validate(presentation)
 
 
@@ -286,7 +293,6 @@ def add_slide(
     )
     db.add(slide)
     db.commit()
-    db.refresh(slide)
     return RoughDraftSlideResponse.model_validate(slide)
 
 
@@ -339,7 +345,6 @@ def update_slide(
         slide.approval_state = data.approval_state
 
     db.commit()
-    db.refresh(slide)
     return RoughDraftSlideResponse.model_validate(slide)
 
 
@@ -13,8 +13,10 @@ from packages.common.services.websocket_auth import (
     check_presentation_access,
 )
 from packages.common.services.sync_service import handle_sync_message
+from packages.common.services.load_profiles import LoadProfile
 from packages.common.services.presentation_service import get_presentation_by_id
 from packages.common.core.database import get_db_context
+from packages.common.core.serialization import dumps_str, loads
 
 logger = logging.getLogger(__name__)
 
@@ -70,7 +72,7 @@ async def presentation_websocket(
         while True:
             # Receive messages from client
             logger.debug(f"Waiting for message from user {user.id}")
-            data = await websocket.receive_json()
+            data = loads(await websocket.receive_text())
             logger.info(f"Received message type {data.get('type')} from user {user.id}")
 
             # Process the sync message
@@ -107,13 +109,13 @@ async def send_initial_state(
     """Send the current presentation state to a newly connected client"""
     try:
         with get_db_context() as db:
-            presentation = get_presentation_by_id(db, presentation_id)
+            presentation = get_presentation_by_id(db, presentation_id, profile=LoadProfile.FULL)
             if not presentation:
-                await websocket.send_json({
+                await websocket.send_text(dumps_str({
                     "type": "error",
                     "error_code": "presentation_not_found",
                     "error_message": "Presentation not found",
-                })
+                }))
                 return
 
             # Build presentation data
@@ -160,18 +162,18 @@ async def send_initial_state(
                 })
 
             # Send sync state message
-            await websocket.send_json({
+            await websocket.send_text(dumps_str({
                 "type": "sync:state",
                 "presentation": presentation_data,
                 "slides": slides_data,
                 "active_users": active_users,
                 "version": presentation.version,
-            })
+            }))
 
     except Exception as e:
         logger.error(f"Error sending initial state: {e}")
-        await websocket.send_json({
+        await websocket.send_text(dumps_str({
             "type": "error",
             "error_code": "initial_state_failed",
             "error_message": "Failed to load presentation state",
-        })
+        }))
@@ -3,18 +3,20 @@ FastAPI Dependencies
 Reusable dependencies for route handlers
 Follows SOLID-D: Dependency injection pattern
 """
+from collections.abc import Generator
 from typing import Annotated
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.orm import Session
 
-from packages.common.core.database import get_db
+from packages.common.core.database import get_db, get_read_db, replica_engines
 from packages.common.models.user import User
 from packages.common.services.auth_service import (
     AuthError,
     get_current_user_from_token,
 )
+from packages.common.services.read_your_writes import user_id_from_token, wrote_recently
 
 # Security scheme for Swagger docs
 security = HTTPBearer(auto_error=False)
@@ -66,7 +68,23 @@ def get_current_user_optional(
         return None
 
 
+def get_read_db_session(
+    credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(security)],
+) -> Generator[Session, None, None]:
+    """
+    Read-only session routed to a replica
+
+    Stays on the primary while the caller has written recently.
+    """
+    primary = False
+    if replica_engines:
+        user_id = user_id_from_token(credentials.credentials if credentials else None)
+        primary = user_id is not None and wrote_recently(user_id)
+    yield from get_read_db(primary)
+
+
 # Type aliases for cleaner route signatures
 CurrentUser = Annotated[User, Depends(get_current_user)]
 OptionalUser = Annotated[User | None, Depends(get_current_user_optional)]
 DbSession = Annotated[Session, Depends(get_db)]
+ReadDbSession = Annotated[Session, Depends(get_read_db_session)]
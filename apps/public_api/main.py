@@ -9,12 +9,15 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 
 from packages.common.core.config import settings
 from packages.common.core.logging import setup_logging
 from packages.common.core.exceptions import ApplicationError
+from packages.common.core.database import engine, replica_engines
+from packages.common.middleware.read_your_writes import ReadYourWritesMiddleware
 from packages.common.middleware.security import SecurityHeadersMiddleware
+from packages.common.middleware.sql_profiler import SQLProfilerMiddleware, install_sql_profiler
 
 # Import API routers
 from apps.public_api.api.v1.router import api_router
@@ -76,6 +79,7 @@ app = FastAPI(
     openapi_url="/openapi.json",
     lifespan=lifespan,
     debug=settings.debug,
+    default_response_class=ORJSONResponse,
 )
 
 # Security headers middleware (should be first to apply to all responses)
@@ -84,6 +88,16 @@ app.add_middleware(
     enable_hsts=settings.environment == "production",
 )
 
+# SQL profiler (opt-in): Server-Timing headers + N+1 detection
+if settings.sql_profiler_enabled:
+    for profiled_engine in (engine, *replica_engines):
+        install_sql_profiler(profiled_engine)
+    app.add_middleware(SQLProfilerMiddleware)
+
+# Read replicas: keep a user's reads on the primary right after their writes
+if replica_engines:
+    app.add_middleware(ReadYourWritesMiddleware)
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -0,0 +1,91 @@
+"""add presentation deck_version
+
+Revision ID: m3n4o5p6q7r8
+Revises: l2m3n4o5p6q7
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'm3n4o5p6q7r8'
+down_revision: Union[str, None] = 'l2m3n4o5p6q7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Deck-level version for ETags / response caching
+    op.add_column(
+        'presentations',
+        sa.Column('deck_version', sa.Integer(), nullable=False, server_default='1'),
+    )
+
+    # Any change to the presentation row itself bumps its deck_version
+    op.execute("""
+        CREATE FUNCTION presentations_bump_deck_version() RETURNS trigger AS $$
+        BEGIN
+            IF NEW.deck_version = OLD.deck_version AND NEW IS DISTINCT FROM OLD THEN
+                NEW.deck_version := OLD.deck_version + 1;
+            END IF;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER presentations_deck_version
+        BEFORE UPDATE ON presentations
+        FOR EACH ROW EXECUTE FUNCTION presentations_bump_deck_version()
+    """)
+
+    # Slide writes bump the parent deck once per statement (not per row), so
+    # bulk inserts and position shifts cost a single presentations update
+    op.execute("""
+        CREATE FUNCTION slides_bump_deck_version() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                UPDATE presentations SET deck_version = deck_version + 1
+                WHERE id IN (SELECT presentation_id FROM new_slides);
+            ELSIF TG_OP = 'DELETE' THEN
+                UPDATE presentations SET deck_version = deck_version + 1
+                WHERE id IN (SELECT presentation_id FROM old_slides);
+            ELSE
+                UPDATE presentations SET deck_version = deck_version + 1
+                WHERE id IN (
+                    SELECT presentation_id FROM new_slides
+                    UNION SELECT presentation_id FROM old_slides
+                );
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER slides_deck_version_insert
+        AFTER INSERT ON slides REFERENCING NEW TABLE AS new_slides
+        FOR EACH STATEMENT EXECUTE FUNCTION slides_bump_deck_version()
+    """)
+    op.execute("""
+        CREATE TRIGGER slides_deck_version_update
+        AFTER UPDATE ON slides REFERENCING OLD TABLE AS old_slides NEW TABLE AS new_slides
+        FOR EACH STATEMENT EXECUTE FUNCTION slides_bump_deck_version()
+    """)
+    op.execute("""
+        CREATE TRIGGER slides_deck_version_delete
+        AFTER DELETE ON slides REFERENCING OLD TABLE AS old_slides
+        FOR EACH STATEMENT EXECUTE FUNCTION slides_bump_deck_version()
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS slides_deck_version_delete ON slides")
+    op.execute("DROP TRIGGER IF EXISTS slides_deck_version_update ON slides")
+    op.execute("DROP TRIGGER IF EXISTS slides_deck_version_insert ON slides")
+    op.execute("DROP FUNCTION IF EXISTS slides_bump_deck_version()")
+    op.execute("DROP TRIGGER IF EXISTS presentations_deck_version ON presentations")
+    op.execute("DROP FUNCTION IF EXISTS presentations_bump_deck_version()")
+    op.drop_column('presentations', 'deck_version')
@@ -0,0 +1,29 @@
+"""add presentation import status
+
+Revision ID: n4o5p6q7r8s9
+Revises: m3n4o5p6q7r8
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'n4o5p6q7r8s9'
+down_revision: Union[str, None] = 'm3n4o5p6q7r8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Streaming import progress (NULL for presentations not being imported)
+    op.add_column('presentations', sa.Column('import_status', sa.String(length=20), nullable=True))
+    op.add_column('presentations', sa.Column('import_slide_count', sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('presentations', 'import_slide_count')
+    op.drop_column('presentations', 'import_status')
@@ -0,0 +1,305 @@
+"""add content-addressed slide body store
+
+Revision ID: o5p6q7r8s9t0
+Revises: n4o5p6q7r8s9
+Create Date: 2026-10-19
+
+"""
+import hashlib
+import json
+from typing import Sequence, Union
+
+from alembic import op
+import orjson
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'o5p6q7r8s9t0'
+down_revision: Union[str, None] = 'n4o5p6q7r8s9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 1000
+
+# Frozen copies of models/slide_body.py, so hashes written here match the app's
+BODY_FIELDS = ('content', 'content_blocks', 'speaker_notes', 'style_overrides')
+EMPTY_BODY = {'content': [], 'content_blocks': None, 'speaker_notes': None, 'style_overrides': None}
+
+
+def _normalize(fields):
+    body = {key: fields.get(key) for key in BODY_FIELDS}
+    if body['content'] is None:
+        body['content'] = []
+    return body
+
+
+def _hash(body):
+    if body == EMPTY_BODY:
+        return None
+    return hashlib.sha256(orjson.dumps(body, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+
+def _store_bodies(conn, bodies):
+    if bodies:
+        conn.execute(
+            sa.text(
+                "INSERT INTO slide_bodies (hash, body) VALUES (:hash, CAST(:body AS jsonb)) "
+                "ON CONFLICT (hash) DO NOTHING"
+            ),
+            [{'hash': h, 'body': json.dumps(b)} for h, b in bodies.items()],
+        )
+
+
+def _move_row_bodies(conn, table, columns):
+    """Hash each row's body columns into slide_bodies and set body_hash, in id order batches"""
+    last_id = None
+    while True:
+        rows = conn.execute(
+            sa.text(
+                f"SELECT id, {', '.join(columns)} FROM {table} "
+                + ("WHERE id > :last_id " if last_id else "")
+                + "ORDER BY id LIMIT :limit"
+            ),
+            {'last_id': last_id, 'limit': BATCH_SIZE},
+        ).mappings().all()
+        if not rows:
+            return
+
+        bodies, ids, hashes = {}, [], []
+        for row in rows:
+            body = _normalize({column: row[column] for column in columns})
+            body_hash = _hash(body)
+            if body_hash is not None:
+                bodies[body_hash] = body
+                ids.append(str(row['id']))
+                hashes.append(body_hash)
+        _store_bodies(conn, bodies)
+        if ids:
+            conn.execute(
+                sa.text(
+                    f"UPDATE {table} t SET body_hash = v.body_hash "
+                    "FROM (SELECT unnest(CAST(:ids AS uuid[])) AS id, unnest(CAST(:hashes AS text[])) AS body_hash) v "
+                    "WHERE t.id = v.id"
+                ),
+                {'ids': ids, 'hashes': hashes},
+            )
+        last_id = rows[-1]['id']
+
+
+def _convert_snapshots(conn, to_hashes):
+    """Rewrite version snapshots between inline bodies and body_hash references"""
+    last_id = None
+    while True:
+        rows = conn.execute(
+            sa.text(
+                "SELECT id, snapshot FROM presentation_versions "
+                + ("WHERE id > :last_id " if last_id else "")
+                + "ORDER BY id LIMIT :limit"
+            ),
+            {'last_id': last_id, 'limit': BATCH_SIZE},
+        ).mappings().all()
+        if not rows:
+            return
+
+        bodies, updates = {}, []
+        for row in rows:
+            snapshot = row['snapshot']
+            slides = []
+            for slide in snapshot.get('slides', []):
+                slide = dict(slide)
+                if to_hashes and 'body_hash' not in slide:
+                    body = _normalize({key: slide.pop(key, None) for key in BODY_FIELDS})
+                    slide['body_hash'] = _hash(body)
+                    if slide['body_hash'] is not None:
+                        bodies[slide['body_hash']] = body
+                elif not to_hashes and 'body_hash' in slide:
+                    body_hash = slide.pop('body_hash')
+                    body = conn.execute(
+                        sa.text("SELECT body FROM slide_bodies WHERE hash = :hash"), {'hash': body_hash}
+                    ).scalar() if body_hash else None
+                    slide.update(_normalize(body or {}))
+                slides.append(slide)
+            updates.append({'id': row['id'], 'snapshot': json.dumps({**snapshot, 'slides': slides})})
+
+        _store_bodies(conn, bodies)
+        conn.execute(
+            sa.text("UPDATE presentation_versions SET snapshot = CAST(:snapshot AS jsonb) WHERE id = :id"),
+            updates,
+        )
+        last_id = rows[-1]['id']
+
+
+def upgrade() -> None:
+    op.create_table(
+        'slide_bodies',
+        sa.Column('hash', sa.String(length=64), nullable=False),
+        sa.Column('body', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column('ref_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('hash'),
+    )
+    # Garbage collection scans for unreferenced bodies
+    op.create_index(
+        'ix_slide_bodies_unreferenced', 'slide_bodies', ['created_at'],
+        postgresql_where=sa.text('ref_count <= 0'),
+    )
+
+    for table in ('slides', 'rough_draft_slides'):
+        op.add_column(table, sa.Column('body_hash', sa.String(length=64), nullable=True))
+        op.create_foreign_key(f'fk_{table}_body_hash', table, 'slide_bodies', ['body_hash'], ['hash'])
+        op.create_index(op.f(f'ix_{table}_body_hash'), table, ['body_hash'])
+
+    # Move existing bodies into the store before the triggers exist; the
+    # reference counts are computed once at the end instead
+    conn = op.get_bind()
+    _move_row_bodies(conn, 'slides', BODY_FIELDS)
+    _move_row_bodies(conn, 'rough_draft_slides', ('content', 'speaker_notes'))
+    _convert_snapshots(conn, to_hashes=True)
+
+    op.execute("""
+        UPDATE slide_bodies b SET ref_count = r.n
+        FROM (
+            SELECT body_hash, count(*) AS n FROM (
+                SELECT body_hash FROM slides
+                UNION ALL SELECT body_hash FROM rough_draft_slides
+                UNION ALL SELECT s->>'body_hash'
+                FROM presentation_versions v, jsonb_array_elements(v.snapshot->'slides') s
+            ) refs
+            WHERE body_hash IS NOT NULL
+            GROUP BY body_hash
+        ) r
+        WHERE b.hash = r.body_hash
+    """)
+
+    # Reference counting: one net-delta UPDATE per statement, so a bulk insert
+    # or a position-only update costs at most one pass over slide_bodies
+    op.execute("""
+        CREATE FUNCTION slide_body_refs_from_rows() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                UPDATE slide_bodies b SET ref_count = b.ref_count + d.n
+                FROM (SELECT body_hash, count(*) AS n FROM new_rows
+                      WHERE body_hash IS NOT NULL GROUP BY body_hash) d
+                WHERE b.hash = d.body_hash;
+            ELSIF TG_OP = 'DELETE' THEN
+                UPDATE slide_bodies b SET ref_count = b.ref_count - d.n
+                FROM (SELECT body_hash, count(*) AS n FROM old_rows
+                      WHERE body_hash IS NOT NULL GROUP BY body_hash) d
+                WHERE b.hash = d.body_hash;
+            ELSE
+                UPDATE slide_bodies b SET ref_count = b.ref_count + d.n
+                FROM (
+                    SELECT body_hash, sum(n) AS n FROM (
+                        SELECT body_hash, 1 AS n FROM new_rows
+                        UNION ALL SELECT body_hash, -1 FROM old_rows
+                    ) x
+                    WHERE body_hash IS NOT NULL
+                    GROUP BY body_hash HAVING sum(n) <> 0
+                ) d
+                WHERE b.hash = d.body_hash;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE FUNCTION slide_body_refs_from_snapshots() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                UPDATE slide_bodies b SET ref_count = b.ref_count + d.n
+                FROM (SELECT s->>'body_hash' AS body_hash, count(*) AS n
+                      FROM new_rows, jsonb_array_elements(new_rows.snapshot->'slides') s
+                      WHERE s->>'body_hash' IS NOT NULL GROUP BY 1) d
+                WHERE b.hash = d.body_hash;
+            ELSIF TG_OP = 'DELETE' THEN
+                UPDATE slide_bodies b SET ref_count = b.ref_count - d.n
+                FROM (SELECT s->>'body_hash' AS body_hash, count(*) AS n
+                      FROM old_rows, jsonb_array_elements(old_rows.snapshot->'slides') s
+                      WHERE s->>'body_hash' IS NOT NULL GROUP BY 1) d
+                WHERE b.hash = d.body_hash;
+            ELSE
+                UPDATE slide_bodies b SET ref_count = b.ref_count + d.n
+                FROM (
+                    SELECT body_hash, sum(n) AS n FROM (
+                        SELECT s->>'body_hash' AS body_hash, 1 AS n
+                        FROM new_rows, jsonb_array_elements(new_rows.snapshot->'slides') s
+                        UNION ALL
+                        SELECT s->>'body_hash', -1
+                        FROM old_rows, jsonb_array_elements(old_rows.snapshot->'slides') s
+                    ) x
+                    WHERE body_hash IS NOT NULL
+                    GROUP BY body_hash HAVING sum(n) <> 0
+                ) d
+                WHERE b.hash = d.body_hash;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    for table, function in (
+        ('slides', 'slide_body_refs_from_rows'),
+        ('rough_draft_slides', 'slide_body_refs_from_rows'),
+        ('presentation_versions', 'slide_body_refs_from_snapshots'),
+    ):
+        op.execute(f"""
+            CREATE TRIGGER {table}_body_refs_insert
+            AFTER INSERT ON {table} REFERENCING NEW TABLE AS new_rows
+            FOR EACH STATEMENT EXECUTE FUNCTION {function}()
+        """)
+        op.execute(f"""
+            CREATE TRIGGER {table}_body_refs_update
+            AFTER UPDATE ON {table} REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+            FOR EACH STATEMENT EXECUTE FUNCTION {function}()
+        """)
+        op.execute(f"""
+            CREATE TRIGGER {table}_body_refs_delete
+            AFTER DELETE ON {table} REFERENCING OLD TABLE AS old_rows
+            FOR EACH STATEMENT EXECUTE FUNCTION {function}()
+        """)
+
+    for column in BODY_FIELDS:
+        op.drop_column('slides', column)
+    op.drop_column('rough_draft_slides', 'content')
+    op.drop_column('rough_draft_slides', 'speaker_notes')
+
+
+def downgrade() -> None:
+    for table in ('slides', 'rough_draft_slides', 'presentation_versions'):
+        for suffix in ('insert', 'update', 'delete'):
+            op.execute(f"DROP TRIGGER IF EXISTS {table}_body_refs_{suffix} ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS slide_body_refs_from_snapshots()")
+    op.execute("DROP FUNCTION IF EXISTS slide_body_refs_from_rows()")
+
+    op.add_column('slides', sa.Column('content', postgresql.JSONB(astext_type=sa.Text()), nullable=True))
+    op.add_column('slides', sa.Column('content_blocks', postgresql.JSONB(astext_type=sa.Text()), nullable=True))
+    op.add_column('slides', sa.Column('speaker_notes', sa.Text(), nullable=True))
+    op.add_column('slides', sa.Column('style_overrides', postgresql.JSONB(astext_type=sa.Text()), nullable=True))
+    op.add_column('rough_draft_slides', sa.Column('content', postgresql.JSONB(astext_type=sa.Text()), nullable=True))
+    op.add_column('rough_draft_slides', sa.Column('speaker_notes', sa.Text(), nullable=True))
+
+    op.execute("""
+        UPDATE slides s SET
+            content = b.body->'content',
+            content_blocks = NULLIF(b.body->'content_blocks', 'null'::jsonb),
+            speaker_notes = b.body->>'speaker_notes',
+            style_overrides = NULLIF(b.body->'style_overrides', 'null'::jsonb)
+        FROM slide_bodies b WHERE s.body_hash = b.hash
+    """)
+    op.execute("UPDATE slides SET content = '[]'::jsonb WHERE body_hash IS NULL")
+    op.execute("""
+        UPDATE rough_draft_slides s SET
+            content = b.body->'content',
+            speaker_notes = b.body->>'speaker_notes'
+        FROM slide_bodies b WHERE s.body_hash = b.hash
+    """)
+    op.execute("UPDATE rough_draft_slides SET content = '[]'::jsonb WHERE body_hash IS NULL")
+    _convert_snapshots(op.get_bind(), to_hashes=False)
+
+    for table in ('slides', 'rough_draft_slides'):
+        op.drop_index(op.f(f'ix_{table}_body_hash'), table_name=table)
+        op.drop_constraint(f'fk_{table}_body_hash', table, type_='foreignkey')
+        op.drop_column(table, 'body_hash')
+    op.drop_index('ix_slide_bodies_unreferenced', table_name='slide_bodies')
+    op.drop_table('slide_bodies')
@@ -0,0 +1,112 @@
+"""add storage orphans for housekeeping
+
+Revision ID: p6q7r8s9t0u1
+Revises: o5p6q7r8s9t0
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'p6q7r8s9t0u1'
+down_revision: Union[str, None] = 'o5p6q7r8s9t0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'storage_orphans',
+        sa.Column('key', sa.String(length=500), nullable=False),
+        sa.Column('url', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('key'),
+    )
+    op.create_index(op.f('ix_storage_orphans_created_at'), 'storage_orphans', ['created_at'])
+
+    # Reference checks run before any object is deleted
+    op.create_index(op.f('ix_slides_image_storage_key'), 'slides', ['image_storage_key'])
+    op.create_index(
+        'ix_presentation_versions_snapshot', 'presentation_versions', ['snapshot'],
+        postgresql_using='gin', postgresql_ops={'snapshot': 'jsonb_path_ops'},
+    )
+
+    # Slide images: record the old key when a slide is deleted or its image replaced
+    op.execute("""
+        CREATE FUNCTION slides_record_storage_orphans() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'DELETE' THEN
+                INSERT INTO storage_orphans (key, url)
+                SELECT DISTINCT ON (o.image_storage_key) o.image_storage_key, o.image_url
+                FROM old_rows o
+                WHERE o.image_storage_key IS NOT NULL
+                ON CONFLICT (key) DO UPDATE SET created_at = now(), url = EXCLUDED.url;
+            ELSE
+                INSERT INTO storage_orphans (key, url)
+                SELECT DISTINCT ON (o.image_storage_key) o.image_storage_key, o.image_url
+                FROM old_rows o JOIN new_rows n ON n.id = o.id
+                WHERE o.image_storage_key IS NOT NULL
+                  AND n.image_storage_key IS DISTINCT FROM o.image_storage_key
+                ON CONFLICT (key) DO UPDATE SET created_at = now(), url = EXCLUDED.url;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER slides_storage_orphans_update
+        AFTER UPDATE ON slides REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION slides_record_storage_orphans()
+    """)
+    op.execute("""
+        CREATE TRIGGER slides_storage_orphans_delete
+        AFTER DELETE ON slides REFERENCING OLD TABLE AS old_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION slides_record_storage_orphans()
+    """)
+
+    # Generated thumbnails (content-addressed keys) replaced or deleted
+    op.execute(r"""
+        CREATE FUNCTION presentations_record_thumbnail_orphan() RETURNS trigger AS $$
+        DECLARE
+            thumbnail_key text;
+        BEGIN
+            thumbnail_key := substring(
+                OLD.thumbnail_url from 'presentations/[0-9a-f-]{36}/thumbnail-[0-9a-f]{16}\.(?\:webp|png)'
+            );
+            IF thumbnail_key IS NOT NULL THEN
+                INSERT INTO storage_orphans (key, url) VALUES (thumbnail_key, OLD.thumbnail_url)
+                ON CONFLICT (key) DO UPDATE SET created_at = now(), url = EXCLUDED.url;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER presentations_thumbnail_orphan_update
+        AFTER UPDATE OF thumbnail_url ON presentations
+        FOR EACH ROW WHEN (OLD.thumbnail_url IS DISTINCT FROM NEW.thumbnail_url)
+        EXECUTE FUNCTION presentations_record_thumbnail_orphan()
+    """)
+    op.execute("""
+        CREATE TRIGGER presentations_thumbnail_orphan_delete
+        AFTER DELETE ON presentations
+        FOR EACH ROW WHEN (OLD.thumbnail_url IS NOT NULL)
+        EXECUTE FUNCTION presentations_record_thumbnail_orphan()
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS presentations_thumbnail_orphan_delete ON presentations")
+    op.execute("DROP TRIGGER IF EXISTS presentations_thumbnail_orphan_update ON presentations")
+    op.execute("DROP FUNCTION IF EXISTS presentations_record_thumbnail_orphan()")
+    op.execute("DROP TRIGGER IF EXISTS slides_storage_orphans_delete ON slides")
+    op.execute("DROP TRIGGER IF EXISTS slides_storage_orphans_update ON slides")
+    op.execute("DROP FUNCTION IF EXISTS slides_record_storage_orphans()")
+    op.drop_index('ix_presentation_versions_snapshot', table_name='presentation_versions')
+    op.drop_index(op.f('ix_slides_image_storage_key'), table_name='slides')
+    op.drop_index(op.f('ix_storage_orphans_created_at'), table_name='storage_orphans')
+    op.drop_table('storage_orphans')
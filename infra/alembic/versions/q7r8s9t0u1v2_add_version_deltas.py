@@ -0,0 +1,163 @@
+"""add keyframe + delta version snapshots
+
+Revision ID: q7r8s9t0u1v2
+Revises: p6q7r8s9t0u1
+Create Date: 2026-10-19
+
+"""
+import copy
+import json
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'q7r8s9t0u1v2'
+down_revision: Union[str, None] = 'p6q7r8s9t0u1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Body hashes referenced by a snapshot: slides of a keyframe and slide
+# objects inside a delta's patch values both carry a body_hash key
+SNAPSHOT_BODY_HASHES = """
+    CREATE FUNCTION snapshot_body_hashes(snapshot jsonb) RETURNS SETOF text AS $$
+        SELECT h #>> '{}'
+        FROM jsonb_path_query(snapshot, 'strict $.** ? (exists(@.body_hash)).body_hash') h
+        WHERE h #>> '{}' IS NOT NULL
+    $$ LANGUAGE sql IMMUTABLE
+"""
+
+REFS_FROM_SNAPSHOTS = """
+    CREATE OR REPLACE FUNCTION slide_body_refs_from_snapshots() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP = 'INSERT' THEN
+            UPDATE slide_bodies b SET ref_count = b.ref_count + d.n
+            FROM (SELECT h AS body_hash, count(*) AS n
+                  FROM new_rows, snapshot_body_hashes(new_rows.snapshot) h GROUP BY 1) d
+            WHERE b.hash = d.body_hash;
+        ELSIF TG_OP = 'DELETE' THEN
+            UPDATE slide_bodies b SET ref_count = b.ref_count - d.n
+            FROM (SELECT h AS body_hash, count(*) AS n
+                  FROM old_rows, snapshot_body_hashes(old_rows.snapshot) h GROUP BY 1) d
+            WHERE b.hash = d.body_hash;
+        ELSE
+            UPDATE slide_bodies b SET ref_count = b.ref_count + d.n
+            FROM (
+                SELECT body_hash, sum(n) AS n FROM (
+                    SELECT h AS body_hash, 1 AS n FROM new_rows, snapshot_body_hashes(new_rows.snapshot) h
+                    UNION ALL
+                    SELECT h, -1 FROM old_rows, snapshot_body_hashes(old_rows.snapshot) h
+                ) x
+                GROUP BY body_hash HAVING sum(n) <> 0
+            ) d
+            WHERE b.hash = d.body_hash;
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+"""
+
+# As created by o5p6q7r8s9t0 (keyframe snapshots only)
+LEGACY_REFS_FROM_SNAPSHOTS = """
+    CREATE OR REPLACE FUNCTION slide_body_refs_from_snapshots() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP = 'INSERT' THEN
+            UPDATE slide_bodies b SET ref_count = b.ref_count + d.n
+            FROM (SELECT s->>'body_hash' AS body_hash, count(*) AS n
+                  FROM new_rows, jsonb_array_elements(new_rows.snapshot->'slides') s
+                  WHERE s->>'body_hash' IS NOT NULL GROUP BY 1) d
+            WHERE b.hash = d.body_hash;
+        ELSIF TG_OP = 'DELETE' THEN
+            UPDATE slide_bodies b SET ref_count = b.ref_count - d.n
+            FROM (SELECT s->>'body_hash' AS body_hash, count(*) AS n
+                  FROM old_rows, jsonb_array_elements(old_rows.snapshot->'slides') s
+                  WHERE s->>'body_hash' IS NOT NULL GROUP BY 1) d
+            WHERE b.hash = d.body_hash;
+        ELSE
+            UPDATE slide_bodies b SET ref_count = b.ref_count + d.n
+            FROM (
+                SELECT body_hash, sum(n) AS n FROM (
+                    SELECT s->>'body_hash' AS body_hash, 1 AS n
+                    FROM new_rows, jsonb_array_elements(new_rows.snapshot->'slides') s
+                    UNION ALL
+                    SELECT s->>'body_hash', -1
+                    FROM old_rows, jsonb_array_elements(old_rows.snapshot->'slides') s
+                ) x
+                WHERE body_hash IS NOT NULL
+                GROUP BY body_hash HAVING sum(n) <> 0
+            ) d
+            WHERE b.hash = d.body_hash;
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+"""
+
+
+def _apply_patch(snapshot, ops):
+    """Frozen copy of services/version_snapshots.apply_snapshot_patch"""
+    result = copy.deepcopy(snapshot)
+    for patch in ops:
+        *parents, last = [p.replace('~1', '/').replace('~0', '~') for p in patch['path'].split('/')[1:]]
+        target = result
+        for part in parents:
+            target = target[int(part)] if isinstance(target, list) else target[part]
+        if isinstance(target, list):
+            index = int(last)
+            if patch['op'] == 'add':
+                target.insert(index, patch['value'])
+            elif patch['op'] == 'remove':
+                del target[index]
+            else:
+                target[index] = patch['value']
+        elif patch['op'] == 'remove':
+            del target[last]
+        else:
+            target[last] = patch['value']
+    return result
+
+
+def upgrade() -> None:
+    op.add_column('presentation_versions', sa.Column('base_version_number', sa.Integer(), nullable=True))
+
+    # Existing snapshots are all keyframes, for which the new function finds
+    # exactly the hashes the old one did, so ref counts stay valid.
+    # Housekeeping re-encodes existing histories into delta chains.
+    op.execute(SNAPSHOT_BODY_HASHES)
+    op.execute(REFS_FROM_SNAPSHOTS)
+
+
+def downgrade() -> None:
+    # Materialize every delta while the trigger still understands both forms
+    conn = op.get_bind()
+    presentation_ids = conn.execute(sa.text(
+        "SELECT DISTINCT presentation_id FROM presentation_versions WHERE base_version_number IS NOT NULL"
+    )).scalars().all()
+    for presentation_id in presentation_ids:
+        rows = conn.execute(
+            sa.text(
+                "SELECT id, snapshot, base_version_number FROM presentation_versions "
+                "WHERE presentation_id = :id ORDER BY version_number"
+            ),
+            {'id': presentation_id},
+        ).mappings().all()
+        snapshot = None
+        updates = []
+        for row in rows:
+            if row['base_version_number'] is None:
+                snapshot = row['snapshot']
+            else:
+                snapshot = _apply_patch(snapshot, row['snapshot']['ops'])
+                updates.append({'id': row['id'], 'snapshot': json.dumps(snapshot)})
+        if updates:
+            conn.execute(
+                sa.text("UPDATE presentation_versions SET snapshot = CAST(:snapshot AS jsonb) WHERE id = :id"),
+                updates,
+            )
+
+    op.execute(LEGACY_REFS_FROM_SNAPSHOTS)
+    op.execute("DROP FUNCTION IF EXISTS snapshot_body_hashes(jsonb)")
+    op.drop_column('presentation_versions', 'base_version_number')
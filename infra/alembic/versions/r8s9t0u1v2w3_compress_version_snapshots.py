@@ -0,0 +1,40 @@
+"""compress version snapshots with lz4
+
+Revision ID: r8s9t0u1v2w3
+Revises: q7r8s9t0u1v2
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'r8s9t0u1v2w3'
+down_revision: Union[str, None] = 'q7r8s9t0u1v2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Snapshots stay JSONB (the GIN index and body ref-count trigger read
+    # them); lz4 TOAST compression (PostgreSQL 14+) is cheaper to decompress
+    # than the default pglz. Applies to values written from now on, including
+    # histories re-encoded by housekeeping. Servers built without lz4 keep
+    # the default (pglz).
+    op.execute("""
+        DO $$
+        BEGIN
+            IF 'lz4' = ANY (
+                SELECT unnest(enumvals) FROM pg_settings WHERE name = 'default_toast_compression'
+            ) THEN
+                ALTER TABLE presentation_versions ALTER COLUMN snapshot SET COMPRESSION lz4;
+            END IF;
+        END
+        $$
+    """)
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE presentation_versions ALTER COLUMN snapshot SET COMPRESSION default")
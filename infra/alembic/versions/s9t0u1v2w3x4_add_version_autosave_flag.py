@@ -0,0 +1,30 @@
+"""add autosave flag to presentation versions
+
+Revision ID: s9t0u1v2w3x4
+Revises: r8s9t0u1v2w3
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 's9t0u1v2w3x4'
+down_revision: Union[str, None] = 'r8s9t0u1v2w3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Constant default: no table rewrite on PostgreSQL 11+
+    op.add_column(
+        'presentation_versions',
+        sa.Column('autosave', sa.Boolean(), nullable=False, server_default='false'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('presentation_versions', 'autosave')
@@ -0,0 +1,31 @@
+"""add deck_version and content_hash to presentation versions
+
+Revision ID: t0u1v2w3x4y5
+Revises: s9t0u1v2w3x4
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 't0u1v2w3x4y5'
+down_revision: Union[str, None] = 's9t0u1v2w3x4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Nullable without defaults: metadata-only on existing rows. Older
+    # versions simply never match, so the first checkpoint after the
+    # upgrade is always written.
+    op.add_column('presentation_versions', sa.Column('deck_version', sa.Integer(), nullable=True))
+    op.add_column('presentation_versions', sa.Column('content_hash', sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('presentation_versions', 'content_hash')
+    op.drop_column('presentation_versions', 'deck_version')
@@ -0,0 +1,31 @@
+"""add rekeyframed_at to presentation versions
+
+Revision ID: u1v2w3x4y5z6
+Revises: t0u1v2w3x4y5
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'u1v2w3x4y5z6'
+down_revision: Union[str, None] = 't0u1v2w3x4y5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Nullable without a default: metadata-only. Existing histories are
+    # considered once by the next re-keyframing run and stamped then.
+    op.add_column(
+        'presentation_versions',
+        sa.Column('rekeyframed_at', sa.DateTime(timezone=True), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('presentation_versions', 'rekeyframed_at')
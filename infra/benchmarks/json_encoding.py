@@ -0,0 +1,133 @@
+"""
+JSON encoding benchmark
+Compares response/WebSocket encode paths on realistic decks from test-data/
+
+Usage:
+    poetry run python infra/benchmarks/json_encoding.py [--scale N] [--repeat N]
+
+Each deck in test-data/*.json is imported into PresentationDetailResponse
+and PresentationExport models (no database needed). --scale repeats the
+slides to emulate larger decks. Paths compared:
+
+- fastapi default: response_model re-validation + jsonable_encoder + json.dumps
+- orjson response: model_dump(mode="json") + orjson.dumps (ORJSONResponse)
+- model_dump_json: pydantic-core direct (model_json_response)
+- websocket dict: json.dumps vs orjson.dumps of the sync:state payload
+"""
+import argparse
+import json
+import sys
+import timeit
+import uuid
+from datetime import UTC, datetime
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(project_root))
+
+import orjson  # noqa: E402
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+
+from packages.common.schemas.presentation import (  # noqa: E402
+    PresentationDetailResponse,
+    PresentationExport,
+    PresentationImport,
+)
+from packages.common.services.presentation_mappers import slide_values_from_import  # noqa: E402
+
+TEST_DATA = project_root / "test-data"
+
+
+def build_models(path: Path, scale: int) -> tuple[PresentationDetailResponse, PresentationExport, dict]:
+    """Detail/export models and a WebSocket state dict for one deck file"""
+    raw = json.loads(path.read_text())
+    for slide in raw.get("slides", []):
+        # Frontend exports store layoutVariant as a number
+        if isinstance(slide.get("layoutVariant"), int):
+            slide["layoutVariant"] = str(slide["layoutVariant"])
+    data = PresentationImport.model_validate(raw)
+    data.slides = data.slides * scale
+
+    now = datetime.now(UTC)
+    presentation_id = uuid.uuid4()
+    slides = []
+    for i, slide_data in enumerate(data.slides):
+        values = slide_values_from_import(presentation_id, slide_data, i)
+        slides.append({**values, "id": uuid.uuid4(), "version": 1, "created_at": now, "updated_at": now})
+
+    detail = PresentationDetailResponse(
+        id=presentation_id,
+        owner_id=uuid.uuid4(),
+        topic=data.topic,
+        theme_id=data.themeId,
+        visual_style=data.visualStyle,
+        wabi_sabi_layout=data.wabiSabiLayout,
+        created_at=now,
+        updated_at=now,
+        slides=slides,
+    )
+    export = PresentationExport(
+        id=str(presentation_id),
+        topic=data.topic,
+        themeId=data.themeId,
+        visualStyle=data.visualStyle,
+        wabiSabiLayout=data.wabiSabiLayout,
+        slides=[slide.model_dump(mode="json") for slide in data.slides],
+        createdAt=now.isoformat(),
+        updatedAt=now.isoformat(),
+    )
+    state = {"type": "sync:state", "slides": jsonable_encoder(detail.slides), "version": 1}
+    return detail, export, state
+
+
+def fastapi_default(model) -> bytes:
+    """What FastAPI does for a returned model with response_model + JSONResponse"""
+    revalidated = type(model).model_validate(model.model_dump())
+    return json.dumps(
+        jsonable_encoder(revalidated), ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode()
+
+
+def orjson_response(model) -> bytes:
+    return orjson.dumps(model.model_dump(mode="json"))
+
+
+def direct(model) -> bytes:
+    return model.model_dump_json().encode()
+
+
+def bench(fn, arg, repeat: int) -> float:
+    """Best-of-5 mean milliseconds per call"""
+    return min(timeit.repeat(lambda: fn(arg), number=repeat, repeat=5)) / repeat * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", type=int, default=10, help="Repeat each deck's slides N times")
+    parser.add_argument("--repeat", type=int, default=50, help="Calls per timing sample")
+    args = parser.parse_args()
+
+    decks = sorted(TEST_DATA.glob("*.json"))
+    if not decks:
+        print(f"No decks found in {TEST_DATA}")
+        return
+
+    for path in decks:
+        detail, export, state = build_models(path, args.scale)
+        print(f"\n{path.name}: {len(detail.slides)} slides, {len(direct(detail)):,} bytes (detail)")
+        print(f"{'path':<22}{'detail ms':>12}{'export ms':>12}")
+        for name, fn in (
+            ("fastapi default", fastapi_default),
+            ("orjson response", orjson_response),
+            ("model_dump_json", direct),
+        ):
+            print(f"{name:<22}{bench(fn, detail, args.repeat):>12.3f}{bench(fn, export, args.repeat):>12.3f}")
+
+        stdlib_ms = bench(json.dumps, state, args.repeat)
+        orjson_ms = bench(orjson.dumps, state, args.repeat)
+        print(f"{'websocket sync:state':<22}json {stdlib_ms:.3f} ms  orjson {orjson_ms:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Slide column deferral benchmark
+Compares bytes read per request shape with and without load profiles
+
+Usage:
+    poetry run python infra/benchmarks/slide_column_bytes.py [presentation_id]
+
+Without an ID, the presentation with the most slides is used. "before"
+loads every Slide column (the pre-deferral behaviour); "after" uses the
+profile each request path now selects. Bytes are the JSON-encoded row
+payload summed server-side, a close proxy for what crosses the wire.
+"""
+import sys
+import uuid
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(project_root))
+
+from sqlalchemy import func, select, text  # noqa: E402
+from sqlalchemy.dialects import postgresql  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from packages.common.core.database import SessionLocal  # noqa: E402
+from packages.common.models.slide import Slide  # noqa: E402
+from packages.common.services.load_profiles import LoadProfile, slide_load_options  # noqa: E402
+
+# Request shape -> (profile used after deferral, single slide?)
+REQUEST_SHAPES = {
+    "sync: slide update/delete": (LoadProfile.SUMMARY, True),
+    "image: generate single": (LoadProfile.SUMMARY, True),
+    "image: batch status": (LoadProfile.IMAGES, False),
+    "presentation: detail/export": (LoadProfile.FULL, False),
+}
+
+
+def payload_bytes(db: Session, stmt) -> int:
+    """Sum of row_to_json() sizes for the columns an ORM statement selects"""
+    sql = stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+    wrapped = text(f"SELECT coalesce(sum(octet_length(row_to_json(r)::text)), 0) FROM ({sql}) AS r")
+    return int(db.execute(wrapped).scalar() or 0)
+
+
+def pick_presentation(db: Session) -> uuid.UUID | None:
+    """Presentation with the most slides"""
+    row = db.execute(
+        select(Slide.presentation_id)
+        .group_by(Slide.presentation_id)
+        .order_by(func.count(Slide.id).desc())
+        .limit(1)
+    ).first()
+    return row[0] if row else None
+
+
+def main() -> None:
+    with SessionLocal() as db:
+        presentation_id = uuid.UUID(sys.argv[1]) if len(sys.argv) > 1 else pick_presentation(db)
+        if presentation_id is None:
+            print("No slides found - seed some presentations first")
+            return
+
+        first_slide = db.execute(
+            select(Slide.id)
+            .where(Slide.presentation_id == presentation_id)
+            .order_by(Slide.position)
+            .limit(1)
+        ).scalar()
+
+        print(f"Presentation {presentation_id}")
+        print(f"{'request shape':<32}{'before':>12}{'after':>12}{'saved':>8}")
+
+        for name, (profile, single) in REQUEST_SHAPES.items():
+            base = select(Slide)
+            if single:
+                base = base.where(Slide.id == first_slide)
+            else:
+                base = base.where(Slide.presentation_id == presentation_id)
+
+            before = payload_bytes(db, base.options(*slide_load_options(LoadProfile.FULL)))
+            after = payload_bytes(db, base.options(*slide_load_options(profile)))
+            saved = (1 - after / before) * 100 if before else 0.0
+            print(f"{name:<32}{before:>12,}{after:>12,}{saved:>7.1f}%")
+
+
+if __name__ == "__main__":
+    main()
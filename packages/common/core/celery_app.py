@@ -3,6 +3,8 @@ Celery application configuration
 Follows SOLID-S principle: single responsibility (task queue)
 """
 from celery import Celery
+from celery.schedules import crontab
+from celery.signals import worker_process_init
 
 from packages.common.core.config import settings
 
@@ -38,11 +40,37 @@ celery_app.conf.update(
         "packages.common.tasks.analytics_task.*": {"queue": "analytics"},
         "packages.common.tasks.image_tasks.*": {"queue": "images"},
         "packages.common.tasks.beautify_tasks.*": {"queue": "default"},
+        "packages.common.tasks.housekeeping_tasks.*": {"queue": "default"},
+        "packages.common.tasks.autosave_task.*": {"queue": "default"},
+    },
+    # Periodic tasks (run `celery beat` alongside the workers)
+    beat_schedule={
+        "compact-storage": {
+            "task": "packages.common.tasks.housekeeping_tasks.compact_storage",
+            "schedule": crontab(minute=30, hour=3),
+        },
+        "cleanup-expired-beautify-sessions": {
+            "task": "packages.common.tasks.beautify_tasks.cleanup_expired_sessions",
+            "schedule": crontab(minute=0),
+        },
+        "cleanup-failed-documents": {
+            "task": "packages.common.tasks.document_tasks.cleanup_failed_documents",
+            "schedule": crontab(minute=15),
+        },
     },
     # Default queue
     task_default_queue="default",
 )
 
+
+@worker_process_init.connect
+def _reset_db_pools(**_kwargs) -> None:
+    """Forked worker children must not reuse connections opened by the parent"""
+    from packages.common.core.database import dispose_engines
+
+    dispose_engines()
+
+
 # Auto-discover tasks from packages
 celery_app.autodiscover_tasks(["packages.common.tasks"])
 
@@ -50,3 +78,7 @@ celery_app.autodiscover_tasks(["packages.common.tasks"])
 # This is needed when autodiscover doesn't work in certain environments
 import packages.common.tasks.image_tasks  # noqa: F401, E402
 import packages.common.tasks.beautify_tasks  # noqa: F401, E402
+import packages.common.tasks.thumbnail_task  # noqa: F401, E402
+import packages.common.tasks.document_tasks  # noqa: F401, E402
+import packages.common.tasks.housekeeping_tasks  # noqa: F401, E402
+import packages.common.tasks.autosave_task  # noqa: F401, E402
@@ -2,25 +2,112 @@
 Database configuration and session management
 Follows SOLID-D principle: depends on abstractions (SQLAlchemy engine)
 """
+import itertools
 from contextlib import contextmanager
-from typing import Generator
+from dataclasses import dataclass
+from typing import Any, Generator
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, make_url
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session, sessionmaker
 
 from packages.common.core.config import settings
+from packages.common.core.pool_metrics import TimedNullPool, TimedQueuePool, install_pool_metrics
 from packages.common.models.base import Base
 
+
+@dataclass(frozen=True)
+class PoolProfile:
+    """Connection pool shape for one process type"""
+
+    pool_size: int
+    max_overflow: int
+    pool_timeout: float
+    pre_ping: bool
+
+
+# Per-role defaults (DATABASE_ROLE). Sized so that scaling a role out adds a
+# predictable number of Postgres connections per process:
+# - api: concurrent sync endpoints share the threadpool; recycle handles stale
+#   connections on a busy pool, so no per-checkout ping round trip
+# - ws: handlers hold a session only around short sync writes
+# - worker: each prefork child runs one task at a time; idle gaps between
+#   tasks are long, so ping on checkout
+# - beat: schedules tasks and should never query
+POOL_PROFILES: dict[str, PoolProfile] = {
+    "api": PoolProfile(pool_size=5, max_overflow=10, pool_timeout=10, pre_ping=False),
+    "ws": PoolProfile(pool_size=2, max_overflow=3, pool_timeout=5, pre_ping=False),
+    "worker": PoolProfile(pool_size=1, max_overflow=1, pool_timeout=30, pre_ping=True),
+    "beat": PoolProfile(pool_size=1, max_overflow=0, pool_timeout=30, pre_ping=True),
+}
+
+
+# Driver options that disable server-side prepared statement caching
+# (psycopg2 never prepares statements, so it needs none)
+PGBOUNCER_CONNECT_ARGS: dict[str, dict[str, Any]] = {
+    "psycopg": {"prepare_threshold": None},
+    "asyncpg": {"statement_cache_size": 0, "prepared_statement_cache_size": 0},
+}
+
+
+def _pool_options(url: str) -> dict[str, Any]:
+    """create_engine() pool arguments for this process's role and settings"""
+    profile = POOL_PROFILES.get(settings.database_role)
+    if profile is None:
+        raise ValueError(
+            f"Unknown DATABASE_ROLE {settings.database_role!r}; expected one of {', '.join(POOL_PROFILES)}"
+        )
+
+    pre_ping = profile.pre_ping if settings.database_pool_pre_ping is None else settings.database_pool_pre_ping
+    null_pool = settings.database_null_pool
+    if null_pool is None:
+        null_pool = settings.database_pgbouncer_mode
+
+    options: dict[str, Any] = {"pool_recycle": 1800}
+    if settings.database_pgbouncer_mode:
+        # Transaction pooling hands each transaction a possibly different
+        # server connection: prepared statements must not outlive it, and
+        # PgBouncer already health-checks its server connections
+        pre_ping = False
+        options["connect_args"] = PGBOUNCER_CONNECT_ARGS.get(make_url(url).get_driver_name(), {})
+
+    if null_pool:
+        options["poolclass"] = TimedNullPool
+    else:
+        options.update(
+            poolclass=TimedQueuePool,
+            pool_size=profile.pool_size if settings.database_pool_size is None else settings.database_pool_size,
+            max_overflow=(
+                profile.max_overflow if settings.database_max_overflow is None else settings.database_max_overflow
+            ),
+            pool_timeout=profile.pool_timeout,
+        )
+    options["pool_pre_ping"] = pre_ping
+    return options
+
+
+def _create_engine(url: str, name: str) -> Engine:
+    """Create an engine with the role's pool configuration and pool metrics"""
+    new_engine = create_engine(
+        url,
+        echo=settings.database_echo,
+        pool_logging_name=name,
+        **_pool_options(url),
+    )
+    install_pool_metrics(new_engine, name)
+    return new_engine
+
+
 # Create database engine
 # Following KISS principle: simple connection pooling configuration
-engine = create_engine(
-    settings.get_database_url_str(),
-    pool_size=settings.database_pool_size,
-    max_overflow=settings.database_max_overflow,
-    echo=settings.database_echo,
-    pool_pre_ping=True,  # Verify connections before using
-    pool_recycle=3600,  # Recycle connections after 1 hour
-)
+engine = _create_engine(settings.get_database_url_str(), "primary")
+
+# Read replica engines (one pool per replica). Empty when no replicas are
+# configured, in which case read sessions fall back to the primary.
+replica_engines: list[Engine] = [
+    _create_engine(url, f"replica-{i}") for i, url in enumerate(settings.database_replica_urls)
+]
+_replica_cycle = itertools.cycle(replica_engines)
 
 # Create session factory
 # Following SOLID-S principle: SessionLocal has single responsibility (create sessions)
@@ -32,7 +119,18 @@ SessionLocal = sessionmaker(
 )
 
 # Re-export Base for backward compatibility
-__all__ = ["Base", "engine", "SessionLocal", "get_db", "get_db_context"]
+__all__ = [
+    "Base",
+    "engine",
+    "replica_engines",
+    "SessionLocal",
+    "get_db",
+    "get_db_context",
+    "get_read_engine",
+    "get_read_db",
+    "reads_from_primary",
+    "dispose_engines",
+]
 
 
 def get_db() -> Generator[Session, None, None]:
@@ -54,6 +152,41 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+def get_read_engine(primary: bool = False) -> Engine:
+    """
+    Pick the engine for a read-only session.
+
+    Replicas are used round-robin unless the caller asks for the primary
+    (the user wrote recently and a replica may lag behind, see
+    services/read_your_writes.py) or no replicas are configured.
+
+    Args:
+        primary: Read from the primary even if replicas are configured
+    """
+    if not replica_engines or primary:
+        return engine
+    return next(_replica_cycle)
+
+
+def get_read_db(primary: bool = False) -> Generator[Session, None, None]:
+    """
+    Session for read-only routes, bound to a replica when one is available.
+
+    Never write through this session: replicas reject writes, and even on the
+    primary fallback nothing here commits.
+    """
+    db = SessionLocal(bind=get_read_engine(primary))
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def reads_from_primary(db: Session) -> bool:
+    """Whether a session reads from the primary (not a possibly lagging replica)"""
+    return db.get_bind() is engine
+
+
 @contextmanager
 def get_db_context() -> Generator[Session, None, None]:
     """
@@ -77,6 +210,18 @@ def get_db_context() -> Generator[Session, None, None]:
         db.close()
 
 
+def dispose_engines() -> None:
+    """
+    Drop pooled connections inherited across fork().
+
+    Call in each forked worker process before it uses the database: the
+    parent's sockets must not be shared, and close=False leaves them open
+    for the parent.
+    """
+    for pooled_engine in (engine, *replica_engines):
+        pooled_engine.dispose(close=False)
+
+
 def create_tables() -> None:
     """
     Create all database tables
@@ -0,0 +1,149 @@
+"""
+Connection pool metrics
+Checkout wait and hold times per engine pool
+
+Pools are created with a logging name (the engine's name, e.g. "primary" or
+"replica-0") and metrics are keyed by it, so they survive pool recreation
+on engine.dispose().
+
+- Wait: time spent in pool.connect(), i.e. queueing for a free connection
+  (or opening one under NullPool), including any pre-ping
+- Hold: time between checkout and checkin (how long a request/task keeps it)
+- Timeouts: checkouts that gave up after pool_timeout
+"""
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import NullPool, QueuePool
+
+from packages.common.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PoolMetrics:
+    """Cumulative checkout statistics for one pool"""
+
+    checkouts: int = 0
+    timeouts: int = 0
+    total_wait_ms: float = 0.0
+    max_wait_ms: float = 0.0
+    checkins: int = 0
+    total_hold_ms: float = 0.0
+    max_hold_ms: float = 0.0
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def record_wait(self, wait_ms: float) -> None:
+        with self.lock:
+            self.checkouts += 1
+            self.total_wait_ms += wait_ms
+            self.max_wait_ms = max(self.max_wait_ms, wait_ms)
+
+    def record_timeout(self) -> None:
+        with self.lock:
+            self.timeouts += 1
+
+    def record_hold(self, hold_ms: float) -> None:
+        with self.lock:
+            self.checkins += 1
+            self.total_hold_ms += hold_ms
+            self.max_hold_ms = max(self.max_hold_ms, hold_ms)
+
+    def to_dict(self) -> dict[str, Any]:
+        with self.lock:
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "avg_wait_ms": round(self.total_wait_ms / self.checkouts, 2) if self.checkouts else 0.0,
+                "max_wait_ms": round(self.max_wait_ms, 2),
+                "avg_hold_ms": round(self.total_hold_ms / self.checkins, 2) if self.checkins else 0.0,
+                "max_hold_ms": round(self.max_hold_ms, 2),
+            }
+
+
+_metrics: dict[str, PoolMetrics] = {}
+_engines: dict[str, Engine] = {}
+_registry_lock = threading.Lock()
+
+
+def _metrics_for(name: str) -> PoolMetrics:
+    with _registry_lock:
+        return _metrics.setdefault(name, PoolMetrics())
+
+
+class _TimedCheckoutMixin:
+    """Times pool.connect(); the pool's logging_name selects the metrics bucket"""
+
+    def connect(self):
+        metrics = _metrics_for(self.logging_name or "default")
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except PoolTimeoutError:
+            metrics.record_timeout()
+            raise
+        wait_ms = (time.perf_counter() - started) * 1000
+        metrics.record_wait(wait_ms)
+        if wait_ms >= settings.database_slow_checkout_ms:
+            logger.warning(
+                f"Slow DB pool checkout on {self.logging_name}: {wait_ms:.0f}ms ({self.status()})",
+                extra={"pool": self.logging_name, "wait_ms": wait_ms},
+            )
+        return connection
+
+
+class TimedQueuePool(_TimedCheckoutMixin, QueuePool):
+    """QueuePool that records checkout wait times"""
+
+
+class TimedNullPool(_TimedCheckoutMixin, NullPool):
+    """NullPool that records connect times"""
+
+
+def _on_checkout(_dbapi_connection, connection_record, _connection_proxy) -> None:
+    connection_record.info["pool_checked_out_at"] = time.perf_counter()
+
+
+def install_pool_metrics(engine: Engine, name: str) -> None:
+    """Record hold times for an engine created with a Timed* pool class"""
+    with _registry_lock:
+        _engines[name] = engine
+
+    def on_checkin(_dbapi_connection, connection_record) -> None:
+        started = connection_record.info.pop("pool_checked_out_at", None)
+        if started is not None:
+            _metrics_for(name).record_hold((time.perf_counter() - started) * 1000)
+
+    event.listen(engine, "checkout", _on_checkout)
+    event.listen(engine, "checkin", on_checkin)
+
+
+def get_pool_stats() -> list[dict[str, Any]]:
+    """Current pool state and cumulative metrics for every instrumented engine"""
+    with _registry_lock:
+        engines = list(_engines.items())
+    stats = []
+    for name, engine in engines:
+        pool = engine.pool
+        entry: dict[str, Any] = {
+            "name": name,
+            "role": settings.database_role,
+            "pool_class": type(pool).__name__,
+            "status": pool.status(),
+        }
+        if isinstance(pool, QueuePool):
+            entry.update({
+                "size": pool.size(),
+                "checked_out": pool.checkedout(),
+                "overflow": pool.overflow(),
+            })
+        entry.update(_metrics_for(name).to_dict())
+        stats.append(entry)
+    return stats
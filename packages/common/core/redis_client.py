@@ -0,0 +1,27 @@
+"""
+Redis client
+Shared synchronous Redis connection pool for services and Celery tasks
+
+The WebSocket manager keeps its own asyncio clients for pub/sub; this module
+is for request-path and task-side key/value access (caches, progress).
+"""
+from functools import lru_cache
+
+import redis
+
+from packages.common.core.config import settings
+
+
+@lru_cache(maxsize=1)
+def get_redis() -> redis.Redis:
+    """
+    Process-wide Redis client (connection pool created on first use)
+
+    Returns raw bytes; callers decode what they need.
+    """
+    return redis.Redis.from_url(
+        settings.get_redis_url_str(),
+        max_connections=settings.redis_max_connections,
+        socket_timeout=1.0,
+        socket_connect_timeout=1.0,
+    )
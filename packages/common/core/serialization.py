@@ -0,0 +1,90 @@
+"""
+JSON serialization
+orjson-backed encoding shared by HTTP responses and WebSocket messages
+
+orjson encodes UUIDs, datetimes and dataclasses natively and is several
+times faster than the stdlib encoder on slide-heavy payloads (see
+infra/benchmarks/json_encoding.py).
+"""
+from collections.abc import AsyncIterator
+from typing import Any
+
+import orjson
+from fastapi.responses import Response
+from pydantic import BaseModel
+
+from packages.common.core.exceptions import ValidationError
+
+# Non-string keys (e.g. UUID-keyed dicts) are stringified like json.dumps does
+_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def dumps(obj: Any) -> bytes:
+    """Encode to JSON bytes"""
+    return orjson.dumps(obj, option=_OPTIONS)
+
+
+def dumps_str(obj: Any) -> str:
+    """Encode to a JSON string (for text WebSocket frames)"""
+    return orjson.dumps(obj, option=_OPTIONS).decode()
+
+
+def loads(data: bytes | str) -> Any:
+    """Decode JSON bytes or text"""
+    return orjson.loads(data)
+
+
+def _check_line_length(line: bytes, max_line_bytes: int) -> None:
+    if len(line) > max_line_bytes:
+        raise ValidationError(
+            message=f"NDJSON line exceeds {max_line_bytes} bytes",
+            field="body",
+        )
+
+
+async def iter_ndjson_lines(
+    chunks: AsyncIterator[bytes],
+    max_line_bytes: int,
+) -> AsyncIterator[bytes]:
+    """
+    Split a streamed request body into NDJSON lines.
+
+    Only one partial line is buffered at a time; blank lines are skipped.
+
+    Raises:
+        ValidationError: If a single line exceeds max_line_bytes
+    """
+    buffer = b""
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            # Complete lines are checked too: one chunk can hold a whole line
+            _check_line_length(line, max_line_bytes)
+            if line.strip():
+                yield line
+        _check_line_length(buffer, max_line_bytes)
+
+    if buffer.strip():
+        yield buffer
+
+
+def model_json_response(
+    model: BaseModel,
+    status_code: int = 200,
+    headers: dict[str, str] | None = None,
+) -> Response:
+    """
+    Response serialized straight from a Pydantic model.
+
+    model_dump_json runs in pydantic-core and skips FastAPI's response_model
+    re-validation and jsonable_encoder pass, which dominate encode time for
+    large decks and beautify sessions. Keep response_model on the route for
+    the OpenAPI schema.
+    """
+    return Response(
+        content=model.model_dump_json(by_alias=True),  # Match FastAPI response_model output
+        status_code=status_code,
+        media_type="application/json",
+        headers=headers,
+    )
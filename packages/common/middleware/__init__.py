@@ -4,8 +4,13 @@ Middleware Package
 ASGI middleware for cross-cutting concerns.
 """
 
+from packages.common.middleware.read_your_writes import ReadYourWritesMiddleware
 from packages.common.middleware.security import SecurityHeadersMiddleware
+from packages.common.middleware.sql_profiler import SQLProfilerMiddleware, install_sql_profiler
 
 __all__ = [
+    "ReadYourWritesMiddleware",
     "SecurityHeadersMiddleware",
+    "SQLProfilerMiddleware",
+    "install_sql_profiler",
 ]
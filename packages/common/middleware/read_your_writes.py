@@ -0,0 +1,40 @@
+"""
+Read-Your-Writes Middleware
+
+Pins a user's reads to the primary database for a short window after
+their own writes, so replica lag never hides a change they just made.
+
+- Any successful non-safe request (POST/PUT/PATCH/DELETE) with a valid
+  bearer token marks its user in Redis for DATABASE_READ_YOUR_WRITES_SECONDS
+  (see services/read_your_writes.py; WebSocket sync writes mark it too)
+- ReadDbSession routes to the primary while that marker exists and to a
+  replica afterwards
+- Only installed when DATABASE_REPLICA_URLS is configured
+"""
+
+from starlette.concurrency import run_in_threadpool
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import Response
+
+from packages.common.services.read_your_writes import mark_recent_write, user_id_from_token
+
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+class ReadYourWritesMiddleware(BaseHTTPMiddleware):
+    """
+    Middleware that marks the writing user after successful writes.
+    """
+
+    async def dispatch(self, request: Request, call_next) -> Response:
+        """Pin the user's reads to the primary when a write succeeds."""
+        response = await call_next(request)
+
+        if request.method not in SAFE_METHODS and response.status_code < 400:
+            scheme, _, token = request.headers.get("authorization", "").partition(" ")
+            user_id = user_id_from_token(token) if scheme.lower() == "bearer" else None
+            if user_id is not None:
+                await run_in_threadpool(mark_recent_write, user_id)
+
+        return response
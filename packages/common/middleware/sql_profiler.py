@@ -0,0 +1,185 @@
+"""
+SQL Profiler Middleware
+
+Opt-in per-request SQL statement profiling with N+1 detection.
+Enable with SQL_PROFILER_ENABLED=true (development only).
+
+- SQLAlchemy cursor events record statement count, DB time and a
+  fingerprint (statement text with parameters/IN-lists collapsed)
+- The middleware scopes a profile to each HTTP request and reports it via
+  the Server-Timing header
+- Identical SELECT fingerprints repeated past a threshold are flagged as
+  likely N+1 patterns and logged
+- Recent profiles are kept in memory for the /debug/sql-profiles endpoint
+"""
+
+import logging
+import re
+import threading
+import time
+from collections import Counter, deque
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import Response
+
+from packages.common.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_PARAM_RE = re.compile(r"%\(\w+\)s|\$\d+|\?")
+_PARAM_LIST_RE = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def fingerprint_statement(statement: str) -> str:
+    """Normalize a SQL statement so repeated executions share one fingerprint"""
+    normalized = _PARAM_RE.sub("?", statement)
+    normalized = _PARAM_LIST_RE.sub("(?)", normalized)
+    return _WHITESPACE_RE.sub(" ", normalized).strip()
+
+
+@dataclass
+class RequestQueryProfile:
+    """SQL activity recorded during a single request"""
+
+    method: str
+    path: str
+    statement_count: int = 0
+    total_db_ms: float = 0.0
+    fingerprints: Counter = field(default_factory=Counter)
+    started_at: float = field(default_factory=time.time)
+
+    def record(self, statement: str, elapsed_ms: float) -> None:
+        self.statement_count += 1
+        self.total_db_ms += elapsed_ms
+        self.fingerprints[fingerprint_statement(statement)] += 1
+
+    def n_plus_one_suspects(self, threshold: int) -> list[dict[str, Any]]:
+        """SELECT fingerprints executed at least `threshold` times"""
+        return [
+            {"statement": statement, "count": count}
+            for statement, count in self.fingerprints.most_common()
+            if count >= threshold and statement.upper().startswith("SELECT")
+        ]
+
+    def server_timing(self) -> str:
+        return f'db;dur={self.total_db_ms:.1f};desc="{self.statement_count} queries"'
+
+    def to_dict(self, threshold: int) -> dict[str, Any]:
+        return {
+            "method": self.method,
+            "path": self.path,
+            "started_at": self.started_at,
+            "statement_count": self.statement_count,
+            "total_db_ms": round(self.total_db_ms, 2),
+            "repeated_statements": [
+                {"statement": statement, "count": count}
+                for statement, count in self.fingerprints.most_common()
+                if count > 1
+            ],
+            "n_plus_one_suspects": self.n_plus_one_suspects(threshold),
+        }
+
+
+# Profile for the request currently being handled (None outside profiled requests).
+# Sync endpoints run in a threadpool that copies this context, so the same
+# mutable profile object is visible there.
+_current_profile: ContextVar[RequestQueryProfile | None] = ContextVar(
+    "sql_profiler_current_profile", default=None
+)
+
+# Recent request profiles for the debug endpoint
+_recent_profiles: deque[RequestQueryProfile] = deque(maxlen=100)
+
+_install_lock = threading.Lock()
+_installed_engines: set[int] = set()
+
+
+def _before_cursor_execute(_conn, _cursor, _statement, _parameters, context, _executemany) -> None:
+    # Kept on the execution context, so a statement that raises cannot leave
+    # a start time behind for a later statement to pick up
+    if context is not None:
+        context.sql_profiler_start = time.perf_counter()
+
+
+def _record(context, statement: str) -> None:
+    started = getattr(context, "sql_profiler_start", None)
+    profile = _current_profile.get()
+    if started is not None and profile is not None:
+        profile.record(statement, (time.perf_counter() - started) * 1000)
+
+
+def _after_cursor_execute(_conn, _cursor, statement, _parameters, context, _executemany) -> None:
+    _record(context, statement)
+
+
+def _handle_error(exception_context) -> None:
+    # Failed statements still cost a round trip
+    if exception_context.execution_context is not None and exception_context.statement is not None:
+        _record(exception_context.execution_context, exception_context.statement)
+
+
+def install_sql_profiler(engine: Engine) -> None:
+    """Attach the cursor event hooks to an engine (idempotent)"""
+    with _install_lock:
+        if id(engine) in _installed_engines:
+            return
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(engine, "handle_error", _handle_error)
+        _installed_engines.add(id(engine))
+
+
+def get_recent_profiles() -> list[dict[str, Any]]:
+    """Recent request profiles, newest first"""
+    threshold = settings.sql_profiler_n_plus_one_threshold
+    return [profile.to_dict(threshold) for profile in reversed(_recent_profiles)]
+
+
+class SQLProfilerMiddleware(BaseHTTPMiddleware):
+    """
+    Middleware that profiles SQL issued while handling each request.
+
+    Adds a Server-Timing header (visible in browser devtools) and logs a
+    warning when a request looks like an N+1 query pattern.
+    """
+
+    def __init__(self, app, n_plus_one_threshold: int | None = None):
+        """
+        Initialize SQL profiler middleware.
+
+        Args:
+            app: The ASGI application
+            n_plus_one_threshold: Repeat count that flags a SELECT as N+1
+        """
+        super().__init__(app)
+        self.n_plus_one_threshold = n_plus_one_threshold or settings.sql_profiler_n_plus_one_threshold
+
+    async def dispatch(self, request: Request, call_next) -> Response:
+        """Scope a query profile to the request and report it."""
+        profile = RequestQueryProfile(method=request.method, path=request.url.path)
+        token = _current_profile.set(profile)
+        try:
+            response = await call_next(request)
+        finally:
+            _current_profile.reset(token)
+
+        response.headers.append("Server-Timing", profile.server_timing())
+        response.headers["X-DB-Query-Count"] = str(profile.statement_count)
+
+        suspects = profile.n_plus_one_suspects(self.n_plus_one_threshold)
+        if suspects:
+            logger.warning(
+                f"Possible N+1 on {request.method} {request.url.path}: "
+                f"{suspects[0]['count']}x {suspects[0]['statement'][:200]}",
+                extra={"path": request.url.path, "statement_count": profile.statement_count},
+            )
+
+        _recent_profiles.append(profile)
+        return response
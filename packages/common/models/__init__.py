@@ -7,6 +7,7 @@ from packages.common.models.user import User, AuthProvider
 from packages.common.models.presentation import Presentation
 from packages.common.models.presentation_version import PresentationVersion
 from packages.common.models.slide import Slide
+from packages.common.models.slide_body import SlideBody
 from packages.common.models.ideation import (
     IdeationSession,
     IdeaNote,
@@ -17,6 +18,7 @@ from packages.common.models.ideation import (
 from packages.common.models.rough_draft import RoughDraft, RoughDraftSlide
 from packages.common.models.beautify import BeautifySession
 from packages.common.models.document import Document
+from packages.common.models.storage_orphan import StorageOrphan
 
 __all__ = [
     "Base",
@@ -26,6 +28,7 @@ __all__ = [
     "Presentation",
     "PresentationVersion",
     "Slide",
+    "SlideBody",
     "IdeationSession",
     "IdeaNote",
     "NoteConnection",
@@ -35,4 +38,5 @@ __all__ = [
     "RoughDraftSlide",
     "BeautifySession",
     "Document",
+    "StorageOrphan",
 ]
@@ -25,6 +25,11 @@ class BaseModel(Base):
 
     __abstract__ = True
 
+    # Fetch server-generated columns (created_at, updated_at, trigger-maintained
+    # counters) with RETURNING on INSERT and UPDATE, so objects stay complete
+    # after commit (expire_on_commit=False) without a refresh() round trip
+    __mapper_args__ = {"eager_defaults": True}
+
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
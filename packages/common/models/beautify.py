@@ -11,6 +11,9 @@ from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from packages.common.models.base import BaseModel
 
+# Deferred group for the (potentially multi-MB) slide payload columns
+BEAUTIFY_SLIDES_GROUP = "beautify_slides"
+
 
 class BeautifySession(BaseModel):
     """
@@ -69,6 +72,8 @@ class BeautifySession(BaseModel):
         JSONB,
         nullable=True,
         default=list,
+        deferred=True,
+        deferred_group=BEAUTIFY_SLIDES_GROUP,
     )
 
     # Transform configuration (set when user triggers transform)
@@ -83,6 +88,8 @@ class BeautifySession(BaseModel):
     transformed_slides: Mapped[dict | None] = mapped_column(
         JSONB,
         nullable=True,
+        deferred=True,
+        deferred_group=BEAUTIFY_SLIDES_GROUP,
     )
 
     # Sharing
@@ -5,7 +5,7 @@ Core model for user presentations
 import uuid
 from typing import Optional
 
-from sqlalchemy import String, Boolean, Text, ForeignKey, Integer
+from sqlalchemy import String, Boolean, Text, ForeignKey, Integer, FetchedValue
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -68,6 +68,27 @@ class Presentation(BaseModel):
         nullable=False,
     )
 
+    # Deck-level content version, bumped by database triggers on any change to
+    # the presentation row or its slides (see migration m3n4o5p6q7r8). Backs
+    # HTTP ETags and cache keys; never assign it from application code.
+    deck_version: Mapped[int] = mapped_column(
+        Integer,
+        server_default="1",
+        server_onupdate=FetchedValue(),
+        nullable=False,
+    )
+
+    # Streaming import state: "importing" while slides are still arriving,
+    # "failed" if the stream was rejected part-way, None once complete
+    import_status: Mapped[str | None] = mapped_column(
+        String(20),
+        nullable=True,
+    )
+    import_slide_count: Mapped[int | None] = mapped_column(
+        Integer,
+        nullable=True,
+    )
+
     # Source references (for traceability)
     ideation_session_id: Mapped[uuid.UUID | None] = mapped_column(
         ForeignKey("ideation_sessions.id", ondelete="SET NULL"),
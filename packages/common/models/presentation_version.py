@@ -3,8 +3,9 @@ Presentation Version Model
 Stores version history snapshots for presentations
 """
 import uuid
+from datetime import datetime
 
-from sqlalchemy import String, Integer, ForeignKey, UniqueConstraint
+from sqlalchemy import Boolean, DateTime, String, Integer, ForeignKey, Index, UniqueConstraint
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -14,7 +15,8 @@ from packages.common.models.base import BaseModel
 class PresentationVersion(BaseModel):
     """
     Version snapshot for a presentation.
-    Stores complete state at a point in time for manual checkpoints.
+    Stores the state at a point in time, in full or as a delta against the
+    previous version.
     """
 
     __tablename__ = "presentation_versions"
@@ -22,6 +24,13 @@ class PresentationVersion(BaseModel):
         UniqueConstraint(
             "presentation_id", "version_number", name="uq_presentation_version"
         ),
+        # Containment lookups (is a storage key/body still referenced?)
+        Index(
+            "ix_presentation_versions_snapshot",
+            "snapshot",
+            postgresql_using="gin",
+            postgresql_ops={"snapshot": "jsonb_path_ops"},
+        ),
     )
 
     # Foreign key to presentation
@@ -44,11 +53,48 @@ class PresentationVersion(BaseModel):
         String(500),
         nullable=True,
     )
+    # Taken by the autosave task rather than requested by a user
+    autosave: Mapped[bool] = mapped_column(
+        Boolean,
+        default=False,
+        server_default="false",
+        nullable=False,
+    )
 
-    # Full snapshot of presentation state (JSONB)
+    # Keyframes (base_version_number NULL) hold the full presentation state,
+    # with slides referencing their bodies by body_hash (see
+    # models/slide_body.py). Deltas hold {"ops": [...]}, a JSON Patch against
+    # version base_version_number; read through
+    # services/version_snapshots.load_snapshot, never directly.
+    # Deferred: history listings only need the metadata columns.
     snapshot: Mapped[dict] = mapped_column(
         JSONB,
         nullable=False,
+        deferred=True,
+    )
+    base_version_number: Mapped[int | None] = mapped_column(
+        Integer,
+        nullable=True,
+    )
+
+    # What the presentation looked like when this version was taken: its
+    # deck_version and the SHA-256 of the full snapshot. A checkpoint whose
+    # deck_version or content hash matches the latest version's is a no-op.
+    # NULL for versions taken before these were recorded.
+    deck_version: Mapped[int | None] = mapped_column(
+        Integer,
+        nullable=True,
+    )
+    content_hash: Mapped[str | None] = mapped_column(
+        String(64),
+        nullable=True,
+    )
+
+    # When re-keyframing last encoded this version (NULL: never). A history
+    # with no version updated since is skipped by later housekeeping runs.
+    rekeyframed_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
     )
 
     # Relationship
@@ -6,10 +6,14 @@ import uuid
 from typing import Optional
 
 from sqlalchemy import String, Integer, Text, ForeignKey
-from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from packages.common.models.base import BaseModel
+from packages.common.models.slide_body import SlideBodyMixin
+
+# Deferred group for large draft slide body columns
+ROUGH_DRAFT_SLIDE_BODY_GROUP = "rough_draft_slide_body"
 
 
 class RoughDraft(BaseModel):
@@ -75,10 +79,11 @@ class RoughDraft(BaseModel):
         return f"<RoughDraft {self.topic[:30]} ({self.status})>"
 
 
-class RoughDraftSlide(BaseModel):
+class RoughDraftSlide(SlideBodyMixin, BaseModel):
     """
     Rough draft slide model for individual slides in a rough draft.
     Similar to Slide but with approval tracking.
+    Body fields share the slide body store with Slide, so approval copies hashes.
     """
 
     __tablename__ = "rough_draft_slides"
@@ -102,15 +107,6 @@ class RoughDraftSlide(BaseModel):
         String(500),
         nullable=True,
     )
-    content: Mapped[dict | None] = mapped_column(
-        JSONB,
-        nullable=True,
-        default=list,
-    )
-    speaker_notes: Mapped[str | None] = mapped_column(
-        Text,
-        nullable=True,
-    )
 
     # Image generation
     image_prompt: Mapped[str | None] = mapped_column(
@@ -120,6 +116,8 @@ class RoughDraftSlide(BaseModel):
     image_url: Mapped[str | None] = mapped_column(
         Text,
         nullable=True,
+        deferred=True,
+        deferred_group=ROUGH_DRAFT_SLIDE_BODY_GROUP,
     )
 
     # Layout configuration
@@ -5,16 +5,22 @@ Individual slide within a presentation
 import uuid
 
 from sqlalchemy import String, Integer, Text, ForeignKey
-from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from packages.common.models.base import BaseModel
+from packages.common.models.slide_body import SlideBodyMixin
 
+# Deferred group for large slide columns kept on the row (see services/load_profiles.py)
+SLIDE_BODY_GROUP = "slide_body"
 
-class Slide(BaseModel):
+
+class Slide(SlideBodyMixin, BaseModel):
     """
     Slide model for individual slides in a presentation
     Maps to the frontend Slide interface
+
+    content, content_blocks, speaker_notes and style_overrides are stored
+    in the slide body store (see models/slide_body.py) via body_hash.
     """
 
     __tablename__ = "slides"
@@ -38,20 +44,6 @@ class Slide(BaseModel):
         String(500),
         nullable=True,
     )
-    content: Mapped[dict | None] = mapped_column(
-        JSONB,
-        nullable=True,
-        default=list,
-    )
-    # Rich content blocks (charts, statistics, quotes, etc.)
-    content_blocks: Mapped[dict | None] = mapped_column(
-        JSONB,
-        nullable=True,
-    )
-    speaker_notes: Mapped[str | None] = mapped_column(
-        Text,
-        nullable=True,
-    )
 
     # Image generation
     image_prompt: Mapped[str | None] = mapped_column(
@@ -61,6 +53,8 @@ class Slide(BaseModel):
     image_url: Mapped[str | None] = mapped_column(
         Text,  # Changed to Text for longer CDN URLs
         nullable=True,
+        deferred=True,
+        deferred_group=SLIDE_BODY_GROUP,
     )
     image_task_id: Mapped[str | None] = mapped_column(
         String(255),
@@ -70,6 +64,7 @@ class Slide(BaseModel):
     image_storage_key: Mapped[str | None] = mapped_column(
         String(500),
         nullable=True,
+        index=True,  # Reference checks before storage compaction
     )
 
     # Layout configuration
@@ -90,12 +85,6 @@ class Slide(BaseModel):
         nullable=True,
     )
 
-    # Style overrides (for custom styling)
-    style_overrides: Mapped[dict | None] = mapped_column(
-        JSONB,
-        nullable=True,
-    )
-
     # Version for optimistic concurrency control (real-time sync)
     version: Mapped[int] = mapped_column(
         Integer,
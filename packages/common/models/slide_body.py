@@ -0,0 +1,234 @@
+"""
+Slide Body Model
+Content-addressed, reference-counted store of slide bodies
+
+A slide body is the large, frequently duplicated part of a slide: content,
+content_blocks, speaker_notes and style_overrides. Slides, rough draft
+slides and version snapshots point at a body by its SHA-256 hash instead of
+each holding a copy, so duplicating a deck, approving a draft or taking a
+checkpoint writes hashes rather than JSONB.
+
+- Bodies are immutable; editing a slide stores (or reuses) the body for the
+  new value and repoints body_hash
+- ref_count is maintained by database triggers on slides,
+  rough_draft_slides and presentation_versions; bodies at zero are garbage
+  collected by housekeeping, never by request handlers
+- An empty body is stored as body_hash NULL, so blank slides never contend
+  on one shared row
+"""
+import copy
+import hashlib
+from datetime import datetime
+from typing import Any
+
+import orjson
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, event, func, text
+from sqlalchemy.dialects.postgresql import JSONB, insert
+from sqlalchemy.orm import (
+    Mapped,
+    Session,
+    declared_attr,
+    mapped_column,
+    object_session,
+    relationship,
+)
+
+from packages.common.models.base import Base
+
+# Slide fields that live in the body store, in canonical order
+SLIDE_BODY_FIELDS = ("content", "content_blocks", "speaker_notes", "style_overrides")
+
+EMPTY_SLIDE_BODY: dict[str, Any] = {
+    "content": [],
+    "content_blocks": None,
+    "speaker_notes": None,
+    "style_overrides": None,
+}
+
+
+def normalize_slide_body(fields: dict[str, Any]) -> dict[str, Any]:
+    """Canonical body dict: every body field present, missing content as []"""
+    body = {key: fields.get(key) for key in SLIDE_BODY_FIELDS}
+    if body["content"] is None:
+        body["content"] = []
+    return body
+
+
+def slide_body_hash(body: dict[str, Any]) -> str | None:
+    """SHA-256 of a normalized body (None for the empty body)"""
+    if body == EMPTY_SLIDE_BODY:
+        return None
+    return hashlib.sha256(orjson.dumps(body, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+
+class SlideBody(Base):
+    """Immutable slide body, addressed by the hash of its contents"""
+
+    __tablename__ = "slide_bodies"
+    __table_args__ = (
+        # Garbage collection scans for unreferenced bodies
+        Index("ix_slide_bodies_unreferenced", "created_at", postgresql_where=text("ref_count <= 0")),
+    )
+
+    hash: Mapped[str] = mapped_column(
+        String(64),
+        primary_key=True,
+    )
+    body: Mapped[dict] = mapped_column(
+        JSONB,
+        nullable=False,
+    )
+    # Maintained by triggers; never written from application code
+    ref_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        server_default="0",
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
+
+    @staticmethod
+    def store(db: Session, bodies: dict[str, dict[str, Any]]) -> None:
+        """
+        Insert bodies by hash in one statement, keeping ones already stored.
+
+        Existing rows are locked until the transaction ends (a no-op
+        DO UPDATE, which only writes rows at ref_count 0), so garbage
+        collection cannot delete an unreferenced body that this transaction
+        is about to reference. Rows are sorted by hash to lock in a fixed order.
+        """
+        if not bodies:
+            return
+        stmt = insert(SlideBody)
+        db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["hash"],
+                set_={"ref_count": SlideBody.ref_count},
+                where=SlideBody.ref_count <= 0,
+            ),
+            [{"hash": body_hash, "body": bodies[body_hash]} for body_hash in sorted(bodies)],
+        )
+
+    def __repr__(self) -> str:
+        return f"<SlideBody {self.hash[:12]} refs={self.ref_count}>"
+
+
+class SlideBodyMixin:
+    """
+    Body fields backed by the slide body store.
+
+    content/content_blocks/speaker_notes/style_overrides read and write like
+    plain attributes. Assigning one computes the new body's hash immediately;
+    the body row itself is inserted just before the owning row is flushed.
+    """
+
+    @declared_attr
+    def body_hash(cls) -> Mapped[str | None]:
+        return mapped_column(
+            String(64),
+            ForeignKey("slide_bodies.hash"),
+            nullable=True,
+            index=True,
+        )
+
+    @declared_attr
+    def body(cls) -> Mapped[SlideBody | None]:
+        # viewonly: body_hash is the source of truth, set by the properties
+        return relationship(SlideBody, viewonly=True, lazy="select")
+
+    def slide_body(self) -> dict[str, Any]:
+        """
+        The current body as a dict of SLIDE_BODY_FIELDS.
+
+        The dict belongs to this object: stored bodies are shared between
+        rows, so they are copied on load. Edit through the field setters;
+        in-place changes are not saved.
+        """
+        body_hash = self.body_hash
+        if body_hash is None:
+            return normalize_slide_body({})
+        cached = self.__dict__.get("_slide_body")
+        if cached is not None and cached[0] == body_hash:
+            return cached[1]
+
+        loaded = self.body
+        if loaded is None or loaded.hash != body_hash:
+            # body_hash was reassigned after the relationship was loaded
+            session = object_session(self)
+            loaded = session.get(SlideBody, body_hash) if session is not None else None
+        if loaded is None:
+            return normalize_slide_body({})
+        body = copy.deepcopy(loaded.body)
+        self.__dict__["_slide_body"] = (body_hash, body)
+        return body
+
+    def set_slide_body(self, body: dict[str, Any], stored: bool = False) -> None:
+        """
+        Point this row at body.
+
+        Args:
+            body: Body fields (missing fields are treated as empty)
+            stored: The body row is known to exist already (skip the insert)
+        """
+        body = normalize_slide_body(body)
+        body_hash = slide_body_hash(body)
+        self.__dict__["_slide_body"] = (body_hash, body)
+        if body_hash is not None and not stored:
+            self.__dict__["_slide_body_pending"] = True
+        else:
+            self.__dict__.pop("_slide_body_pending", None)
+        if self.__dict__.get("body_hash", ...) != body_hash:
+            self.body_hash = body_hash
+
+    def _set_body_field(self, key: str, value: Any) -> None:
+        self.set_slide_body({**self.slide_body(), key: value})
+
+    @property
+    def content(self) -> Any:
+        return self.slide_body()["content"]
+
+    @content.setter
+    def content(self, value: Any) -> None:
+        self._set_body_field("content", value)
+
+    @property
+    def content_blocks(self) -> Any:
+        return self.slide_body()["content_blocks"]
+
+    @content_blocks.setter
+    def content_blocks(self, value: Any) -> None:
+        self._set_body_field("content_blocks", value)
+
+    @property
+    def speaker_notes(self) -> str | None:
+        return self.slide_body()["speaker_notes"]
+
+    @speaker_notes.setter
+    def speaker_notes(self, value: str | None) -> None:
+        self._set_body_field("speaker_notes", value)
+
+    @property
+    def style_overrides(self) -> Any:
+        return self.slide_body()["style_overrides"]
+
+    @style_overrides.setter
+    def style_overrides(self, value: Any) -> None:
+        self._set_body_field("style_overrides", value)
+
+
+@event.listens_for(Session, "before_flush")
+def _store_pending_slide_bodies(session: Session, _flush_context, _instances) -> None:
+    """Insert bodies assigned since the last flush before the rows that reference them"""
+    pending: dict[str, dict[str, Any]] = {}
+    owners = []
+    for obj in (*session.new, *session.dirty):
+        if isinstance(obj, SlideBodyMixin) and obj.__dict__.get("_slide_body_pending"):
+            body_hash, body = obj.__dict__["_slide_body"]
+            pending[body_hash] = body
+            owners.append(obj)
+    SlideBody.store(session, pending)
+    for obj in owners:
+        obj.__dict__.pop("_slide_body_pending", None)
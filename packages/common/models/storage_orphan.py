@@ -0,0 +1,42 @@
+"""
+Storage Orphan Model
+Storage objects that may no longer be referenced, awaiting compaction
+
+Rows are written by database triggers when a slide's image or a
+presentation's generated thumbnail is replaced or deleted. Deletion from the
+storage provider is deferred to housekeeping because objects are shared by
+reference: duplicated decks point at the source deck's images, and version
+snapshots keep old image URLs restorable.
+"""
+from datetime import datetime
+
+from sqlalchemy import DateTime, String, Text, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from packages.common.models.base import Base
+
+
+class StorageOrphan(Base):
+    """A storage key whose last known reference went away"""
+
+    __tablename__ = "storage_orphans"
+
+    key: Mapped[str] = mapped_column(
+        String(500),
+        primary_key=True,
+    )
+    # URL the key was served under (matched against version snapshots)
+    url: Mapped[str | None] = mapped_column(
+        Text,
+        nullable=True,
+    )
+    # Refreshed every time the key is orphaned again
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+        index=True,
+    )
+
+    def __repr__(self) -> str:
+        return f"<StorageOrphan {self.key}>"
@@ -84,6 +84,21 @@ class ImageStorageProvider(ABC):
         """
         pass
 
+    def owns_url(self, url: str) -> bool:  # noqa: ARG002 - default owns nothing
+        """
+        Check if a URL points at an object in this provider's storage.
+
+        Server-side fetches of stored image URLs must check this first, so a
+        URL a user saved on a slide is never requested from inside the network.
+
+        Args:
+            url: Absolute URL
+
+        Returns:
+            True if the URL is served from this provider's public host
+        """
+        return False
+
     def generate_key(self, presentation_id: str, slide_index: int, extension: str = "png") -> str:
         """
         Generate a storage key for a slide image.
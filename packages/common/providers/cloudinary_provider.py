@@ -56,6 +56,10 @@ class CloudinaryProvider(ImageStorageProvider):
                 service_name="cloudinary",
             )
 
+    def owns_url(self, url: str) -> bool:
+        """Check if a URL is a delivery URL of this Cloudinary cloud."""
+        return url.startswith(f"https://res.cloudinary.com/{self.cloud_name}/")
+
     async def upload(
         self,
         key: str,
@@ -55,6 +55,10 @@ class S3Provider(ImageStorageProvider):
                 service_name="s3",
             )
 
+    def owns_url(self, url: str) -> bool:
+        """Check if a URL is an object URL in this bucket."""
+        return url.startswith(f"{self.base_url}/")
+
     async def upload(
         self,
         key: str,
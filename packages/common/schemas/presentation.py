@@ -89,6 +89,8 @@ class PresentationResponse(PresentationBase):
     id: uuid.UUID
     owner_id: uuid.UUID
     version: int = 1  # For optimistic concurrency control
+    import_status: str | None = None  # 'importing' / 'failed' during streaming import
+    import_slide_count: int | None = None  # Slides committed so far by a streaming import
     created_at: datetime
     updated_at: datetime
 
@@ -4,6 +4,7 @@ Pydantic models for version history requests and responses
 """
 import uuid
 from datetime import datetime
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field
 
@@ -20,6 +21,7 @@ class VersionResponse(BaseModel):
     id: uuid.UUID
     version_number: int
     label: str | None
+    autosave: bool = False
     thumbnail_url: str | None
     created_at: datetime
 
@@ -33,7 +35,46 @@ class VersionDetailResponse(VersionResponse):
 
 
 class VersionListResponse(BaseModel):
-    """List of versions"""
+    """Page of versions, newest first"""
 
     items: list[VersionResponse]
     total: int
+    next_before: int | None = None  # Pass as ?before= for the next page; None on the last page
+
+
+class FieldChange(BaseModel):
+    """A field's value in the older and the newer version"""
+
+    old: Any = None
+    new: Any = None
+
+
+class SlideDiff(BaseModel):
+    """
+    One slide that differs between two versions.
+
+    added slides list every field (old None); removed slides list none.
+    moved is set when the slide changed its order relative to the others,
+    not merely its position number because of an insert or delete.
+    """
+
+    status: Literal["added", "removed", "modified", "moved"]
+    slide_id: str | None = None  # None for slides from snapshots that predate slide ids
+    title: str | None = None
+    old_position: int | None = None
+    new_position: int | None = None
+    moved: bool = False
+    changes: dict[str, FieldChange] = Field(default_factory=dict)
+
+
+class VersionDiffResponse(BaseModel):
+    """Structural diff from one version to another; unchanged slides are omitted"""
+
+    from_version: int
+    to_version: int
+    presentation: dict[str, FieldChange] = Field(default_factory=dict)
+    slides: list[SlideDiff] = Field(default_factory=list)
+    added: int = 0
+    removed: int = 0
+    modified: int = 0
+    moved: int = 0
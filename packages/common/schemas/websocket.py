@@ -37,6 +37,9 @@ class MessageType(str, Enum):
     IMAGE_COMPLETED = "image:completed"
     IMAGE_FAILED = "image:failed"
 
+    # Version history events
+    VERSION_RESTORED = "version:restored"
+
 
 # ============ Base Message ============
 
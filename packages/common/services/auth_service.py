@@ -126,7 +126,6 @@ def register_user(db: Session, data: UserRegister) -> AuthResponse:
     )
     db.add(user)
     db.commit()
-    db.refresh(user)
 
     # Create tokens
     access_token, access_expires = create_token(user.id, ACCESS_TOKEN)
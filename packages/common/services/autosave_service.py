@@ -0,0 +1,155 @@
+"""
+Autosave Service
+Edit-activity tracking that drives automatic version checkpoints
+
+Every committed edit (presentation_changed) is counted in a small Redis
+hash per presentation; the checkpoint itself is taken by the autosave
+Celery task, never on the request path.
+
+- The first edit after a checkpoint queues one task (SET NX, like the
+  thumbnail debounce); later edits only bump the counters
+- The task checkpoints once the deck has been idle for
+  AUTOSAVE_IDLE_SECONDS, or AUTOSAVE_MAX_INTERVAL_SECONDS after the first
+  uncheckpointed edit, or after AUTOSAVE_MAX_EDITS edits, whichever comes
+  first; otherwise it re-queues itself for when the next condition is met
+- The last connection leaving a room flushes pending edits immediately
+"""
+import logging
+import math
+import time
+import uuid
+from dataclasses import dataclass
+
+import redis
+
+from packages.common.core.config import settings
+from packages.common.core.redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+AUTOSAVE_TASK_NAME = "packages.common.tasks.autosave_task.autosave_checkpoint"
+
+
+def _activity_key(presentation_id: uuid.UUID | str) -> str:
+    return f"autosave:{presentation_id}:activity"
+
+
+def _scheduled_key(presentation_id: uuid.UUID | str) -> str:
+    return f"autosave:{presentation_id}:scheduled"
+
+
+def _state_ttl() -> int:
+    """Upper bound on how long edit state or a scheduled flag may outlive a lost task"""
+    return settings.autosave_max_interval_seconds + settings.autosave_idle_seconds * 4
+
+
+@dataclass
+class EditActivity:
+    """Edits since the last checkpoint"""
+
+    edits: int
+    first_edit_at: float
+    last_edit_at: float
+
+    @classmethod
+    def from_hash(cls, fields: dict) -> "EditActivity | None":
+        if not fields:
+            return None
+        return cls(
+            edits=int(fields.get(b"edits", 0)),
+            first_edit_at=float(fields.get(b"first_edit_at", 0)),
+            last_edit_at=float(fields.get(b"last_edit_at", 0)),
+        )
+
+    def seconds_until_due(self, now: float) -> float:
+        """0 when a checkpoint is due, otherwise how long until one is"""
+        if self.edits >= settings.autosave_max_edits:
+            return 0.0
+        return max(0.0, min(
+            self.last_edit_at + settings.autosave_idle_seconds - now,
+            self.first_edit_at + settings.autosave_max_interval_seconds - now,
+        ))
+
+
+def _queue_checkpoint(presentation_id: uuid.UUID | str, countdown: float, force: bool = False) -> None:
+    # Imported here: the Celery app imports every task module on load
+    from packages.common.core.celery_app import celery_app
+
+    celery_app.send_task(
+        AUTOSAVE_TASK_NAME,
+        args=[str(presentation_id)],
+        kwargs={"force": force},
+        countdown=math.ceil(countdown),
+    )
+
+
+def record_edit(presentation_id: uuid.UUID | str) -> None:
+    """Count a committed edit and queue a checkpoint task if none is pending"""
+    if not settings.autosave_enabled:
+        return
+    now = time.time()
+    activity_key = _activity_key(presentation_id)
+    try:
+        with get_redis().pipeline() as pipe:
+            pipe.hincrby(activity_key, "edits", 1)
+            pipe.hsetnx(activity_key, "first_edit_at", now)
+            pipe.hset(activity_key, "last_edit_at", now)
+            pipe.expire(activity_key, _state_ttl())
+            pipe.set(_scheduled_key(presentation_id), 1, nx=True, ex=_state_ttl())
+            scheduled = pipe.execute()[-1]
+    except redis.RedisError as e:
+        logger.warning(f"Autosave tracking skipped for {presentation_id}: {e}")
+        return
+
+    if scheduled:
+        _queue_checkpoint(presentation_id, settings.autosave_idle_seconds)
+
+
+def flush_autosave(presentation_id: uuid.UUID | str) -> None:
+    """Checkpoint pending edits now (e.g. when the last editor leaves)"""
+    if not settings.autosave_enabled:
+        return
+    try:
+        pending = get_redis().exists(_activity_key(presentation_id))
+    except redis.RedisError as e:
+        logger.warning(f"Autosave flush skipped for {presentation_id}: {e}")
+        return
+    if pending:
+        _queue_checkpoint(presentation_id, 0, force=True)
+
+
+def peek_activity(presentation_id: uuid.UUID | str) -> EditActivity | None:
+    """Edits since the last checkpoint, without claiming them"""
+    return EditActivity.from_hash(get_redis().hgetall(_activity_key(presentation_id)))
+
+
+def claim_activity(presentation_id: uuid.UUID | str) -> EditActivity | None:
+    """
+    Atomically take the pending edits; edits recorded afterwards start a
+    new window for the next checkpoint.
+    """
+    with get_redis().pipeline() as pipe:
+        pipe.hgetall(_activity_key(presentation_id))
+        pipe.delete(_activity_key(presentation_id))
+        fields, _ = pipe.execute()
+    return EditActivity.from_hash(fields)
+
+
+def reschedule(presentation_id: uuid.UUID | str, countdown: float) -> None:
+    """Re-queue the pending checkpoint task, keeping this presentation's flag held"""
+    get_redis().expire(_scheduled_key(presentation_id), _state_ttl())
+    _queue_checkpoint(presentation_id, countdown)
+
+
+def release(presentation_id: uuid.UUID | str) -> None:
+    """
+    Give up the scheduled flag after a checkpoint. Edits that arrived while
+    the flag was still held could not queue a task themselves, so one is
+    queued for them here.
+    """
+    client = get_redis()
+    client.delete(_scheduled_key(presentation_id))
+    if client.exists(_activity_key(presentation_id)) and client.set(
+        _scheduled_key(presentation_id), 1, nx=True, ex=_state_ttl()
+    ):
+        _queue_checkpoint(presentation_id, settings.autosave_idle_seconds)
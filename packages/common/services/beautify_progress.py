@@ -0,0 +1,92 @@
+"""
+Beautify Progress
+Throttled live progress for PPTX processing, kept in Redis
+
+The session row is only written at phase boundaries (parsing, analyzing,
+ready, error). Per-slide progress in between goes to a short-lived Redis
+key, at most every BEAUTIFY_PROGRESS_INTERVAL_SECONDS, which the session
+endpoint overlays while the session is still processing.
+
+Redis errors only cost progress updates, never the processing itself.
+"""
+import json
+import logging
+import time
+import uuid
+
+import redis
+
+from packages.common.core.config import settings
+from packages.common.core.redis_client import get_redis
+from packages.common.models.beautify import BeautifySession
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "beautify-progress"
+
+# Outlives any single processing run; refreshed on every update
+PROGRESS_TTL_SECONDS = 3600
+
+# Session statuses during which the Redis progress is newer than the row
+PROCESSING_STATUSES = ("parsing", "analyzing")
+
+
+def _progress_key(session_id: uuid.UUID | str) -> str:
+    return f"{KEY_PREFIX}:{session_id}"
+
+
+class ProgressReporter:
+    """Publishes progress for one session, dropping updates that come too fast"""
+
+    def __init__(self, session_id: uuid.UUID | str, status: str):
+        self.session_id = session_id
+        self.status = status
+        self._last_progress: int | None = None
+        self._last_published = 0.0
+
+    def update(self, progress: int) -> None:
+        now = time.monotonic()
+        if progress == self._last_progress:
+            return
+        if now - self._last_published < settings.beautify_progress_interval_seconds:
+            return
+        self._last_progress = progress
+        self._last_published = now
+        try:
+            get_redis().set(
+                _progress_key(self.session_id),
+                json.dumps({"status": self.status, "progress": progress}),
+                ex=PROGRESS_TTL_SECONDS,
+            )
+        except redis.RedisError as e:
+            logger.warning(f"Beautify progress update skipped for {self.session_id}: {e}")
+
+
+def read_progress(session_id: uuid.UUID | str) -> tuple[str, int] | None:
+    """Latest published (status, progress), if any"""
+    try:
+        raw = get_redis().get(_progress_key(session_id))
+    except redis.RedisError as e:
+        logger.warning(f"Beautify progress unavailable for {session_id}: {e}")
+        return None
+    if raw is None:
+        return None
+    data = json.loads(raw)
+    return data["status"], data["progress"]
+
+
+def current_progress(session: BeautifySession) -> tuple[str, int]:
+    """(status, progress) of a session, including live progress while it is processing"""
+    if session.status in PROCESSING_STATUSES:
+        live = read_progress(session.id)
+        if live is not None and live[1] > session.progress:
+            return live
+    return session.status, session.progress
+
+
+def clear_progress(session_id: uuid.UUID | str) -> None:
+    """Drop live progress once the session row holds the final state"""
+    try:
+        get_redis().delete(_progress_key(session_id))
+    except redis.RedisError as e:
+        logger.warning(f"Beautify progress cleanup skipped for {session_id}: {e}")
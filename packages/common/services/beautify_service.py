@@ -3,23 +3,27 @@ Beautify Service
 Main orchestrator for PPTX beautification workflow
 KISS: Simple service functions following existing patterns
 """
+import asyncio
 import logging
 import uuid
 import secrets
 from typing import Any
 
+from pptx.presentation import Presentation as PptxPresentation
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 
 from packages.common.models.beautify import BeautifySession
+from packages.common.models.storage_orphan import StorageOrphan
 from packages.common.models.user import User
 from packages.common.core.exceptions import NotFoundError, AuthorizationError
-from packages.common.services.pptx_parser import parse_pptx
-from packages.common.services.slide_classifier import (
-    classify_slide,
-    get_suggested_layout,
-    get_suggested_alignment,
-)
-from packages.common.services.mess_analyzer import analyze_mess, calculate_overall_mess_score
+from packages.common.providers.provider_factory import get_image_storage_provider
+from packages.common.services.beautify_progress import ProgressReporter, clear_progress
+from packages.common.services.load_profiles import LoadProfile, beautify_session_load_options
+from packages.common.services.pptx_parser import image_data_url, image_parts, iter_pptx_slides, open_pptx
+from packages.common.services.mess_analyzer import average_mess_score
+from packages.common.services.slide_analysis import analyze_slides
 from packages.common.services.beautify_transform import transform_slides
 
 logger = logging.getLogger(__name__)
@@ -45,7 +49,6 @@ def create_session(
     )
     db.add(session)
     db.commit()
-    db.refresh(session)
     return session
 
 
@@ -53,11 +56,15 @@ def get_session(
     db: Session,
     session_id: uuid.UUID,
     user: User | None = None,
+    profile: LoadProfile = LoadProfile.SUMMARY,
 ) -> BeautifySession:
     """
     Get session with optional authorization check.
+    Use profile=LoadProfile.FULL to load slides_data/transformed_slides.
     """
-    session = db.query(BeautifySession).filter(
+    session = db.query(BeautifySession).options(
+        *beautify_session_load_options(profile)
+    ).filter(
         BeautifySession.id == session_id
     ).first()
 
@@ -108,74 +115,72 @@ def process_pptx_file(
     3. Analyze mess scores
     4. Build SlideIR list
 
+    Slides stream through these steps one at a time (see
+    iter_pptx_slides), so extracted raw slides are not all held at once.
+    The session row is written at phase boundaries only; per-slide
+    progress is published through beautify_progress.
+
     Returns list of SlideIR dicts.
     """
     # Update status: parsing
     update_session_status(db, session_id, "parsing", 10)
 
     try:
-        # Parse PPTX
-        raw_slides = parse_pptx(file_path)
-        total_slides = len(raw_slides)
+        # Open PPTX; slides are extracted lazily below
+        prs = open_pptx(file_path)
+        total_slides = len(prs.slides)
 
         if total_slides == 0:
             raise ValueError("No slides found in PPTX file")
 
         update_session_status(db, session_id, "analyzing", 30)
+        progress_reporter = ProgressReporter(session_id, "analyzing")
 
-        # Process each slide
+        # Extract, classify, score and build each slide as it is parsed
+        # (analysis runs in worker processes for large decks)
         slides_ir = []
-        for idx, raw_slide in enumerate(raw_slides):
-            # Classify slide
-            slide_type, confidence = classify_slide(raw_slide)
-
-            # Analyze mess
-            mess_score, mess_issues = analyze_mess(raw_slide)
-
-            # Get suggestions
-            suggested_layout = get_suggested_layout(slide_type)
-            suggested_alignment = get_suggested_alignment(slide_type)
-
-            # Extract title and content
-            title = extract_title(raw_slide)
-            content = extract_content(raw_slide)
-
-            # Get first image URL if exists
+        used_images: dict[str, dict[str, Any]] = {}
+        slide_images: list[tuple[dict[str, Any], str]] = []
+        raw_slides = iter_pptx_slides(prs)
+        for idx, (raw_slide, analysis) in enumerate(analyze_slides(raw_slides, total_slides)):
+            # Only the first image of a slide is shown; its bytes are stored below
             images = raw_slide.get("images", [])
-            image_url = images[0].get("data_url") if images else None
+            if images:
+                used_images.setdefault(images[0]["hash"], images[0])
 
             # Build SlideIR
             slide_ir = {
                 "id": str(uuid.uuid4()),
                 "position": idx,
-                "type": slide_type,
-                "typeConfidence": confidence,
-                "title": title,
-                "content": content,
+                **analysis,
                 "notes": raw_slide.get("notes", ""),
-                "imageUrl": image_url,
-                "messScore": mess_score,
-                "messIssues": mess_issues,
-                "suggestedLayout": suggested_layout,
-                "suggestedAlignment": suggested_alignment,
+                "imageUrl": None,
+                "imageKey": None,
                 "original": {
                     "texts": raw_slide.get("texts", []),
                     "images": [
-                        {"width": img.get("width"), "height": img.get("height")}
+                        {"width": img.get("width"), "height": img.get("height"), "hash": img.get("hash")}
                         for img in images
-                    ],  # Don't store full base64 in DB
+                    ],  # Image bytes live in storage, not in the DB
                     "notes": raw_slide.get("notes"),
                     "backgroundColor": raw_slide.get("background_color"),
                 },
             }
             slides_ir.append(slide_ir)
+            if images:
+                slide_images.append((slide_ir, images[0]["hash"]))
 
             # Update progress
-            progress = 30 + int((idx + 1) / total_slides * 60)
-            update_session_status(db, session_id, "analyzing", progress)
+            progress_reporter.update(30 + int((idx + 1) / total_slides * 60))
 
-        # Calculate overall mess score
-        overall_mess = calculate_overall_mess_score(raw_slides)
+        # Store each distinct shown image once, then point slides at it
+        stored_images = store_slide_images(session_id, prs, used_images)
+        for slide_ir, image_hash in slide_images:
+            if image_hash in stored_images:
+                slide_ir["imageUrl"], slide_ir["imageKey"] = stored_images[image_hash]
+
+        # Overall score from the per-slide scores computed above
+        overall_mess = average_mess_score([slide_ir["messScore"] for slide_ir in slides_ir])
 
         # Update session with results
         session = get_session(db, session_id)
@@ -184,15 +189,85 @@ def process_pptx_file(
         session.status = "ready"
         session.progress = 100
         db.commit()
+        clear_progress(session_id)
 
         return slides_ir
 
     except Exception as e:
         logger.error(f"Error processing PPTX: {e}")
         update_session_status(db, session_id, "error", 0, str(e))
+        clear_progress(session_id)
         raise
 
 
+def store_slide_images(
+    session_id: uuid.UUID,
+    prs: PptxPresentation,
+    images: dict[str, dict[str, Any]],
+) -> dict[str, tuple[str, str | None]]:
+    """
+    Upload image parts straight from the package, concurrently, keyed by
+    content hash under beautify/{session_id}/.
+
+    Without a configured storage provider, or if an upload fails, the image
+    is inlined as a data URL instead.
+
+    Returns:
+        hash -> (image URL, storage key or None for data URLs)
+    """
+    parts = image_parts(prs)
+    images = {image_hash: ref for image_hash, ref in images.items() if image_hash in parts}
+    stored: dict[str, tuple[str, str | None]] = {}
+    if not images:
+        return stored
+
+    try:
+        storage = get_image_storage_provider()
+    except ValueError as e:
+        logger.warning(f"No image storage configured, inlining beautify images: {e}")
+        storage = None
+
+    if storage is not None:
+        keys = {image_hash: f"beautify/{session_id}/{image_hash}.{ref['ext']}" for image_hash, ref in images.items()}
+
+        async def upload_all() -> list:
+            return await asyncio.gather(
+                *(
+                    storage.upload(keys[image_hash], parts[image_hash].blob, ref["content_type"])
+                    for image_hash, ref in images.items()
+                ),
+                return_exceptions=True,
+            )
+
+        for image_hash, result in zip(images, asyncio.run(upload_all()), strict=True):
+            if isinstance(result, Exception):
+                logger.warning(f"Failed to upload beautify image {keys[image_hash]}: {result}")
+            else:
+                stored[image_hash] = (result, keys[image_hash])
+
+    for image_hash in images.keys() - stored.keys():
+        stored[image_hash] = (image_data_url(parts[image_hash]), None)
+    return stored
+
+
+def release_session_images(db: Session, sessions: list[BeautifySession]) -> None:
+    """
+    Hand the sessions' stored images to storage housekeeping. Call before
+    deleting the sessions, in the same transaction.
+    """
+    keys = {
+        slide.get("imageKey")
+        for session in sessions
+        for slide in session.slides_data or []
+    } - {None}
+    if keys:
+        db.execute(
+            insert(StorageOrphan)
+            .values([{"key": key} for key in keys])
+            .on_conflict_do_update(index_elements=["key"], set_={"created_at": func.now()})
+        )
+
+
 def transform_session(
     db: Session,
     session_id: uuid.UUID,
@@ -203,7 +278,7 @@ def transform_session(
     """
     Transform session slides with selected style and intensity.
     """
-    session = get_session(db, session_id, user)
+    session = get_session(db, session_id, user, profile=LoadProfile.FULL)
 
     if session.status not in ["ready", "done"]:
         raise ValueError(f"Session not ready for transform. Status: {session.status}")
@@ -269,7 +344,9 @@ def get_share_data(
     """
     Get public share view data.
     """
-    session = db.query(BeautifySession).filter(
+    session = db.query(BeautifySession).options(
+        *beautify_session_load_options(LoadProfile.FULL)
+    ).filter(
         BeautifySession.share_id == share_id,
         BeautifySession.is_public == True,
     ).first()
@@ -290,46 +367,6 @@ def get_share_data(
     }
 
 
-def extract_title(raw_slide: dict[str, Any]) -> str:
-    """Extract title from raw slide data."""
-    texts = raw_slide.get("texts", [])
-
-    # Find text marked as title
-    for text in texts:
-        if text.get("is_title"):
-            return text.get("value", "").strip()
-
-    # Fall back to largest font
-    if texts:
-        largest = max(texts, key=lambda t: t.get("font_size", 0))
-        return largest.get("value", "").strip()[:200]  # Limit length
-
-    return "Untitled"
-
-
-def extract_content(raw_slide: dict[str, Any]) -> list[str]:
-    """Extract content bullets from raw slide data."""
-    texts = raw_slide.get("texts", [])
-    content = []
-
-    for text in texts:
-        if text.get("is_title"):
-            continue
-
-        value = text.get("value", "").strip()
-        if not value:
-            continue
-
-        # Split by newlines if present
-        if "\n" in value:
-            lines = [line.strip() for line in value.split("\n") if line.strip()]
-            content.extend(lines)
-        else:
-            content.append(value)
-
-    return content[:20]  # Limit to 20 items
-
-
 def delete_session(
     db: Session,
     session_id: uuid.UUID,
@@ -337,5 +374,6 @@ def delete_session(
 ) -> None:
     """Delete a beautify session."""
     session = get_session(db, session_id, user)
+    release_session_images(db, [session])
     db.delete(session)
     db.commit()
@@ -69,7 +69,6 @@ def create_document(
     )
     db.add(document)
     db.commit()
-    db.refresh(document)
     return document
 
 
@@ -173,7 +172,6 @@ def update_document(
         document.tags = tags
 
     db.commit()
-    db.refresh(document)
     return document
 
 
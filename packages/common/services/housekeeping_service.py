@@ -0,0 +1,339 @@
+"""
+Housekeeping Service
+Bounded-batch compaction of data no longer reachable from live rows
+
+Every stage works in batches of HOUSEKEEPING_BATCH_SIZE, commits once per
+batch and stops after HOUSEKEEPING_MAX_BATCHES, so one run has a bounded
+cost and never holds long transactions; leftovers go to the next run.
+Stages report StageStats through an optional progress callback.
+"""
+import asyncio
+import logging
+import re
+import uuid
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import delete, exists, func, or_, select, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from packages.common.core.config import settings
+from packages.common.models.presentation import Presentation
+from packages.common.models.presentation_version import PresentationVersion
+from packages.common.models.slide import Slide
+from packages.common.models.slide_body import SlideBody
+from packages.common.models.storage_orphan import StorageOrphan
+from packages.common.providers.base_provider import ImageStorageProvider
+from packages.common.services.version_snapshots import (
+    detach_dependents,
+    presentations_to_rekeyframe,
+    rekeyframe_presentation,
+)
+
+logger = logging.getLogger(__name__)
+
+# Tables whose churn housekeeping creates (or cleans up after)
+COMPACTED_TABLES = (
+    "slides",
+    "slide_bodies",
+    "presentation_versions",
+    "rough_draft_slides",
+    "beautify_sessions",
+    "storage_orphans",
+)
+
+_PRESENTATION_KEY_RE = re.compile(r"^presentations/([0-9a-f-]{36})/")
+
+
+@dataclass
+class StageStats:
+    """Progress counters for one housekeeping stage"""
+
+    examined: int = 0
+    deleted: int = 0
+    rewritten: int = 0
+    skipped: int = 0
+    failed: int = 0
+    batches: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        return asdict(self)
+
+
+ProgressCallback = Callable[[str, StageStats], None]
+
+
+def _hours_ago(hours: int) -> datetime:
+    return datetime.now(UTC) - timedelta(hours=hours)
+
+
+def _report(on_progress: ProgressCallback | None, stage: str, stats: StageStats) -> None:
+    if on_progress is not None:
+        on_progress(stage, stats)
+
+
+# Storage objects
+def _key_presentation_id(key: str) -> uuid.UUID | None:
+    match = _PRESENTATION_KEY_RE.match(key)
+    if not match:
+        return None
+    try:
+        return uuid.UUID(match.group(1))
+    except ValueError:
+        return None
+
+
+def _snapshot_references(slide_fields: dict) -> list:
+    """Snapshot containment checks for keyframes and delta patches"""
+    return [
+        exists().where(PresentationVersion.snapshot.contains({"slides": [slide_fields]})),
+        exists().where(PresentationVersion.snapshot.contains({"ops": [{"value": slide_fields}]})),
+    ]
+
+
+def _is_referenced(db: Session, orphan: StorageOrphan) -> bool:
+    """Whether any live slide, snapshot or thumbnail still points at the object"""
+    conditions = [
+        exists().where(Slide.image_storage_key == orphan.key),
+        *_snapshot_references({"image_storage_key": orphan.key}),
+    ]
+    if orphan.url:
+        # Snapshots taken before keys were recorded only carry the URL
+        conditions += _snapshot_references({"image_url": orphan.url})
+        presentation_id = _key_presentation_id(orphan.key)
+        if presentation_id is not None:
+            conditions += [
+                exists().where(Presentation.id == presentation_id, Presentation.thumbnail_url == orphan.url),
+                exists().where(
+                    PresentationVersion.presentation_id == presentation_id,
+                    PresentationVersion.thumbnail_url == orphan.url,
+                ),
+            ]
+    return bool(db.scalar(select(or_(*conditions))))
+
+
+def _has_image_in_flight(db: Session, key: str, cutoff: datetime) -> bool:
+    """An image task may be about to (re)write this key under its presentation"""
+    presentation_id = _key_presentation_id(key)
+    if presentation_id is None:
+        return False
+    return bool(db.scalar(select(exists().where(
+        Slide.presentation_id == presentation_id,
+        Slide.image_task_id.is_not(None),
+        Slide.updated_at > cutoff,
+    ))))
+
+
+async def _delete_objects(storage: ImageStorageProvider, keys: list[str]) -> list[bool]:
+    """Delete objects concurrently; True where the object is gone afterwards"""
+    results = await asyncio.gather(*(storage.delete(key) for key in keys), return_exceptions=True)
+    for key, result in zip(keys, results, strict=True):
+        if isinstance(result, Exception):
+            logger.warning(f"Failed to delete storage object {key}: {result}")
+    # delete() returns False for objects that were already missing
+    return [not isinstance(result, Exception) for result in results]
+
+
+def prune_storage_orphans(
+    db: Session,
+    storage: ImageStorageProvider,
+    on_progress: ProgressCallback | None = None,
+) -> StageStats:
+    """
+    Delete storage objects whose references went away more than
+    STORAGE_ORPHAN_GRACE_HOURS ago and are still unreferenced.
+
+    Orphan rows that turn out to be referenced again are dropped; rows whose
+    presentation has an image task in flight are kept for a later run.
+    """
+    stats = StageStats()
+    cutoff = _hours_ago(settings.storage_orphan_grace_hours)
+    last_key = ""
+
+    # One event loop for the whole stage rather than one per batch
+    with asyncio.Runner() as runner:
+        for _ in range(settings.housekeeping_max_batches):
+            orphans = db.scalars(
+                select(StorageOrphan)
+                .where(StorageOrphan.created_at < cutoff, StorageOrphan.key > last_key)
+                .order_by(StorageOrphan.key)
+                .limit(settings.housekeeping_batch_size)
+            ).all()
+            if not orphans:
+                break
+            last_key = orphans[-1].key
+            stats.batches += 1
+            stats.examined += len(orphans)
+
+            resolved: list[str] = []
+            deletable: list[str] = []
+            for orphan in orphans:
+                if _is_referenced(db, orphan):
+                    resolved.append(orphan.key)
+                    stats.skipped += 1
+                elif _has_image_in_flight(db, orphan.key, cutoff):
+                    stats.skipped += 1
+                else:
+                    deletable.append(orphan.key)
+
+            if deletable:
+                deleted = runner.run(_delete_objects(storage, deletable))
+                for key, gone in zip(deletable, deleted, strict=True):
+                    if gone:
+                        resolved.append(key)
+                        stats.deleted += 1
+                    else:
+                        stats.failed += 1
+
+            if resolved:
+                # created_at guard: a key orphaned again meanwhile restarts its grace period
+                db.execute(
+                    delete(StorageOrphan)
+                    .where(StorageOrphan.key.in_(resolved), StorageOrphan.created_at < cutoff)
+                    .execution_options(synchronize_session=False)
+                )
+            db.commit()
+            _report(on_progress, "storage_orphans", stats)
+
+    return stats
+
+
+# Version retention
+def prune_versions(db: Session, on_progress: ProgressCallback | None = None) -> StageStats:
+    """
+    Apply the version retention policy.
+
+    The newest VERSION_RETENTION_KEEP versions of each presentation and every
+    labeled version are kept; other versions older than
+    VERSION_RETENTION_DAYS are deleted.
+    """
+    stats = StageStats()
+    cutoff = datetime.now(UTC) - timedelta(days=settings.version_retention_days)
+    ranked = (
+        select(
+            PresentationVersion.id,
+            func.row_number()
+            .over(
+                partition_by=PresentationVersion.presentation_id,
+                order_by=PresentationVersion.version_number.desc(),
+            )
+            .label("rank"),
+        )
+        .where(PresentationVersion.label.is_(None))
+        .subquery()
+    )
+    # Labeled versions are excluded before ranking, so they never count
+    # towards (or push others out of) the kept window
+    expired = (
+        select(ranked.c.id, PresentationVersion.presentation_id, PresentationVersion.version_number)
+        .join(PresentationVersion, PresentationVersion.id == ranked.c.id)
+        .where(ranked.c.rank > settings.version_retention_keep, PresentationVersion.created_at < cutoff)
+        .limit(settings.housekeeping_batch_size)
+    )
+
+    for _ in range(settings.housekeeping_max_batches):
+        rows = db.execute(expired).all()
+        if not rows:
+            break
+        ids = [row.id for row in rows]
+        # Surviving deltas based on these versions become keyframes first
+        detach_dependents(db, rows)
+        db.execute(
+            delete(PresentationVersion)
+            .where(PresentationVersion.id.in_(ids))
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+        stats.batches += 1
+        stats.examined += len(ids)
+        stats.deleted += len(ids)
+        _report(on_progress, "versions", stats)
+
+    return stats
+
+
+def rekeyframe_versions(db: Session, on_progress: ProgressCallback | None = None) -> StageStats:
+    """
+    Re-encode version histories into VERSION_KEYFRAME_INTERVAL-long delta
+    chains: histories written before deltas existed, split up by deletions,
+    or left with long chains by a changed interval. One presentation per batch.
+    """
+    stats = StageStats()
+    presentation_ids = presentations_to_rekeyframe(db, settings.housekeeping_max_batches)
+    for presentation_id in presentation_ids:
+        try:
+            rewritten = rekeyframe_presentation(db, presentation_id)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.warning(f"Failed to re-keyframe versions of {presentation_id}: {e}")
+            stats.failed += 1
+        else:
+            stats.rewritten += rewritten
+        stats.batches += 1
+        stats.examined += 1
+        _report(on_progress, "rekeyframe", stats)
+
+    return stats
+
+
+# Slide bodies
+def prune_slide_bodies(db: Session, on_progress: ProgressCallback | None = None) -> StageStats:
+    """
+    Delete slide bodies with no references older than SLIDE_BODY_GC_GRACE_HOURS.
+
+    Rows being referenced concurrently are skipped rather than waited on,
+    and ref_count is re-checked under the row lock.
+    """
+    stats = StageStats()
+    cutoff = _hours_ago(settings.slide_body_gc_grace_hours)
+    unreferenced = (
+        select(SlideBody.hash)
+        .where(SlideBody.ref_count <= 0, SlideBody.created_at < cutoff)
+        .limit(settings.housekeeping_batch_size)
+        .with_for_update(skip_locked=True)
+    )
+
+    for _ in range(settings.housekeeping_max_batches):
+        deleted = db.scalars(
+            delete(SlideBody)
+            .where(SlideBody.hash.in_(unreferenced.scalar_subquery()), SlideBody.ref_count <= 0)
+            .returning(SlideBody.hash)
+            .execution_options(synchronize_session=False)
+        ).all()
+        db.commit()
+        if not deleted:
+            break
+        stats.batches += 1
+        stats.examined += len(deleted)
+        stats.deleted += len(deleted)
+        _report(on_progress, "slide_bodies", stats)
+
+    return stats
+
+
+# Vacuum
+def vacuum_tables(bind: Engine, tables: tuple[str, ...] = COMPACTED_TABLES) -> list[str]:
+    """
+    VACUUM (ANALYZE) tables with more than HOUSEKEEPING_VACUUM_DEAD_TUPLES dead tuples.
+
+    Plain VACUUM makes the space reusable without an exclusive lock, so
+    table size tracks live data instead of growing with churn.
+
+    Returns:
+        Tables that were vacuumed
+    """
+    with bind.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        dead_tuples = dict(conn.execute(
+            text("SELECT relname, n_dead_tup FROM pg_stat_user_tables WHERE relname = ANY(:tables)"),
+            {"tables": list(tables)},
+        ).all())
+        vacuumed = []
+        for table in tables:
+            if dead_tuples.get(table, 0) > settings.housekeeping_vacuum_dead_tuples:
+                # Identifiers come from COMPACTED_TABLES, never from input
+                conn.execute(text(f"VACUUM (ANALYZE) {table}"))
+                vacuumed.append(table)
+    return vacuumed
@@ -0,0 +1,59 @@
+"""
+HTTP Cache Service
+ETag and Cache-Control rules for presentation reads
+
+ETags are derived from Presentation.deck_version, which the database bumps
+on every change to the presentation row or any of its slides. Checking a
+conditional request therefore needs only the presentation row (one primary
+key lookup); slides are loaded only when the client's copy is stale.
+"""
+from packages.common.core.config import settings
+from packages.common.models.presentation import Presentation
+from packages.common.models.user import User
+from packages.common.services.presentation_cache import CachedPresentationMeta
+
+# Either a loaded row or its cached meta pointer
+PresentationLike = Presentation | CachedPresentationMeta
+
+# Cache-Control depends on who is asking, so shared caches must key on the caller
+PRESENTATION_VARY = "Authorization"
+
+
+def presentation_etag(presentation: PresentationLike, representation: str) -> str:
+    """
+    Strong ETag for one representation of a presentation.
+
+    Args:
+        presentation: Presentation row (slides need not be loaded) or cached meta
+        representation: Response shape, e.g. "detail" or "export"
+    """
+    return f'"{presentation.id}-{presentation.deck_version}-{representation}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Whether an If-None-Match header matches the current ETag (weak comparison)"""
+    if not if_none_match:
+        return False
+
+    if if_none_match.strip() == "*":
+        return True
+
+    return any(
+        candidate.strip().removeprefix("W/") == etag
+        for candidate in if_none_match.split(",")
+    )
+
+
+def presentation_cache_control(presentation: PresentationLike, user: User | None) -> str:
+    """
+    Cache-Control for a presentation response.
+
+    Public decks viewed by someone other than the owner may be cached by
+    shared caches for a short window. Owners (and private decks) always
+    revalidate, so edits are visible on the next request. Send with
+    Vary: PRESENTATION_VARY, so a shared cache never serves a viewer's
+    public copy to the owner.
+    """
+    if presentation.is_public and (user is None or presentation.owner_id != user.id):
+        return f"public, max-age={settings.public_presentation_max_age}, must-revalidate"
+    return "private, no-cache"
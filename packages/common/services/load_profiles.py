@@ -0,0 +1,77 @@
+"""
+Load Profiles
+Named column-loading strategies for slide-bearing models
+
+Large JSONB/Text columns on Slide, RoughDraftSlide and BeautifySession are
+deferred on the models (slide bodies live in the slide body store), so a
+plain query only reads ids, ordering, versions and layout fields. Callers
+that render full bodies pick a profile here to load exactly what the
+response needs, bodies included, in a fixed number of round trips.
+"""
+from enum import Enum
+from typing import Any
+
+from sqlalchemy.orm import selectinload, undefer, undefer_group
+
+from packages.common.models.beautify import BEAUTIFY_SLIDES_GROUP
+from packages.common.models.presentation import Presentation
+from packages.common.models.rough_draft import (
+    ROUGH_DRAFT_SLIDE_BODY_GROUP,
+    RoughDraft,
+    RoughDraftSlide,
+)
+from packages.common.models.slide import SLIDE_BODY_GROUP, Slide
+
+
+class LoadProfile(str, Enum):
+    """Which columns a query should load eagerly"""
+
+    SUMMARY = "summary"  # Metadata only: ids, position, version, layout, image task state
+    IMAGES = "images"  # Summary + image_url (image status/generation endpoints)
+    FULL = "full"  # Every column, including slide bodies
+
+
+def slide_load_options(profile: LoadProfile = LoadProfile.SUMMARY) -> list[Any]:
+    """Loader options for a query over Slide rows"""
+    if profile == LoadProfile.FULL:
+        return [undefer_group(SLIDE_BODY_GROUP), selectinload(Slide.body)]
+    if profile == LoadProfile.IMAGES:
+        return [undefer(Slide.image_url)]
+    return []
+
+
+def presentation_load_options(profile: LoadProfile = LoadProfile.SUMMARY) -> list[Any]:
+    """
+    Loader options for a query over Presentation rows.
+
+    SUMMARY leaves the slides relationship lazy; IMAGES and FULL load all
+    slides with a single SELECT ... IN query instead of one per slide, and
+    FULL loads their distinct bodies with one more.
+    """
+    if profile == LoadProfile.FULL:
+        return [
+            selectinload(Presentation.slides)
+            .undefer_group(SLIDE_BODY_GROUP)
+            .selectinload(Slide.body)
+        ]
+    if profile == LoadProfile.IMAGES:
+        return [selectinload(Presentation.slides).undefer(Slide.image_url)]
+    return []
+
+
+def rough_draft_load_options(profile: LoadProfile = LoadProfile.SUMMARY) -> list[Any]:
+    """Loader options for a query over RoughDraft rows"""
+    if profile == LoadProfile.SUMMARY:
+        return []
+    return [
+        selectinload(RoughDraft.slides)
+        .undefer_group(ROUGH_DRAFT_SLIDE_BODY_GROUP)
+        .selectinload(RoughDraftSlide.body)
+    ]
+
+
+def beautify_session_load_options(profile: LoadProfile = LoadProfile.SUMMARY) -> list[Any]:
+    """Loader options for a query over BeautifySession rows"""
+    if profile == LoadProfile.SUMMARY:
+        return []
+    return [undefer_group(BEAUTIFY_SLIDES_GROUP)]
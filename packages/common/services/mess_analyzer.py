@@ -183,13 +183,11 @@ def calculate_bullet_hell(texts: list[dict[str, Any]]) -> float:
 def calculate_overall_mess_score(slides_data: list[dict[str, Any]]) -> float:
     """
     Calculate overall mess score for all slides.
+    Use average_mess_score when per-slide scores are already known.
     """
-    if not slides_data:
-        return 0
+    return average_mess_score([analyze_mess(slide)[0] for slide in slides_data])
 
-    scores = []
-    for slide in slides_data:
-        score, _ = analyze_mess(slide)
-        scores.append(score)
 
+def average_mess_score(scores: list[float]) -> float:
+    """Overall mess score from per-slide scores."""
     return sum(scores) / len(scores) if scores else 0
@@ -4,32 +4,37 @@ Extracts slides from PowerPoint files using python-pptx
 KISS: Simple extraction logic with clear output structure
 """
 import base64
-import io
 import logging
+from collections.abc import Iterator
 from typing import Any
 
 from pptx import Presentation
-from pptx.util import Pt
 from pptx.enum.shapes import MSO_SHAPE_TYPE
+from pptx.parts.image import ImagePart
+from pptx.presentation import Presentation as PptxPresentation
 from pptx.shapes.base import BaseShape
 
 logger = logging.getLogger(__name__)
 
 
-def parse_pptx(file_path: str) -> list[dict[str, Any]]:
+def open_pptx(file_path: str) -> PptxPresentation:
+    """Open a PPTX package, raising ValueError if it cannot be read."""
+    try:
+        return Presentation(file_path)
+    except Exception as e:
+        logger.error(f"Error opening PPTX: {e}")
+        raise ValueError(f"Failed to parse PPTX file: {str(e)}") from e
+
+
+def iter_pptx_slides(prs: PptxPresentation) -> Iterator[dict[str, Any]]:
     """
-    Extract slides from PPTX file.
+    Extract slides one at a time.
 
-    Returns list of raw slide data:
-    - texts: [{value, font_size, font_family, is_bold, position}]
-    - images: [{data_url, width, height}]
-    - notes: speaker notes text
-    - background_color: hex color
+    Each raw slide is built only when requested, so a consumer that does
+    not keep them holds one slide's extracted data at a time. Yields the
+    same dicts as parse_pptx returns.
     """
     try:
-        prs = Presentation(file_path)
-        slides_data = []
-
         for slide_idx, slide in enumerate(prs.slides):
             slide_data = {
                 "position": slide_idx,
@@ -51,13 +56,26 @@ def parse_pptx(file_path: str) -> list[dict[str, Any]]:
                 if image_data:
                     slide_data["images"].append(image_data)
 
-            slides_data.append(slide_data)
-
-        return slides_data
+            yield slide_data
 
     except Exception as e:
         logger.error(f"Error parsing PPTX: {e}")
-        raise ValueError(f"Failed to parse PPTX file: {str(e)}")
+        raise ValueError(f"Failed to parse PPTX file: {str(e)}") from e
+
+
+def parse_pptx(file_path: str) -> list[dict[str, Any]]:
+    """
+    Extract slides from PPTX file.
+
+    Returns list of raw slide data:
+    - texts: [{value, font_size, font_family, is_bold, position}]
+    - images: [{hash, size, content_type, ext, width, height}]
+    - notes: speaker notes text
+    - background_color: hex color
+
+    Use open_pptx + iter_pptx_slides to process large decks slide by slide.
+    """
+    return list(iter_pptx_slides(open_pptx(file_path)))
 
 
 def extract_text_from_shape(shape: BaseShape) -> dict[str, Any] | None:
@@ -117,34 +135,52 @@ def extract_text_from_shape(shape: BaseShape) -> dict[str, Any] | None:
 
 
 def extract_image_from_shape(shape: BaseShape) -> dict[str, Any] | None:
-    """Extract image as base64 data URL."""
+    """
+    Reference a picture's image by content hash.
+
+    The image bytes stay in the package (see image_parts); nothing is
+    copied or encoded here.
+    """
     try:
         if shape.shape_type != MSO_SHAPE_TYPE.PICTURE:
             return None
 
         image = shape.image
-        image_bytes = image.blob
-        content_type = image.content_type
-
-        # Convert to base64 data URL
-        base64_data = base64.b64encode(image_bytes).decode("utf-8")
-        data_url = f"data:{content_type};base64,{base64_data}"
 
         # Get dimensions
         width = shape.width.pt if shape.width else 0
         height = shape.height.pt if shape.height else 0
 
         return {
-            "data_url": data_url,
+            "hash": image.sha1,
+            "size": len(image.blob),
+            "content_type": image.content_type,
+            "ext": image.ext,
             "width": width,
             "height": height,
-            "content_type": content_type,
         }
     except Exception as e:
         logger.warning(f"Could not extract image: {e}")
         return None
 
 
+def image_parts(prs: PptxPresentation) -> dict[str, ImagePart]:
+    """
+    Image parts of a package by content hash, for the images referenced by
+    extract_image_from_shape. Shared images appear once.
+    """
+    return {
+        part.sha1: part
+        for part in prs.part.package.iter_parts()
+        if isinstance(part, ImagePart)
+    }
+
+
+def image_data_url(part: ImagePart) -> str:
+    """Inline an image part as a base64 data URL."""
+    return f"data:{part.content_type};base64,{base64.b64encode(part.blob).decode('utf-8')}"
+
+
 def get_slide_notes(slide: Any) -> str:
     """Extract speaker notes from slide."""
     try:
@@ -0,0 +1,181 @@
+"""
+Presentation Cache
+Versioned read-through cache of serialized presentation responses in Redis
+
+Keys (all expire, so a volatile-lru Redis evicts them under memory pressure):
+- presentation-cache:{id}:meta -> deck_version, owner_id, is_public
+- presentation-cache:{id}:{deck_version}:{representation} -> response bytes
+- presentation-cache:{id}:generation -> bumped by every invalidation
+
+Bodies are keyed by deck_version, so a body built for an older deck is never
+served for a newer one; invalidating a presentation only has to drop its
+meta pointer. Readers note the generation before querying Postgres and only
+publish meta if it is unchanged, so a read racing a write cannot re-publish
+the pre-write version.
+
+Redis errors degrade to a cache miss and never fail a request or a write.
+"""
+import json
+import logging
+import uuid
+from dataclasses import dataclass
+
+import redis
+
+from packages.common.core.config import settings
+from packages.common.core.redis_client import get_redis
+from packages.common.models.presentation import Presentation
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "presentation-cache"
+
+# Response shapes that are cached per deck version
+REPRESENTATIONS = ("detail", "export")
+
+
+@dataclass(frozen=True)
+class CachedPresentationMeta:
+    """The parts of a presentation row needed to authorize and validate a cached read"""
+
+    id: uuid.UUID
+    owner_id: uuid.UUID
+    is_public: bool
+    deck_version: int
+
+    @classmethod
+    def from_presentation(cls, presentation: Presentation) -> "CachedPresentationMeta":
+        return cls(
+            id=presentation.id,
+            owner_id=presentation.owner_id,
+            is_public=presentation.is_public,
+            deck_version=presentation.deck_version,
+        )
+
+    def to_json(self) -> str:
+        return json.dumps({
+            "id": str(self.id),
+            "owner_id": str(self.owner_id),
+            "is_public": self.is_public,
+            "deck_version": self.deck_version,
+        })
+
+    @classmethod
+    def from_json(cls, raw: bytes | str) -> "CachedPresentationMeta":
+        data = json.loads(raw)
+        return cls(
+            id=uuid.UUID(data["id"]),
+            owner_id=uuid.UUID(data["owner_id"]),
+            is_public=data["is_public"],
+            deck_version=data["deck_version"],
+        )
+
+
+def _meta_key(presentation_id: uuid.UUID) -> str:
+    return f"{KEY_PREFIX}:{presentation_id}:meta"
+
+
+def _generation_key(presentation_id: uuid.UUID) -> str:
+    return f"{KEY_PREFIX}:{presentation_id}:generation"
+
+
+def _body_key(presentation_id: uuid.UUID, deck_version: int, representation: str) -> str:
+    return f"{KEY_PREFIX}:{presentation_id}:{deck_version}:{representation}"
+
+
+def get_generation(presentation_id: uuid.UUID) -> int | None:
+    """Current invalidation generation (None if caching is off or Redis is down)"""
+    if not settings.presentation_cache_enabled:
+        return None
+    try:
+        return int(get_redis().get(_generation_key(presentation_id)) or 0)
+    except redis.RedisError as e:
+        logger.warning(f"Presentation cache unavailable: {e}")
+        return None
+
+
+def get_meta(presentation_id: uuid.UUID) -> CachedPresentationMeta | None:
+    """Cached deck_version/access pointer, if present"""
+    if not settings.presentation_cache_enabled:
+        return None
+    try:
+        raw = get_redis().get(_meta_key(presentation_id))
+    except redis.RedisError as e:
+        logger.warning(f"Presentation cache unavailable: {e}")
+        return None
+    return CachedPresentationMeta.from_json(raw) if raw else None
+
+
+def store_meta(meta: CachedPresentationMeta, generation: int | None) -> None:
+    """
+    Publish the meta pointer unless the presentation was invalidated since
+    `generation` was read.
+    """
+    if generation is None:
+        return
+    generation_key = _generation_key(meta.id)
+    try:
+        with get_redis().pipeline() as pipe:
+            pipe.watch(generation_key)
+            if int(pipe.get(generation_key) or 0) != generation:
+                return
+            pipe.multi()
+            pipe.set(_meta_key(meta.id), meta.to_json(), ex=settings.presentation_cache_meta_ttl_seconds)
+            pipe.execute()
+    except redis.WatchError:
+        pass  # Invalidated while we were reading - leave it to the next reader
+    except redis.RedisError as e:
+        logger.warning(f"Presentation cache unavailable: {e}")
+
+
+def get_body(meta: CachedPresentationMeta, representation: str) -> bytes | None:
+    """Serialized response for this deck version, if cached"""
+    if not settings.presentation_cache_enabled:
+        return None
+    try:
+        return get_redis().get(_body_key(meta.id, meta.deck_version, representation))
+    except redis.RedisError as e:
+        logger.warning(f"Presentation cache unavailable: {e}")
+        return None
+
+
+def store_body(meta: CachedPresentationMeta, representation: str, body: bytes) -> None:
+    """Cache a serialized response for this deck version"""
+    if not settings.presentation_cache_enabled:
+        return
+    try:
+        get_redis().set(
+            _body_key(meta.id, meta.deck_version, representation),
+            body,
+            ex=settings.presentation_cache_ttl_seconds,
+        )
+    except redis.RedisError as e:
+        logger.warning(f"Presentation cache unavailable: {e}")
+
+
+def invalidate_presentation(presentation_id: uuid.UUID | str) -> None:
+    """
+    Drop cached responses for a presentation.
+
+    Call after the write has committed, so the next reader sees new data.
+    """
+    if not settings.presentation_cache_enabled:
+        return
+    presentation_id = uuid.UUID(str(presentation_id))
+    meta_key = _meta_key(presentation_id)
+    generation_key = _generation_key(presentation_id)
+    try:
+        client = get_redis()
+        raw = client.get(meta_key)
+        stale_keys = [meta_key]
+        if raw:
+            meta = CachedPresentationMeta.from_json(raw)
+            stale_keys += [_body_key(presentation_id, meta.deck_version, r) for r in REPRESENTATIONS]
+
+        pipe = client.pipeline()
+        pipe.incr(generation_key)
+        pipe.expire(generation_key, settings.presentation_cache_meta_ttl_seconds * 2)
+        pipe.delete(*stale_keys)
+        pipe.execute()
+    except redis.RedisError as e:
+        logger.warning(f"Presentation cache invalidation failed for {presentation_id}: {e}")
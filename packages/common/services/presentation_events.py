@@ -0,0 +1,20 @@
+"""
+Presentation Events
+Side effects of a committed change to a presentation or its slides
+
+Write paths call presentation_changed() after commit instead of wiring up
+each derived artifact (response cache, thumbnail, autosave) individually.
+"""
+import uuid
+
+from packages.common.services.autosave_service import record_edit
+from packages.common.services.presentation_cache import invalidate_presentation
+from packages.common.services.thumbnail_service import schedule_thumbnail
+
+
+def presentation_changed(presentation_id: uuid.UUID | str) -> None:
+    """Drop cached responses, queue a (debounced) thumbnail refresh and count the edit for autosave"""
+    invalidate_presentation(presentation_id)
+    schedule_thumbnail(presentation_id)
+    record_edit(presentation_id)
+
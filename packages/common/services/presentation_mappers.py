@@ -7,13 +7,28 @@ Centralized mapping functions for converting between:
 - Database models
 
 DRY: All field mappings defined once and reused.
+Also hosts the shared bulk persistence path (executemany + RETURNING).
 """
 
-from typing import Any
+from typing import Any, TypeVar
 from uuid import UUID
 
-from packages.common.models.slide import Slide
+from sqlalchemy import func, insert, inspect, literal, select
+from sqlalchemy.orm import Session, undefer_group
+from sqlalchemy.orm.attributes import set_committed_value
+
+from packages.common.models.base import Base
+from packages.common.models.presentation import Presentation
+from packages.common.models.rough_draft import RoughDraftSlide
+from packages.common.models.slide import SLIDE_BODY_GROUP, Slide
 from packages.common.schemas.presentation import SlideCreate, SlideImport
+from packages.common.services.slide_bodies import (
+    attach_slide_bodies,
+    load_slide_bodies,
+    stage_slide_bodies,
+)
+
+ModelT = TypeVar("ModelT", bound=Base)
 
 
 # Field mapping: frontend camelCase -> backend snake_case
@@ -43,6 +58,23 @@ FRONTEND_TO_DB_PRESENTATION = {
 
 DB_TO_FRONTEND_PRESENTATION = {v: k for k, v in FRONTEND_TO_DB_PRESENTATION.items()}
 
+# Slide columns copied verbatim when duplicating a deck.
+# Bodies are shared through body_hash, and image_url/image_storage_key by
+# reference (copy-on-write): the copy points at the same stored object until
+# its image is regenerated, which writes under the new presentation's key.
+SLIDE_COPY_FIELDS = (
+    "position",
+    "title",
+    "body_hash",
+    "image_prompt",
+    "image_url",
+    "image_storage_key",
+    "layout_type",
+    "alignment",
+    "font_scale",
+    "layout_variant",
+)
+
 
 def map_frontend_to_db(data: dict[str, Any], mapping: dict[str, str]) -> dict[str, Any]:
     """
@@ -72,6 +104,100 @@ def map_db_to_frontend(data: dict[str, Any], mapping: dict[str, str]) -> dict[st
     return {mapping.get(k, k): v for k, v in data.items()}
 
 
+def slide_values_from_data(
+    presentation_id: UUID,
+    slide_data: SlideCreate,
+    position: int,
+) -> dict[str, Any]:
+    """
+    Build Slide column values from SlideCreate schema.
+
+    Args:
+        presentation_id: UUID of the parent presentation
+        slide_data: Slide data from schema
+        position: Position index of the slide
+
+    Returns:
+        Dictionary of Slide attribute values
+    """
+    return {
+        "presentation_id": presentation_id,
+        "position": slide_data.position if slide_data.position is not None else position,
+        "title": slide_data.title,
+        "content": slide_data.content,
+        "content_blocks": slide_data.content_blocks,
+        "speaker_notes": slide_data.speaker_notes,
+        "image_prompt": slide_data.image_prompt,
+        "image_url": slide_data.image_url,
+        "layout_type": slide_data.layout_type,
+        "alignment": slide_data.alignment,
+        "font_scale": slide_data.font_scale,
+        "layout_variant": slide_data.layout_variant,
+        "style_overrides": slide_data.style_overrides,
+    }
+
+
+def slide_values_from_import(
+    presentation_id: UUID,
+    slide_data: SlideImport,
+    position: int,
+) -> dict[str, Any]:
+    """
+    Build Slide column values from SlideImport schema (camelCase frontend format).
+
+    Args:
+        presentation_id: UUID of the parent presentation
+        slide_data: Slide data from import schema
+        position: Position index of the slide
+
+    Returns:
+        Dictionary of Slide attribute values
+    """
+    return {
+        "presentation_id": presentation_id,
+        "position": position,
+        "title": slide_data.title,
+        "content": slide_data.content,
+        "content_blocks": slide_data.contentBlocks,
+        "speaker_notes": slide_data.speakerNotes,
+        "image_prompt": slide_data.imagePrompt,
+        "image_url": slide_data.imageUrl,
+        "layout_type": slide_data.layoutType,
+        "alignment": slide_data.alignment,
+        "font_scale": slide_data.fontScale,
+        "layout_variant": slide_data.layoutVariant,
+        "style_overrides": slide_data.styleOverrides,
+    }
+
+
+def slide_values_from_draft(
+    presentation_id: UUID,
+    draft_slide: RoughDraftSlide,
+) -> dict[str, Any]:
+    """
+    Build Slide column values from an approved rough draft slide.
+
+    The body is shared by hash rather than copied.
+
+    Args:
+        presentation_id: UUID of the new presentation
+        draft_slide: Rough draft slide to promote
+
+    Returns:
+        Dictionary of Slide attribute values
+    """
+    return {
+        "presentation_id": presentation_id,
+        "position": draft_slide.position,
+        "title": draft_slide.title,
+        "body_hash": draft_slide.body_hash,
+        "image_prompt": draft_slide.image_prompt,
+        "image_url": draft_slide.image_url,
+        "layout_type": draft_slide.layout_type,
+        "alignment": draft_slide.alignment,
+    }
+
+
 def create_slide_from_data(
     presentation_id: UUID,
     slide_data: SlideCreate,
@@ -90,21 +216,7 @@ def create_slide_from_data(
     Returns:
         Slide model (not yet added to session)
     """
-    return Slide(
-        presentation_id=presentation_id,
-        position=slide_data.position if slide_data.position is not None else position,
-        title=slide_data.title,
-        content=slide_data.content,
-        content_blocks=slide_data.content_blocks,
-        speaker_notes=slide_data.speaker_notes,
-        image_prompt=slide_data.image_prompt,
-        image_url=slide_data.image_url,
-        layout_type=slide_data.layout_type,
-        alignment=slide_data.alignment,
-        font_scale=slide_data.font_scale,
-        layout_variant=slide_data.layout_variant,
-        style_overrides=slide_data.style_overrides,
-    )
+    return Slide(**slide_values_from_data(presentation_id, slide_data, position))
 
 
 def create_slide_from_import(
@@ -123,53 +235,118 @@ def create_slide_from_import(
     Returns:
         Slide model (not yet added to session)
     """
-    return Slide(
-        presentation_id=presentation_id,
-        position=position,
-        title=slide_data.title,
-        content=slide_data.content,
-        content_blocks=slide_data.contentBlocks,
-        speaker_notes=slide_data.speakerNotes,
-        image_prompt=slide_data.imagePrompt,
-        image_url=slide_data.imageUrl,
-        layout_type=slide_data.layoutType,
-        alignment=slide_data.alignment,
-        font_scale=slide_data.fontScale,
-        layout_variant=slide_data.layoutVariant,
-        style_overrides=slide_data.styleOverrides,
-    )
+    return Slide(**slide_values_from_import(presentation_id, slide_data, position))
 
 
-def duplicate_slide(
-    presentation_id: UUID,
-    source_slide: Slide,
-) -> Slide:
+def bulk_insert(
+    db: Session,
+    model: type[ModelT],
+    rows: list[dict[str, Any]],
+) -> list[ModelT]:
     """
-    Create a copy of an existing slide for a new presentation.
+    Insert many rows with one executemany INSERT ... RETURNING.
+
+    Server-generated columns (created_at, updated_at) come back in the same
+    round trip, so no follow-up SELECT is needed. Deferred columns are not
+    echoed back by the database; they are populated from the values sent,
+    or as NULL when a row leaves them out, so reading them never lazy-loads.
 
     Args:
-        presentation_id: UUID of the new presentation
-        source_slide: Source slide to copy
+        db: Database session (parent rows must already be flushed)
+        model: Mapped class to insert into
+        rows: Attribute values, one dict per row
 
     Returns:
-        New Slide model (not yet added to session)
-    """
-    return Slide(
-        presentation_id=presentation_id,
-        position=source_slide.position,
-        title=source_slide.title,
-        content=source_slide.content,
-        content_blocks=source_slide.content_blocks,
-        speaker_notes=source_slide.speaker_notes,
-        image_prompt=source_slide.image_prompt,
-        image_url=source_slide.image_url,
-        layout_type=source_slide.layout_type,
-        alignment=source_slide.alignment,
-        font_scale=source_slide.font_scale,
-        layout_variant=source_slide.layout_variant,
-        style_overrides=source_slide.style_overrides,
+        Persistent model instances in the same order as rows
+    """
+    if not rows:
+        return []
+
+    objects = db.scalars(
+        insert(model).returning(model, sort_by_parameter_order=True),
+        rows,
+    ).all()
+
+    # Deferred columns without defaults: omitted from a row means NULL
+    deferred_keys = [
+        attr.key for attr in inspect(model).column_attrs
+        if attr.deferred and all(
+            column.default is None and column.server_default is None for column in attr.columns
+        )
+    ]
+    for obj, row in zip(objects, rows, strict=True):
+        for key in deferred_keys:
+            set_committed_value(obj, key, row.get(key))
+
+    return list(objects)
+
+
+def copy_slides(
+    db: Session,
+    source_presentation_id: UUID,
+    target_presentation: Presentation,
+) -> list[Slide]:
+    """
+    Copy every slide of a presentation server-side with INSERT ... SELECT.
+
+    New slide IDs are generated by Postgres (gen_random_uuid), so Python does
+    no per-slide work regardless of deck size, and bodies are shared by hash. The copied rows come back via
+    RETURNING and are attached to target_presentation.slides.
+
+    Args:
+        db: Database session (target presentation must already be flushed)
+        source_presentation_id: Presentation to copy slides from
+        target_presentation: Presentation receiving the copies
+
+    Returns:
+        Copied slides ordered by position
+    """
+    source_rows = select(
+        func.gen_random_uuid(),
+        literal(target_presentation.id, Slide.presentation_id.type),
+        *[getattr(Slide, field) for field in SLIDE_COPY_FIELDS],
+    ).where(Slide.presentation_id == source_presentation_id)
+
+    stmt = (
+        insert(Slide)
+        .from_select(["id", "presentation_id", *SLIDE_COPY_FIELDS], source_rows)
+        .returning(Slide)
+        .options(undefer_group(SLIDE_BODY_GROUP))
     )
 
+    slides = sorted(db.scalars(stmt).all(), key=lambda slide: slide.position)
+    load_slide_bodies(db, (slide.body_hash for slide in slides))
+    set_committed_value(target_presentation, "slides", slides)
+    return slides
+
+
+def bulk_insert_slides(
+    db: Session,
+    presentation: Presentation,
+    rows: list[dict[str, Any]],
+) -> list[Slide]:
+    """
+    Bulk insert slides for a presentation and attach them to presentation.slides.
+
+    Body fields in rows are moved to the slide body store first. The
+    relationship is populated in place so response serialization does not
+    lazy-load the slides (or their bodies) again.
+
+    Args:
+        db: Database session (presentation must already be flushed)
+        presentation: Parent presentation
+        rows: Slide attribute values from the slide_values_* mappers
+
+    Returns:
+        Inserted slides ordered by position
+    """
+    bodies = stage_slide_bodies(db, rows)
+    inserted = bulk_insert(db, Slide, rows)
+    attach_slide_bodies(inserted, bodies)
+    slides = sorted(inserted, key=lambda slide: slide.position)
+    set_committed_value(presentation, "slides", slides)
+    return slides
+
 
 def slide_to_export_dict(slide: Slide) -> dict[str, Any]:
     """
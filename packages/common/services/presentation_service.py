@@ -3,10 +3,20 @@ Presentation Service
 Business logic for presentation CRUD operations
 """
 import uuid
+from collections.abc import AsyncIterator, Iterator
 from math import ceil
+from typing import Literal
 
+from pydantic import ValidationError as SchemaValidationError
+from sqlalchemy import insert, select
+from sqlalchemy.engine import Connection, Engine
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
+from starlette.concurrency import run_in_threadpool
 
+from packages.common.core.config import settings
+from packages.common.core.database import SessionLocal
+from packages.common.core.serialization import dumps, iter_ndjson_lines
 from packages.common.models.presentation import Presentation
 from packages.common.models.slide import Slide
 from packages.common.models.user import User
@@ -20,14 +30,26 @@ from packages.common.schemas.presentation import (
     PresentationDetailResponse,
     PresentationImport,
     PresentationExport,
+    SlideImport,
 )
+from packages.common.services.load_profiles import (
+    LoadProfile,
+    presentation_load_options,
+    slide_load_options,
+)
+from packages.common.services.presentation_cache import invalidate_presentation
+from packages.common.services.presentation_events import presentation_changed
 from packages.common.services.presentation_mappers import (
+    bulk_insert_slides,
+    copy_slides,
     create_slide_from_data,
-    create_slide_from_import,
-    duplicate_slide,
     slide_to_export_dict,
+    slide_values_from_data,
+    slide_values_from_import,
 )
-from packages.common.core.exceptions import ApplicationError
+from packages.common.services.slide_bodies import stage_slide_bodies
+from packages.common.services.thumbnail_service import schedule_thumbnail
+from packages.common.core.exceptions import ApplicationError, ValidationError
 
 
 # Backwards compatibility alias
@@ -37,14 +59,22 @@ class PresentationError(ApplicationError):
 
 
 def get_presentation_by_id(
-    db: Session, presentation_id: uuid.UUID, user: User | None = None
+    db: Session,
+    presentation_id: uuid.UUID,
+    user: User | None = None,
+    profile: LoadProfile = LoadProfile.SUMMARY,
 ) -> Presentation | None:
     """
     Get a presentation by ID
 
-    If user is provided, only return if user owns it or it's public
+    If user is provided, only return if user owns it or it's public.
+    Pass profile=LoadProfile.FULL when the caller renders slide bodies.
     """
-    query = db.query(Presentation).filter(Presentation.id == presentation_id)
+    query = (
+        db.query(Presentation)
+        .options(*presentation_load_options(profile))
+        .filter(Presentation.id == presentation_id)
+    )
 
     if user:
         query = query.filter(
@@ -54,6 +84,28 @@ def get_presentation_by_id(
     return query.first()
 
 
+def load_presentation_slides(
+    db: Session,
+    presentation: Presentation,
+    profile: LoadProfile = LoadProfile.FULL,
+) -> list[Slide]:
+    """
+    Load slides onto an already-fetched presentation in one query.
+
+    Lets a caller fetch the presentation row alone first (e.g. to answer a
+    conditional request) and only pay for slides when it needs them.
+    """
+    slides = (
+        db.query(Slide)
+        .options(*slide_load_options(profile))
+        .filter(Slide.presentation_id == presentation.id)
+        .order_by(Slide.position)
+        .all()
+    )
+    set_committed_value(presentation, "slides", slides)
+    return slides
+
+
 def list_presentations(
     db: Session,
     user: User,
@@ -67,7 +119,8 @@ def list_presentations(
     pages = ceil(total / page_size) if total > 0 else 1
 
     presentations = (
-        query.order_by(Presentation.updated_at.desc())
+        query.options(*presentation_load_options(LoadProfile.FULL))
+        .order_by(Presentation.updated_at.desc())
         .offset((page - 1) * page_size)
         .limit(page_size)
         .all()
@@ -96,15 +149,18 @@ def create_presentation(
         is_public=data.is_public,
     )
     db.add(presentation)
-    db.flush()  # Get the presentation ID
+    db.flush()  # Get the presentation ID and server defaults
 
-    # Add slides using centralized mapper
-    for i, slide_data in enumerate(data.slides):
-        slide = create_slide_from_data(presentation.id, slide_data, i)
-        db.add(slide)
+    # Insert all slides in one round trip using centralized mapper
+    bulk_insert_slides(
+        db,
+        presentation,
+        [slide_values_from_data(presentation.id, slide_data, i) for i, slide_data in enumerate(data.slides)],
+    )
 
     db.commit()
-    db.refresh(presentation)
+    if presentation.thumbnail_url is None:
+        schedule_thumbnail(presentation.id)
     return presentation
 
 
@@ -117,7 +173,7 @@ def update_presentation(
         setattr(presentation, field, value)
 
     db.commit()
-    db.refresh(presentation)
+    presentation_changed(presentation.id)
     return presentation
 
 
@@ -125,11 +181,17 @@ def delete_presentation(db: Session, presentation: Presentation) -> bool:
     """Delete a presentation and all its slides"""
     db.delete(presentation)
     db.commit()
+    invalidate_presentation(presentation.id)
     return True
 
 
 def duplicate_presentation(db: Session, user: User, presentation: Presentation) -> Presentation:
-    """Duplicate a presentation"""
+    """
+    Duplicate a presentation
+
+    Slides are copied with a single INSERT ... SELECT, so the source slides
+    never need to be loaded into Python.
+    """
     new_presentation = Presentation(
         owner_id=user.id,
         topic=f"{presentation.topic} (Copy)",
@@ -141,13 +203,11 @@ def duplicate_presentation(db: Session, user: User, presentation: Presentation)
     db.add(new_presentation)
     db.flush()
 
-    # Duplicate slides using centralized mapper
-    for slide in presentation.slides:
-        new_slide = duplicate_slide(new_presentation.id, slide)
-        db.add(new_slide)
+    # Copy slides server-side; images are shared by reference (copy-on-write)
+    copy_slides(db, presentation.id, new_presentation)
 
     db.commit()
-    db.refresh(new_presentation)
+    schedule_thumbnail(new_presentation.id)
     return new_presentation
 
 
@@ -161,7 +221,7 @@ def add_slide(
     slide = create_slide_from_data(presentation.id, data, position)
     db.add(slide)
     db.commit()
-    db.refresh(slide)
+    presentation_changed(presentation.id)
     return slide
 
 
@@ -172,7 +232,7 @@ def update_slide(db: Session, slide: Slide, data: SlideUpdate) -> Slide:
         setattr(slide, field, value)
 
     db.commit()
-    db.refresh(slide)
+    presentation_changed(slide.presentation_id)
     return slide
 
 
@@ -180,14 +240,18 @@ def delete_slide(db: Session, slide: Slide) -> bool:
     """Delete a slide"""
     db.delete(slide)
     db.commit()
+    presentation_changed(slide.presentation_id)
     return True
 
 
 def get_slide_by_id(
-    db: Session, slide_id: uuid.UUID, presentation_id: uuid.UUID | None = None
+    db: Session,
+    slide_id: uuid.UUID,
+    presentation_id: uuid.UUID | None = None,
+    profile: LoadProfile = LoadProfile.SUMMARY,
 ) -> Slide | None:
     """Get a slide by ID"""
-    query = db.query(Slide).filter(Slide.id == slide_id)
+    query = db.query(Slide).options(*slide_load_options(profile)).filter(Slide.id == slide_id)
     if presentation_id:
         query = query.filter(Slide.presentation_id == presentation_id)
     return query.first()
@@ -208,28 +272,204 @@ def import_presentation(
     db.add(presentation)
     db.flush()
 
-    # Import slides using centralized mapper
-    for i, slide_data in enumerate(data.slides):
-        slide = create_slide_from_import(presentation.id, slide_data, i)
-        db.add(slide)
+    # Import slides in one round trip using centralized mapper
+    bulk_insert_slides(
+        db,
+        presentation,
+        [slide_values_from_import(presentation.id, slide_data, i) for i, slide_data in enumerate(data.slides)],
+    )
 
     db.commit()
-    db.refresh(presentation)
+    schedule_thumbnail(presentation.id)
     return presentation
 
 
+# Streaming import
+IMPORT_IN_PROGRESS = "importing"
+IMPORT_FAILED = "failed"
+
+
+def start_streaming_import(db: Session, user: User, header: PresentationImport) -> Presentation:
+    """Create the presentation for a streaming import, visible as importing"""
+    presentation = Presentation(
+        owner_id=user.id,
+        topic=header.topic,
+        theme_id=header.themeId,
+        visual_style=header.visualStyle,
+        wabi_sabi_layout=header.wabiSabiLayout,
+        import_status=IMPORT_IN_PROGRESS,
+        import_slide_count=0,
+    )
+    db.add(presentation)
+    db.commit()
+    return presentation
+
+
+def append_import_batch(db: Session, presentation: Presentation, slides: list[SlideImport]) -> int:
+    """
+    Insert one batch of imported slides and record progress in the same commit.
+
+    Returns:
+        Total slides imported so far
+    """
+    start = presentation.import_slide_count or 0
+    if slides:
+        rows = [slide_values_from_import(presentation.id, slide_data, start + i) for i, slide_data in enumerate(slides)]
+        stage_slide_bodies(db, rows)
+        db.execute(insert(Slide), rows)
+    presentation.import_slide_count = start + len(slides)
+    db.commit()
+    # Progress only: the thumbnail is rendered once the import has finished
+    invalidate_presentation(presentation.id)
+    return presentation.import_slide_count
+
+
+def finish_streaming_import(db: Session, presentation: Presentation, failed: bool = False) -> Presentation:
+    """Clear the importing flag (or mark the import failed)"""
+    presentation.import_status = IMPORT_FAILED if failed else None
+    db.commit()
+    invalidate_presentation(presentation.id)
+    return presentation
+
+
+async def import_presentation_stream(
+    db: Session,
+    user: User,
+    chunks: AsyncIterator[bytes],
+    batch_size: int | None = None,
+) -> Presentation:
+    """
+    Import a presentation from an NDJSON stream without buffering the body.
+
+    The first line is a PresentationImport header (its slides list may be
+    empty); each following line is one SlideImport. Lines are validated as
+    they arrive and slides are committed every batch_size slides, so memory
+    and lock time stay bounded. The presentation is created with
+    import_status="importing" and import_slide_count tracks progress; a
+    rejected or interrupted stream leaves it marked "failed" with the slides
+    committed so far.
+
+    Raises:
+        ValidationError: Empty stream, oversized line or invalid line
+    """
+    batch_size = batch_size or settings.import_stream_batch_size
+    presentation: Presentation | None = None
+    batch: list[SlideImport] = []
+    line_number = 0
+
+    try:
+        async for line in iter_ndjson_lines(chunks, settings.import_stream_max_line_bytes):
+            line_number += 1
+            if presentation is None:
+                header = PresentationImport.model_validate_json(line)
+                presentation = await run_in_threadpool(start_streaming_import, db, user, header)
+                batch.extend(header.slides)
+            else:
+                batch.append(SlideImport.model_validate_json(line))
+
+            while len(batch) >= batch_size:
+                await run_in_threadpool(append_import_batch, db, presentation, batch[:batch_size])
+                batch = batch[batch_size:]
+
+        if presentation is None:
+            raise ValidationError(message="Import stream is empty", field="body")
+
+        await run_in_threadpool(append_import_batch, db, presentation, batch)
+        await run_in_threadpool(finish_streaming_import, db, presentation)
+        await run_in_threadpool(schedule_thumbnail, presentation.id)
+        return presentation
+
+    except Exception as e:
+        if presentation is not None:
+            await run_in_threadpool(db.rollback)
+            await run_in_threadpool(finish_streaming_import, db, presentation, True)
+        if isinstance(e, SchemaValidationError):
+            raise ValidationError(
+                message=f"Invalid import data on line {line_number}",
+                field=f"line {line_number}",
+                details={
+                    "line": line_number,
+                    "errors": [
+                        {"loc": ".".join(str(loc) for loc in error["loc"]), "message": error["msg"]}
+                        for error in e.errors()
+                    ],
+                    "presentation_id": str(presentation.id) if presentation else None,
+                },
+            ) from e
+        raise
+
+
+def export_presentation_header(presentation: Presentation) -> dict:
+    """Export fields of a presentation other than slides (camelCase)"""
+    return {
+        "id": str(presentation.id),
+        "topic": presentation.topic,
+        "themeId": presentation.theme_id,
+        "visualStyle": presentation.visual_style,
+        "wabiSabiLayout": presentation.wabi_sabi_layout,
+        "createdAt": presentation.created_at.isoformat(),
+        "updatedAt": presentation.updated_at.isoformat(),
+    }
+
+
 def export_presentation(presentation: Presentation) -> PresentationExport:
     """Export a presentation to frontend format (camelCase)"""
     # Use centralized mapper for slides
     slides = [slide_to_export_dict(slide) for slide in presentation.slides]
 
-    return PresentationExport(
-        id=str(presentation.id),
-        topic=presentation.topic,
-        themeId=presentation.theme_id,
-        visualStyle=presentation.visual_style,
-        wabiSabiLayout=presentation.wabi_sabi_layout,
-        slides=slides,
-        createdAt=presentation.created_at.isoformat(),
-        updatedAt=presentation.updated_at.isoformat(),
+    return PresentationExport(**export_presentation_header(presentation), slides=slides)
+
+
+ExportStreamFormat = Literal["json", "ndjson"]
+
+
+def stream_export_presentation(
+    bind: Engine | Connection,
+    presentation: Presentation,
+    export_format: ExportStreamFormat = "json",
+    batch_size: int | None = None,
+) -> Iterator[bytes]:
+    """
+    Stream a presentation export with memory independent of slide count.
+
+    Slides are read through a server-side cursor (yield_per) in its own
+    session, because the request's session is closed before a streaming
+    response body is sent. Each cursor batch becomes one chunk; earlier
+    batches are unreferenced and drop out of the (weak) identity map.
+
+    Formats:
+        json: Same document as export_presentation (slides key last)
+        ndjson: Header object on the first line, then one slide per line
+
+    Args:
+        bind: Engine/connection to read from (the request session's bind)
+        presentation: Already-authorized presentation (slides not loaded)
+        export_format: "json" or "ndjson"
+        batch_size: Slides per cursor batch (default: settings)
+    """
+    header = dumps(export_presentation_header(presentation))
+    stmt = (
+        select(Slide)
+        .options(*slide_load_options(LoadProfile.FULL))
+        .where(Slide.presentation_id == presentation.id)
+        .order_by(Slide.position)
+        .execution_options(yield_per=batch_size or settings.export_stream_batch_size)
     )
+
+    if export_format == "ndjson":
+        yield header + b"\n"
+    else:
+        yield header[:-1] + b',"slides":['
+
+    first = True
+    with SessionLocal(bind=bind) as db:
+        for batch in db.scalars(stmt).partitions():
+            encoded = [dumps(slide_to_export_dict(slide)) for slide in batch]
+            if export_format == "ndjson":
+                yield b"\n".join(encoded) + b"\n"
+            else:
+                yield (b"" if first else b",") + b",".join(encoded)
+                first = False
+
+    if export_format == "json":
+        yield b"]}"
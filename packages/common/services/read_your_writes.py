@@ -0,0 +1,66 @@
+"""
+Read-Your-Writes Service
+Per-user markers that pin a user's reads to the primary after their writes
+
+Every successful write a user makes - over HTTP (ReadYourWritesMiddleware)
+or over WebSocket sync - sets a Redis key for that user that expires after
+DATABASE_READ_YOUR_WRITES_SECONDS. While the key exists, ReadDbSession binds
+that user's sessions to the primary instead of a replica.
+
+The marker is keyed on the user, not held in a cookie: the frontend calls
+the API cross-origin without credentials, and WebSocket writes have no
+response to set a cookie on. Keying on the user also covers every tab and
+API instance at once.
+
+Nothing is tracked unless DATABASE_REPLICA_URLS is configured. If Redis is
+down, reads fall back to the primary.
+"""
+import logging
+import uuid
+
+import redis
+
+from packages.common.core.config import settings
+from packages.common.core.database import replica_engines
+from packages.common.core.redis_client import get_redis
+from packages.common.services.auth_service import ACCESS_TOKEN, AuthError, decode_token
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "primary-until"
+
+
+def _key(user_id: uuid.UUID | str) -> str:
+    return f"{KEY_PREFIX}:{user_id}"
+
+
+def user_id_from_token(token: str | None) -> uuid.UUID | None:
+    """User id of a valid access token, without a database lookup"""
+    if not token:
+        return None
+    try:
+        payload = decode_token(token)
+        if payload.get("type") != ACCESS_TOKEN:
+            return None
+        return uuid.UUID(payload["sub"])
+    except (AuthError, KeyError, ValueError):
+        return None
+
+
+def mark_recent_write(user_id: uuid.UUID | str) -> None:
+    """Pin the user's reads to the primary for DATABASE_READ_YOUR_WRITES_SECONDS"""
+    if not replica_engines:
+        return
+    try:
+        get_redis().set(_key(user_id), 1, ex=settings.database_read_your_writes_seconds)
+    except redis.RedisError as e:
+        logger.warning(f"Read-your-writes marker not set for {user_id}: {e}")
+
+
+def wrote_recently(user_id: uuid.UUID | str) -> bool:
+    """Whether the user's reads must stay on the primary"""
+    try:
+        return bool(get_redis().exists(_key(user_id)))
+    except redis.RedisError as e:
+        logger.warning(f"Read-your-writes check failed for {user_id}, reading from primary: {e}")
+        return True
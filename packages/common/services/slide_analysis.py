@@ -0,0 +1,160 @@
+"""
+Slide Analysis Service
+Per-slide classification, mess scoring and text extraction for beautify
+KISS: One pure function per slide, optionally fanned out to a process pool
+
+analyze_slide only looks at a raw slide dict (texts, image sizes, notes),
+so it runs unchanged in worker processes. analyze_slides fans large decks
+out to a ProcessPoolExecutor in chunks and yields results in slide order;
+image payloads are stripped before slides are sent to workers, since no
+analysis step reads them.
+"""
+import logging
+import multiprocessing
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from typing import Any
+
+from packages.common.core.config import settings
+from packages.common.services.mess_analyzer import analyze_mess
+from packages.common.services.slide_classifier import (
+    classify_slide,
+    get_suggested_alignment,
+    get_suggested_layout,
+)
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on slides per worker round trip
+MAX_CHUNK_SIZE = 32
+
+
+def extract_title(raw_slide: dict[str, Any]) -> str:
+    """Extract title from raw slide data."""
+    texts = raw_slide.get("texts", [])
+
+    # Find text marked as title
+    for text in texts:
+        if text.get("is_title"):
+            return text.get("value", "").strip()
+
+    # Fall back to largest font
+    if texts:
+        largest = max(texts, key=lambda t: t.get("font_size", 0))
+        return largest.get("value", "").strip()[:200]  # Limit length
+
+    return "Untitled"
+
+
+def extract_content(raw_slide: dict[str, Any]) -> list[str]:
+    """Extract content bullets from raw slide data."""
+    texts = raw_slide.get("texts", [])
+    content = []
+
+    for text in texts:
+        if text.get("is_title"):
+            continue
+
+        value = text.get("value", "").strip()
+        if not value:
+            continue
+
+        # Split by newlines if present
+        if "\n" in value:
+            lines = [line.strip() for line in value.split("\n") if line.strip()]
+            content.extend(lines)
+        else:
+            content.append(value)
+
+    return content[:20]  # Limit to 20 items
+
+
+def analyze_slide(raw_slide: dict[str, Any]) -> dict[str, Any]:
+    """
+    Classify, score and extract text from one raw slide.
+
+    Returns the SlideIR fields derived from analysis (camelCase keys).
+    """
+    slide_type, confidence = classify_slide(raw_slide)
+    mess_score, mess_issues = analyze_mess(raw_slide)
+    return {
+        "type": slide_type,
+        "typeConfidence": confidence,
+        "title": extract_title(raw_slide),
+        "content": extract_content(raw_slide),
+        "messScore": mess_score,
+        "messIssues": mess_issues,
+        "suggestedLayout": get_suggested_layout(slide_type),
+        "suggestedAlignment": get_suggested_alignment(slide_type),
+    }
+
+
+def _analysis_input(raw_slide: dict[str, Any]) -> dict[str, Any]:
+    """The raw slide without image payloads (only image sizes are analyzed)"""
+    return {
+        **raw_slide,
+        "images": [
+            {key: value for key, value in image.items() if key in ("width", "height", "content_type")}
+            for image in raw_slide.get("images", [])
+        ],
+    }
+
+
+def _analyze_chunk(raw_slides: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    return [analyze_slide(raw_slide) for raw_slide in raw_slides]
+
+
+def analysis_workers(slide_count: int) -> int:
+    """
+    Worker processes to analyze a deck of slide_count slides with
+    (0: analyze in this process).
+    """
+    workers = settings.beautify_analysis_workers
+    if workers <= 1 or slide_count < settings.beautify_analysis_parallel_min_slides:
+        return 0
+    if multiprocessing.current_process().daemon:
+        # Daemonic processes may not start children
+        return 0
+    return workers
+
+
+def analyze_slides(
+    raw_slides: Iterable[dict[str, Any]],
+    slide_count: int,
+) -> Iterator[tuple[dict[str, Any], dict[str, Any]]]:
+    """
+    Analyze slides in order.
+
+    Decks of BEAUTIFY_ANALYSIS_PARALLEL_MIN_SLIDES or more are spread over
+    BEAUTIFY_ANALYSIS_WORKERS processes. At most two chunks per worker are
+    in flight, so raw_slides is consumed incrementally.
+
+    Args:
+        raw_slides: Raw slides from the PPTX parser
+        slide_count: Number of slides, used to pick the execution strategy
+            and chunk size
+
+    Yields:
+        (raw slide, analysis) for every slide
+    """
+    workers = analysis_workers(slide_count)
+    if not workers:
+        for raw_slide in raw_slides:
+            yield raw_slide, analyze_slide(raw_slide)
+        return
+
+    chunk_size = max(1, min(MAX_CHUNK_SIZE, slide_count // (workers * 4)))
+    slides = iter(raw_slides)
+    pending: deque[tuple[list[dict[str, Any]], Future]] = deque()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        while True:
+            chunk = list(islice(slides, chunk_size))
+            if chunk:
+                pending.append((chunk, pool.submit(_analyze_chunk, [_analysis_input(s) for s in chunk])))
+            if pending and (not chunk or len(pending) >= workers * 2):
+                chunk_slides, future = pending.popleft()
+                yield from zip(chunk_slides, future.result(), strict=True)
+            elif not chunk:
+                break
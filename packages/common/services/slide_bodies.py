@@ -0,0 +1,92 @@
+"""
+Slide Bodies Service
+Bulk helpers for the content-addressed slide body store
+
+Per-object writes go through the SlideBodyMixin properties; these helpers
+cover the executemany/INSERT ... SELECT paths that bypass the ORM unit of
+work, and expanding hash references back into full bodies.
+"""
+from collections.abc import Iterable
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from packages.common.models.slide_body import (
+    SLIDE_BODY_FIELDS,
+    SlideBody,
+    SlideBodyMixin,
+    normalize_slide_body,
+    slide_body_hash,
+)
+
+
+def stage_slide_bodies(db: Session, rows: list[dict[str, Any]]) -> list[dict[str, Any] | None]:
+    """
+    Move body fields out of row dicts into the body store.
+
+    Each row that carries body fields gets a body_hash instead; rows that
+    already reference a body_hash are left as they are. Distinct bodies are
+    inserted in one statement.
+
+    Returns:
+        The normalized body per row (None where the row was not changed)
+    """
+    staged: list[dict[str, Any] | None] = []
+    new_bodies: dict[str, dict[str, Any]] = {}
+    for row in rows:
+        if not any(key in row for key in SLIDE_BODY_FIELDS):
+            staged.append(None)
+            continue
+        body = normalize_slide_body({key: row.pop(key, None) for key in SLIDE_BODY_FIELDS})
+        body_hash = slide_body_hash(body)
+        row["body_hash"] = body_hash
+        if body_hash is not None:
+            new_bodies[body_hash] = body
+        staged.append(body)
+
+    SlideBody.store(db, new_bodies)
+    return staged
+
+
+def attach_slide_bodies(objects: Iterable[SlideBodyMixin], bodies: Iterable[dict[str, Any] | None]) -> None:
+    """Seed staged bodies onto freshly inserted objects so reads need no query"""
+    for obj, body in zip(objects, bodies, strict=True):
+        if body is not None:
+            obj.set_slide_body(body, stored=True)
+
+
+def load_slide_bodies(db: Session, hashes: Iterable[str | None]) -> None:
+    """
+    Load bodies into the identity map with one query.
+
+    Lazy body loads for these hashes are then served without SQL.
+    """
+    wanted = {body_hash for body_hash in hashes if body_hash is not None}
+    if wanted:
+        db.scalars(select(SlideBody).where(SlideBody.hash.in_(wanted))).all()
+
+
+def expand_snapshot(db: Session, snapshot: dict[str, Any]) -> dict[str, Any]:
+    """
+    Replace body_hash references in a version snapshot with the body fields.
+
+    Snapshots written before the body store existed already hold inline
+    bodies and are returned unchanged.
+    """
+    slides = snapshot.get("slides", [])
+    hashes = [slide.get("body_hash") for slide in slides if "body_hash" in slide]
+    if not hashes:
+        return snapshot
+
+    load_slide_bodies(db, hashes)
+    expanded = []
+    for slide in slides:
+        if "body_hash" not in slide:
+            expanded.append(slide)
+            continue
+        slide = dict(slide)
+        body_hash = slide.pop("body_hash")
+        body = db.get(SlideBody, body_hash) if body_hash is not None else None
+        expanded.append({**slide, **normalize_slide_body(body.body if body is not None else {})})
+    return {**snapshot, "slides": expanded}
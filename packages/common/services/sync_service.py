@@ -6,14 +6,27 @@ import logging
 from uuid import UUID
 from typing import Any
 
+from starlette.concurrency import run_in_threadpool
+
 from packages.common.core.database import get_db_context
 from packages.common.models.presentation import Presentation
 from packages.common.models.slide import Slide
+from packages.common.services.presentation_events import presentation_changed
+from packages.common.services.read_your_writes import mark_recent_write
 from packages.common.services.websocket_manager import connection_manager
 from packages.common.schemas.websocket import MessageType, ConflictType
 
 logger = logging.getLogger(__name__)
 
+# Message types that write to the database
+WRITE_MESSAGE_TYPES = frozenset({
+    MessageType.SLIDE_UPDATE.value,
+    MessageType.SLIDE_CREATE.value,
+    MessageType.SLIDE_DELETE.value,
+    MessageType.SLIDE_REORDER.value,
+    MessageType.PRESENTATION_UPDATE.value,
+})
+
 
 async def handle_sync_message(
     presentation_id: UUID,
@@ -39,6 +52,9 @@ async def handle_sync_message(
     handler = handlers.get(message_type)
     if handler:
         await handler(presentation_id, user_id, message)
+        if message_type in WRITE_MESSAGE_TYPES:
+            # Keep the user's HTTP reads on the primary until replicas catch up
+            await run_in_threadpool(mark_recent_write, user_id)
     else:
         logger.warning(f"Unknown message type: {message_type}")
         await send_error(
@@ -100,7 +116,7 @@ async def handle_slide_update(
             # Increment version
             slide.version += 1
             db.commit()
-            db.refresh(slide)
+            await run_in_threadpool(presentation_changed, presentation_id)
 
             # Send ACK to originator
             await send_ack(presentation_id, user_id, message_id, slide.version)
@@ -165,7 +181,7 @@ async def handle_slide_create(
             )
             db.add(slide)
             db.commit()
-            db.refresh(slide)
+            await run_in_threadpool(presentation_changed, presentation_id)
 
             # Send ACK with real server ID
             await send_ack(
@@ -240,6 +256,7 @@ async def handle_slide_delete(
             )
 
             db.commit()
+            await run_in_threadpool(presentation_changed, presentation_id)
 
             await send_ack(presentation_id, user_id, message_id, None)
 
@@ -283,6 +300,7 @@ async def handle_slide_reorder(
                 ).update({Slide.position: new_position})
 
             db.commit()
+            await run_in_threadpool(presentation_changed, presentation_id)
 
             await send_ack(presentation_id, user_id, message_id, None)
 
@@ -350,7 +368,7 @@ async def handle_presentation_update(
 
             presentation.version += 1
             db.commit()
-            db.refresh(presentation)
+            await run_in_threadpool(presentation_changed, presentation_id)
 
             await send_ack(presentation_id, user_id, message_id, presentation.version)
 
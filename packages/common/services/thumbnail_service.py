@@ -0,0 +1,241 @@
+"""
+Thumbnail Service
+Renders small dashboard thumbnails of a presentation's first slide
+
+Rendering is pure (inputs in, image bytes out) so it can run in the
+thumbnails Celery queue; scheduling is debounced through Redis so a burst
+of edits produces a single render.
+"""
+import base64
+import hashlib
+import io
+import logging
+import re
+import textwrap
+import uuid
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import httpx
+import redis
+from PIL import Image, ImageDraw, ImageFont, features
+
+from packages.common.core.config import settings
+from packages.common.core.redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+THUMBNAIL_TASK_NAME = "packages.common.tasks.thumbnail_task.render_presentation_thumbnail"
+
+BACKGROUND = (250, 249, 246)
+TEXT_COLOR = (28, 28, 30)
+OVERLAY_TEXT_COLOR = (255, 255, 255)
+IMAGE_PLACEHOLDER = (226, 224, 219)
+
+_GENERATED_KEY_RE = re.compile(r"/thumbnail-[0-9a-f]{16}\.(?:webp|png)$")
+
+# Layouts whose image sits above / behind the title; "statement" is text
+# only, and every other layout (split, card, gallery...) puts it beside
+TOP_IMAGE_LAYOUTS = {"horizontal"}
+BACKGROUND_IMAGE_LAYOUTS = {"full-bleed"}
+
+
+@dataclass(frozen=True)
+class ThumbnailSource:
+    """Everything that affects a presentation's thumbnail"""
+
+    presentation_id: uuid.UUID
+    title: str
+    layout_type: str | None
+    image_url: str | None
+
+    def fingerprint(self) -> str:
+        """Short content hash; an unchanged fingerprint means no re-render"""
+        raw = "\x1f".join([
+            self.title,
+            self.layout_type or "",
+            self.image_url or "",
+            f"{settings.thumbnail_width}x{settings.thumbnail_height}",
+            thumbnail_format(),
+        ])
+        return hashlib.sha256(raw.encode()).hexdigest()[:16]
+
+    def storage_key(self) -> str:
+        """Content-addressed key, so CDNs never serve a stale thumbnail"""
+        return f"presentations/{self.presentation_id}/thumbnail-{self.fingerprint()}.{thumbnail_format()}"
+
+
+def is_generated_thumbnail(thumbnail_url: str) -> bool:
+    """Whether a thumbnail_url was produced by render_thumbnail (vs. user supplied)"""
+    return bool(_GENERATED_KEY_RE.search(thumbnail_url.split("?", 1)[0]))
+
+
+def thumbnail_format() -> str:
+    """Configured output format, falling back to PNG if Pillow lacks WebP"""
+    if settings.thumbnail_format == "webp" and not features.check("webp"):
+        return "png"
+    return settings.thumbnail_format
+
+
+def _download(image_url: str) -> bytes:
+    """GET a stored image without following redirects, up to THUMBNAIL_MAX_IMAGE_BYTES"""
+    limit = settings.thumbnail_max_image_bytes
+    with httpx.stream("GET", image_url, timeout=10.0, follow_redirects=False) as response:
+        response.raise_for_status()
+        if int(response.headers.get("content-length") or 0) > limit:
+            raise ValueError(f"image larger than {limit} bytes")
+        data = bytearray()
+        for chunk in response.iter_bytes():
+            data += chunk
+            if len(data) > limit:
+                raise ValueError(f"image larger than {limit} bytes")
+    return bytes(data)
+
+
+def _load_image(image_url: str | None, is_stored_url: Callable[[str], bool]) -> Image.Image | None:
+    """
+    Decode a slide image from a data URI or a URL in our own storage.
+
+    Other absolute URLs are user supplied and never fetched.
+    """
+    if not image_url:
+        return None
+    try:
+        if image_url.startswith("data:"):
+            data = base64.b64decode(image_url.split(",", 1)[1])
+        elif image_url.startswith(("http://", "https://")):
+            if not is_stored_url(image_url):
+                return None
+            data = _download(image_url)
+        else:
+            return None  # Relative URLs are served by the frontend host
+        image = Image.open(io.BytesIO(data))
+        image.draft("RGB", (settings.thumbnail_width * 2, settings.thumbnail_height * 2))
+        return image.convert("RGB")
+    except Exception as e:
+        logger.warning(f"Could not load slide image for thumbnail: {e}")
+        return None
+
+
+def _cover(image: Image.Image, size: tuple[int, int]) -> Image.Image:
+    """Scale and center-crop an image to fill size"""
+    scale = max(size[0] / image.width, size[1] / image.height)
+    resized = image.resize(
+        (max(1, round(image.width * scale)), max(1, round(image.height * scale))),
+        Image.Resampling.LANCZOS,
+    )
+    left = (resized.width - size[0]) // 2
+    top = (resized.height - size[1]) // 2
+    return resized.crop((left, top, left + size[0], top + size[1]))
+
+
+def _draw_title(
+    draw: ImageDraw.ImageDraw,
+    title: str,
+    box: tuple[int, int, int, int],
+    color: tuple[int, int, int],
+    center: bool = False,
+) -> None:
+    """Wrap the title into at most three lines inside box"""
+    left, top, right, bottom = box
+    font_size = max(10, (bottom - top) // 6)
+    font = ImageFont.load_default(size=font_size)
+    chars_per_line = max(8, int((right - left) / (font_size * 0.55)))
+    lines = textwrap.wrap(title, width=chars_per_line)[:3]
+    line_height = int(font_size * 1.25)
+    y = top + max(0, ((bottom - top) - line_height * len(lines)) // 2)
+    for line in lines:
+        x = left
+        if center:
+            x = left + max(0, ((right - left) - int(draw.textlength(line, font=font))) // 2)
+        draw.text((x, y), line, font=font, fill=color)
+        y += line_height
+
+
+def render_thumbnail(
+    source: ThumbnailSource,
+    is_stored_url: Callable[[str], bool] = lambda _: False,
+) -> tuple[bytes, str]:
+    """
+    Render the first-slide thumbnail.
+
+    Args:
+        source: What to render
+        is_stored_url: Whether an absolute image URL may be downloaded
+            (ImageStorageProvider.owns_url); other URLs render as a placeholder
+
+    Returns:
+        (image bytes, content type)
+    """
+    width, height = settings.thumbnail_width, settings.thumbnail_height
+    canvas = Image.new("RGB", (width, height), BACKGROUND)
+    draw = ImageDraw.Draw(canvas)
+    layout = source.layout_type or "split"
+    padding = width // 16
+
+    image = None if layout == "statement" else _load_image(source.image_url, is_stored_url)
+
+    if layout in BACKGROUND_IMAGE_LAYOUTS and image is not None:
+        canvas.paste(_cover(image, (width, height)), (0, 0))
+        band_top = height * 3 // 5
+        shade = Image.new("RGBA", canvas.size, (0, 0, 0, 0))
+        ImageDraw.Draw(shade).rectangle((0, band_top, width, height), fill=(0, 0, 0, 150))
+        canvas = Image.alpha_composite(canvas.convert("RGBA"), shade).convert("RGB")
+        draw = ImageDraw.Draw(canvas)
+        _draw_title(draw, source.title, (padding, band_top, width - padding, height), OVERLAY_TEXT_COLOR)
+    elif layout in TOP_IMAGE_LAYOUTS:
+        image_box = (width, height // 2)
+        if image is not None:
+            canvas.paste(_cover(image, image_box), (0, 0))
+        else:
+            draw.rectangle((0, 0, width, height // 2), fill=IMAGE_PLACEHOLDER)
+        _draw_title(draw, source.title, (padding, height // 2, width - padding, height), TEXT_COLOR)
+    elif layout == "statement" or layout in BACKGROUND_IMAGE_LAYOUTS:
+        _draw_title(draw, source.title, (padding, padding, width - padding, height - padding), TEXT_COLOR, center=True)
+    else:
+        image_box = (width // 2, height)
+        if image is not None:
+            canvas.paste(_cover(image, image_box), (width // 2, 0))
+        else:
+            draw.rectangle((width // 2, 0, width, height), fill=IMAGE_PLACEHOLDER)
+        _draw_title(draw, source.title, (padding, padding, width // 2 - padding, height - padding), TEXT_COLOR)
+
+    output_format = thumbnail_format()
+    buffer = io.BytesIO()
+    if output_format == "webp":
+        canvas.save(buffer, format="WEBP", quality=settings.thumbnail_quality, method=4)
+    else:
+        canvas.save(buffer, format="PNG", optimize=True)
+    return buffer.getvalue(), f"image/{output_format}"
+
+
+def schedule_thumbnail(presentation_id: uuid.UUID | str) -> None:
+    """
+    Queue a thumbnail render, debounced per presentation.
+
+    The first change in a window queues one task with a countdown; later
+    changes inside the window are absorbed, and the task renders whatever
+    the deck looks like when it runs.
+    """
+    if not settings.thumbnails_enabled:
+        return
+    try:
+        pending = get_redis().set(
+            f"thumbnail-pending:{presentation_id}",
+            1,
+            nx=True,
+            ex=settings.thumbnail_debounce_seconds,
+        )
+    except redis.RedisError as e:
+        logger.warning(f"Thumbnail scheduling skipped for {presentation_id}: {e}")
+        return
+
+    if pending:
+        # Imported here: the Celery app imports every task module on load
+        from packages.common.core.celery_app import celery_app
+
+        celery_app.send_task(
+            THUMBNAIL_TASK_NAME,
+            args=[str(presentation_id)],
+            countdown=settings.thumbnail_debounce_seconds,
+        )
@@ -0,0 +1,234 @@
+"""
+Version Diff Service
+Structural slide- and field-level diff between two versions, cached in Redis
+
+Slides are paired by the id recorded in the snapshot; slides without a
+partner are then paired by content (a slide duplicated, or deleted and
+re-created), and slides from snapshots that predate slide ids by position.
+Slide bodies are expanded only for pairs whose body_hash differs and for
+added slides.
+
+Versions never change once written, so a diff is cached by the pair of
+version ids without invalidation. Redis errors degrade to recomputing.
+"""
+import logging
+from bisect import bisect_left
+from typing import Any
+
+import orjson
+import redis
+from sqlalchemy.orm import Session
+
+from packages.common.core.config import settings
+from packages.common.core.redis_client import get_redis
+from packages.common.models.presentation_version import PresentationVersion
+from packages.common.models.slide_body import SLIDE_BODY_FIELDS, SlideBody, normalize_slide_body
+from packages.common.schemas.presentation_version import FieldChange, SlideDiff, VersionDiffResponse
+from packages.common.services.slide_bodies import load_slide_bodies
+from packages.common.services.version_snapshots import load_snapshot
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "version-diff"
+
+# Snapshot slide keys that identify or locate a slide rather than describe it
+_SLIDE_META_KEYS = {"id", "position", "body_hash"}
+
+
+def _cache_key(old: PresentationVersion, new: PresentationVersion) -> str:
+    return f"{KEY_PREFIX}:{old.id}:{new.id}"
+
+
+def _content_key(slide: dict[str, Any]) -> bytes:
+    """Slide identity by content, ignoring its id and where it sits"""
+    return orjson.dumps(
+        {k: v for k, v in slide.items() if k not in ("id", "position")},
+        option=orjson.OPT_SORT_KEYS,
+    )
+
+
+def _match_slides(
+    old_slides: list[dict[str, Any]], new_slides: list[dict[str, Any]]
+) -> list[tuple[int | None, int | None]]:
+    """
+    Pair old and new slides by index: by id, then by content, then (where
+    either side has no id) by position.
+
+    Returns:
+        (old index or None, new index or None) for every slide of both lists
+    """
+    pairs: list[tuple[int | None, int | None]] = []
+    old_left = set(range(len(old_slides)))
+    new_left = set(range(len(new_slides)))
+
+    def pair(i: int, j: int) -> None:
+        pairs.append((i, j))
+        old_left.discard(i)
+        new_left.discard(j)
+
+    new_by_id = {slide["id"]: j for j, slide in enumerate(new_slides) if slide.get("id")}
+    for i, slide in enumerate(old_slides):
+        j = new_by_id.get(slide.get("id")) if slide.get("id") else None
+        if j is not None:
+            pair(i, j)
+
+    new_by_content: dict[bytes, list[int]] = {}
+    for j in sorted(new_left):
+        new_by_content.setdefault(_content_key(new_slides[j]), []).append(j)
+    for i in sorted(old_left):
+        candidates = new_by_content.get(_content_key(old_slides[i]))
+        if candidates:
+            pair(i, candidates.pop(0))
+
+    new_by_position = {new_slides[j].get("position"): j for j in sorted(new_left, reverse=True)}
+    for i in sorted(old_left):
+        j = new_by_position.get(old_slides[i].get("position"))
+        if j is not None and j in new_left and not (old_slides[i].get("id") and new_slides[j].get("id")):
+            pair(i, j)
+
+    pairs += [(i, None) for i in sorted(old_left)]
+    pairs += [(None, j) for j in sorted(new_left)]
+    return pairs
+
+
+def _moved(pairs: list[tuple[int | None, int | None]]) -> set[int]:
+    """
+    Old indices of slides whose order relative to the other kept slides
+    changed: those outside a longest increasing run of new indices.
+    """
+    kept = sorted((i, j) for i, j in pairs if i is not None and j is not None)
+    tails: list[int] = []  # smallest new index ending a run of each length
+    tail_at: list[int] = []  # position in kept of that tail
+    previous: list[int] = [-1] * len(kept)
+    for k, (_, j) in enumerate(kept):
+        length = bisect_left(tails, j)
+        if length == len(tails):
+            tails.append(j)
+            tail_at.append(k)
+        else:
+            tails[length] = j
+            tail_at[length] = k
+        previous[k] = tail_at[length - 1] if length else -1
+    in_order = set()
+    k = tail_at[-1] if tail_at else -1
+    while k >= 0:
+        in_order.add(kept[k][0])
+        k = previous[k]
+    return {i for i, _ in kept} - in_order
+
+
+def _slide_fields(db: Session, slide: dict[str, Any], with_body: bool) -> dict[str, Any]:
+    """Comparable fields of a snapshot slide, with the body expanded if asked"""
+    fields = {k: v for k, v in slide.items() if k not in _SLIDE_META_KEYS}
+    if not with_body:
+        for key in SLIDE_BODY_FIELDS:
+            fields.pop(key, None)
+    elif "body_hash" in slide:
+        body = db.get(SlideBody, slide["body_hash"]) if slide["body_hash"] is not None else None
+        fields.update(normalize_slide_body(body.body if body is not None else {}))
+    return fields
+
+
+def _body_differs(old: dict[str, Any], new: dict[str, Any]) -> bool:
+    if "body_hash" in old and "body_hash" in new:
+        return old["body_hash"] != new["body_hash"]
+    # Snapshots that predate the body store hold bodies inline
+    return True
+
+
+def _field_changes(old: dict[str, Any], new: dict[str, Any]) -> dict[str, FieldChange]:
+    return {
+        key: FieldChange(old=old.get(key), new=new.get(key))
+        for key in sorted(old.keys() | new.keys())
+        if old.get(key) != new.get(key)
+    }
+
+
+def compare_snapshots(db: Session, old: dict[str, Any], new: dict[str, Any]) -> VersionDiffResponse:
+    """Structural diff between two full snapshots (version numbers left at 0)"""
+    old_slides = old.get("slides", [])
+    new_slides = new.get("slides", [])
+    pairs = _match_slides(old_slides, new_slides)
+    moved = _moved(pairs)
+
+    # One query for every body that has to be compared or shown
+    load_slide_bodies(db, [
+        *(old_slides[i].get("body_hash") for i, j in pairs
+          if i is not None and j is not None and _body_differs(old_slides[i], new_slides[j])),
+        *(new_slides[j].get("body_hash") for i, j in pairs
+          if j is not None and (i is None or _body_differs(old_slides[i], new_slides[j]))),
+    ])
+
+    diff = VersionDiffResponse(
+        from_version=0,
+        to_version=0,
+        presentation=_field_changes(
+            {k: v for k, v in old.items() if k != "slides"},
+            {k: v for k, v in new.items() if k != "slides"},
+        ),
+    )
+    for i, j in pairs:
+        old_slide = old_slides[i] if i is not None else None
+        new_slide = new_slides[j] if j is not None else None
+        if old_slide is None:
+            entry = SlideDiff(
+                status="added",
+                changes=_field_changes({}, _slide_fields(db, new_slide, with_body=True)),
+            )
+            diff.added += 1
+        elif new_slide is None:
+            entry = SlideDiff(status="removed")
+            diff.removed += 1
+        else:
+            with_body = _body_differs(old_slide, new_slide)
+            changes = _field_changes(
+                _slide_fields(db, old_slide, with_body), _slide_fields(db, new_slide, with_body)
+            )
+            if changes:
+                entry = SlideDiff(status="modified", changes=changes, moved=i in moved)
+                diff.modified += 1
+            elif i in moved:
+                entry = SlideDiff(status="moved", moved=True)
+            else:
+                continue
+            if i in moved:
+                diff.moved += 1
+        current = new_slide if new_slide is not None else old_slide
+        entry.slide_id = current.get("id")
+        entry.title = current.get("title")
+        entry.old_position = old_slide.get("position") if old_slide is not None else None
+        entry.new_position = new_slide.get("position") if new_slide is not None else None
+        diff.slides.append(entry)
+
+    diff.slides.sort(key=lambda entry: (
+        entry.new_position if entry.new_position is not None else entry.old_position or 0,
+        entry.status != "removed",
+    ))
+    return diff
+
+
+def diff_versions(db: Session, old: PresentationVersion, new: PresentationVersion) -> VersionDiffResponse:
+    """Structural diff from version old to version new"""
+    diff = compare_snapshots(db, load_snapshot(db, old), load_snapshot(db, new))
+    diff.from_version = old.version_number
+    diff.to_version = new.version_number
+    return diff
+
+
+def get_version_diff(db: Session, old: PresentationVersion, new: PresentationVersion) -> bytes:
+    """Serialized diff from old to new, from the cache when possible"""
+    key = _cache_key(old, new)
+    try:
+        cached = get_redis().get(key)
+    except redis.RedisError as e:
+        logger.warning(f"Version diff cache unavailable: {e}")
+        cached = None
+    if cached is not None:
+        return cached
+
+    body = diff_versions(db, old, new).model_dump_json().encode()
+    try:
+        get_redis().set(key, body, ex=settings.version_diff_cache_ttl_seconds)
+    except redis.RedisError as e:
+        logger.warning(f"Version diff cache unavailable: {e}")
+    return body
@@ -3,13 +3,32 @@ Version Service
 Business logic for presentation version history
 """
 import uuid
+from dataclasses import dataclass, field
+from typing import Any
 
-from sqlalchemy import func
-from sqlalchemy.orm import Session
+from sqlalchemy import delete, func, select
+from sqlalchemy.orm import Session, undefer
+from sqlalchemy.orm.attributes import set_committed_value
 
+from packages.common.core.config import settings
 from packages.common.models.presentation import Presentation
 from packages.common.models.presentation_version import PresentationVersion
 from packages.common.models.slide import Slide
+from packages.common.models.slide_body import SLIDE_BODY_FIELDS, SlideBody, normalize_slide_body
+from packages.common.schemas.websocket import MessageType
+from packages.common.services.load_profiles import LoadProfile
+from packages.common.services.presentation_events import presentation_changed
+from packages.common.services.presentation_mappers import SLIDE_COPY_FIELDS, bulk_insert
+from packages.common.services.presentation_service import load_presentation_slides
+from packages.common.services.slide_bodies import load_slide_bodies, stage_slide_bodies
+from packages.common.services.sync_service import slide_to_dict
+from packages.common.services.websocket_manager import publish_to_room
+from packages.common.services.version_snapshots import (
+    detach_dependents,
+    encode_next_version,
+    load_snapshot,
+    snapshot_hash,
+)
 from packages.common.schemas.presentation_version import (
     VersionCreate,
     VersionResponse,
@@ -17,133 +36,312 @@ from packages.common.schemas.presentation_version import (
 )
 
 
+# Presentation columns a snapshot captures (and restore writes back).
+# Slides capture SLIDE_COPY_FIELDS plus their id, which lets restore match
+# snapshot slides to the live ones.
+SNAPSHOT_PRESENTATION_FIELDS = ("topic", "theme_id", "visual_style", "wabi_sabi_layout", "view_mode")
+
+
+def build_snapshot(presentation: Presentation) -> dict[str, Any]:
+    """Current state of a presentation; slide bodies are referenced by hash"""
+    return {
+        **{field: getattr(presentation, field) for field in SNAPSHOT_PRESENTATION_FIELDS},
+        "slides": [
+            {"id": str(slide.id), **{field: getattr(slide, field) for field in SLIDE_COPY_FIELDS}}
+            for slide in presentation.slides
+        ],
+    }
+
+
 def create_version(
     db: Session,
     presentation: Presentation,
     data: VersionCreate,
+    autosave: bool = False,
 ) -> PresentationVersion:
     """
     Create a new version checkpoint for a presentation.
-    Captures the full state as a JSONB snapshot.
+    Captures the full state as a JSONB snapshot that points at slide bodies
+    by hash, so a checkpoint never copies slide content. The snapshot is
+    stored as a delta against the previous version unless it starts a new
+    keyframe chain (see version_snapshots).
+
+    autosave marks checkpoints taken by the autosave task, which
+    trim_autosaves keeps to AUTOSAVE_KEEP per presentation.
+
+    If nothing changed since the latest version, that version is returned
+    instead of writing a duplicate (see _reuse_version).
     """
-    # Get next version number
-    max_version = (
-        db.query(func.max(PresentationVersion.version_number))
-        .filter(PresentationVersion.presentation_id == presentation.id)
-        .scalar()
-        or 0
-    )
+    latest = db.scalars(
+        select(PresentationVersion)
+        .where(PresentationVersion.presentation_id == presentation.id)
+        .order_by(PresentationVersion.version_number.desc())
+        .limit(1)
+    ).first()
+    if latest is not None and latest.deck_version == presentation.deck_version:
+        # Nothing at all was written since: skip building the snapshot
+        unchanged = _reuse_version(db, latest, data, autosave)
+        if unchanged is not None:
+            return unchanged
 
-    # Create snapshot of current state
-    snapshot = {
-        "topic": presentation.topic,
-        "theme_id": presentation.theme_id,
-        "visual_style": presentation.visual_style,
-        "wabi_sabi_layout": presentation.wabi_sabi_layout,
-        "view_mode": presentation.view_mode,
-        "slides": [
-            {
-                "position": slide.position,
-                "title": slide.title,
-                "content": slide.content,
-                "speaker_notes": slide.speaker_notes,
-                "image_prompt": slide.image_prompt,
-                "image_url": slide.image_url,
-                "layout_type": slide.layout_type,
-                "alignment": slide.alignment,
-                "font_scale": slide.font_scale,
-                "layout_variant": slide.layout_variant,
-                "style_overrides": slide.style_overrides,
-            }
-            for slide in presentation.slides
-        ],
-    }
+    snapshot = build_snapshot(presentation)
+    content_hash = snapshot_hash(snapshot)
+    if latest is not None and latest.content_hash == content_hash:
+        unchanged = _reuse_version(db, latest, data, autosave)
+        if unchanged is not None:
+            return unchanged
 
+    version_number, stored, base_version_number = encode_next_version(db, presentation.id, snapshot)
     version = PresentationVersion(
         presentation_id=presentation.id,
-        version_number=max_version + 1,
+        version_number=version_number,
         label=data.label,
+        autosave=autosave,
         thumbnail_url=presentation.thumbnail_url,
-        snapshot=snapshot,
+        snapshot=stored,
+        base_version_number=base_version_number,
+        content_hash=content_hash,
+        deck_version=presentation.deck_version,
     )
     db.add(version)
     db.commit()
-    db.refresh(version)
     return version
 
 
+def _reuse_version(
+    db: Session,
+    latest: PresentationVersion,
+    data: VersionCreate,
+    autosave: bool,
+) -> PresentationVersion | None:
+    """
+    The latest version, standing in for a checkpoint of identical content,
+    or None if the request still needs a version of its own (a different
+    label than the one the latest version already has).
+
+    A manual checkpoint promotes an automatic one, so trim_autosaves keeps it.
+    """
+    if data.label is not None and latest.label not in (None, data.label):
+        return None
+    changed = False
+    if data.label is not None and latest.label is None:
+        latest.label = data.label
+        changed = True
+    if not autosave and latest.autosave:
+        latest.autosave = False
+        changed = True
+    if changed:
+        db.commit()
+    return latest
+
+
 def list_versions(
     db: Session,
     presentation_id: uuid.UUID,
+    before: int | None = None,
+    limit: int = 50,
 ) -> VersionListResponse:
-    """List all versions for a presentation, newest first"""
-    versions = (
-        db.query(PresentationVersion)
-        .filter(PresentationVersion.presentation_id == presentation_id)
+    """
+    List versions for a presentation, newest first.
+
+    Only metadata columns are selected, never snapshots. Pages are keyed on
+    version_number: pass the previous page's next_before to continue.
+    """
+    query = (
+        select(
+            PresentationVersion.id,
+            PresentationVersion.version_number,
+            PresentationVersion.label,
+            PresentationVersion.autosave,
+            PresentationVersion.thumbnail_url,
+            PresentationVersion.created_at,
+        )
+        .where(PresentationVersion.presentation_id == presentation_id)
         .order_by(PresentationVersion.version_number.desc())
-        .all()
+        .limit(limit + 1)
     )
+    if before is not None:
+        query = query.where(PresentationVersion.version_number < before)
+    rows = db.execute(query).all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
 
+    total = db.scalar(
+        select(func.count())
+        .select_from(PresentationVersion)
+        .where(PresentationVersion.presentation_id == presentation_id)
+    )
     return VersionListResponse(
-        items=[VersionResponse.model_validate(v) for v in versions],
-        total=len(versions),
+        items=[VersionResponse.model_validate(row) for row in rows],
+        total=total,
+        next_before=rows[-1].version_number if has_more else None,
     )
 
 
 def get_version(
     db: Session,
     version_id: uuid.UUID,
+    include_snapshot: bool = False,
 ) -> PresentationVersion | None:
-    """Get a specific version by ID"""
-    return (
-        db.query(PresentationVersion)
-        .filter(PresentationVersion.id == version_id)
-        .first()
-    )
+    """Get a specific version by ID (snapshot loaded only if asked for)"""
+    query = db.query(PresentationVersion).filter(PresentationVersion.id == version_id)
+    if include_snapshot:
+        query = query.options(undefer(PresentationVersion.snapshot))
+    return query.first()
+
+
+@dataclass
+class RestoreChanges:
+    """What restore_version changed, in the shape clients patch with"""
+
+    presentation: dict[str, Any] = field(default_factory=dict)
+    created: list[Slide] = field(default_factory=list)
+    updated: dict[uuid.UUID, dict[str, Any]] = field(default_factory=dict)
+    deleted: list[uuid.UUID] = field(default_factory=list)
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.presentation or self.created or self.updated or self.deleted)
+
+
+def _restore_targets(db: Session, snapshot: dict[str, Any]) -> list[dict[str, Any]]:
+    """Snapshot slides as column values, storing bodies of pre-body-store snapshots"""
+    targets = []
+    legacy = []
+    for slide_data in snapshot.get("slides", []):
+        target = {key: slide_data.get(key) for key in SLIDE_COPY_FIELDS}
+        target["position"] = target["position"] or 0
+        target["id"] = slide_data.get("id")
+        if "body_hash" not in slide_data:
+            # Snapshot taken before slide bodies were content-addressed
+            target.update({key: slide_data.get(key) for key in SLIDE_BODY_FIELDS})
+            legacy.append(target)
+        targets.append(target)
+    stage_slide_bodies(db, legacy)
+    return targets
+
+
+def _match_slides(
+    current: list[Slide], targets: list[dict[str, Any]]
+) -> tuple[list[tuple[dict[str, Any], Slide | None]], list[Slide]]:
+    """
+    Pair snapshot slides with live slides: by id where the snapshot recorded
+    one, then by position.
+
+    Returns:
+        ([(target, live slide or None)], unmatched live slides)
+    """
+    unmatched = {slide.id: slide for slide in current}
+    pairs: list[list] = []
+    for target in targets:
+        slide_id = uuid.UUID(target["id"]) if target["id"] else None
+        pairs.append([target, unmatched.pop(slide_id, None)])
+
+    by_position: dict[int, Slide] = {}
+    for slide in unmatched.values():
+        by_position.setdefault(slide.position, slide)
+    for pair in pairs:
+        if pair[1] is None and pair[0]["position"] in by_position:
+            pair[1] = by_position.pop(pair[0]["position"])
+            del unmatched[pair[1].id]
+    return [(target, slide) for target, slide in pairs], list(unmatched.values())
 
 
 def restore_version(
     db: Session,
     presentation: Presentation,
     version: PresentationVersion,
-) -> Presentation:
+    user_id: uuid.UUID | None = None,
+) -> RestoreChanges:
     """
     Restore a presentation to a specific version.
-    Replaces current state with the snapshot.
+
+    Diffs the snapshot against the live slides and writes only what
+    differs, in one transaction: unchanged slides keep their rows, version
+    and image task state; changed slides get their version bumped. The
+    change set is broadcast to the presentation room so connected clients
+    patch in place.
     """
-    snapshot = version.snapshot
+    snapshot = load_snapshot(db, version)
+    changes = RestoreChanges()
 
-    # Update presentation metadata
-    presentation.topic = snapshot.get("topic", presentation.topic)
-    presentation.theme_id = snapshot.get("theme_id")
-    presentation.visual_style = snapshot.get("visual_style")
-    presentation.wabi_sabi_layout = snapshot.get("wabi_sabi_layout")
-    presentation.view_mode = snapshot.get("view_mode")
+    for key in SNAPSHOT_PRESENTATION_FIELDS:
+        if key in snapshot and getattr(presentation, key) != snapshot[key]:
+            changes.presentation[key] = snapshot[key]
+    if "topic" in changes.presentation and not changes.presentation["topic"]:
+        del changes.presentation["topic"]
+    for key, value in changes.presentation.items():
+        setattr(presentation, key, value)
+    if changes.presentation:
+        presentation.version += 1
 
-    # Delete existing slides
-    db.query(Slide).filter(Slide.presentation_id == presentation.id).delete()
+    current = load_presentation_slides(db, presentation, LoadProfile.IMAGES)
+    pairs, removed = _match_slides(current, _restore_targets(db, snapshot))
 
-    # Recreate slides from snapshot
-    for slide_data in snapshot.get("slides", []):
-        slide = Slide(
-            presentation_id=presentation.id,
-            position=slide_data.get("position", 0),
-            title=slide_data.get("title"),
-            content=slide_data.get("content"),
-            speaker_notes=slide_data.get("speaker_notes"),
-            image_prompt=slide_data.get("image_prompt"),
-            image_url=slide_data.get("image_url"),
-            layout_type=slide_data.get("layout_type"),
-            alignment=slide_data.get("alignment"),
-            font_scale=slide_data.get("font_scale"),
-            layout_variant=slide_data.get("layout_variant"),
-            style_overrides=slide_data.get("style_overrides"),
-        )
-        db.add(slide)
+    for slide in removed:
+        db.delete(slide)
+        changes.deleted.append(slide.id)
+
+    new_rows = []
+    for target, slide in pairs:
+        values = {key: target[key] for key in SLIDE_COPY_FIELDS}
+        if slide is None:
+            new_rows.append({"presentation_id": presentation.id, **values})
+            continue
+        updated = {key: value for key, value in values.items() if getattr(slide, key) != value}
+        if updated:
+            for key, value in updated.items():
+                setattr(slide, key, value)
+            slide.version += 1
+            changes.updated[slide.id] = updated
+    changes.created = bulk_insert(db, Slide, new_rows)
+
+    slides = [slide for _, slide in pairs if slide is not None] + changes.created
+    set_committed_value(presentation, "slides", sorted(slides, key=lambda slide: slide.position))
 
     db.commit()
-    db.refresh(presentation)
-    return presentation
+    presentation_changed(presentation.id)
+    # deck_version is bumped by triggers on the slide statements
+    db.expire(presentation, ["deck_version"])
+    if not changes.is_empty:
+        publish_to_room(presentation.id, _restore_message(db, presentation, version, changes, user_id))
+    return changes
+
+
+def _restore_message(
+    db: Session,
+    presentation: Presentation,
+    version: PresentationVersion,
+    changes: RestoreChanges,
+    user_id: uuid.UUID | None,
+) -> dict[str, Any]:
+    """version:restored change set; bodies are sent expanded, not as hashes"""
+    load_slide_bodies(db, [
+        *(values.get("body_hash") for values in changes.updated.values()),
+        *(slide.body_hash for slide in changes.created),
+    ])
+    slide_versions = {slide.id: slide.version for slide in presentation.slides}
+
+    updated = []
+    for slide_id, values in changes.updated.items():
+        values = dict(values)
+        if "body_hash" in values:
+            body_hash = values.pop("body_hash")
+            body = db.get(SlideBody, body_hash) if body_hash is not None else None
+            values.update(normalize_slide_body(body.body if body is not None else {}))
+        updated.append({"slide_id": str(slide_id), "changes": values, "version": slide_versions[slide_id]})
+
+    return {
+        "type": MessageType.VERSION_RESTORED.value,
+        "version_number": version.version_number,
+        "presentation_changes": changes.presentation,
+        "presentation_version": presentation.version,
+        "created": [slide_to_dict(slide) for slide in changes.created],
+        "updated": updated,
+        "deleted": [str(slide_id) for slide_id in changes.deleted],
+        "slide_order": [str(slide.id) for slide in presentation.slides],
+        "updated_by": str(user_id) if user_id else None,
+    }
 
 
 def delete_version(
@@ -151,6 +349,37 @@ def delete_version(
     version: PresentationVersion,
 ) -> bool:
     """Delete a specific version"""
+    detach_dependents(db, [version])
     db.delete(version)
     db.commit()
     return True
+
+
+def trim_autosaves(db: Session, presentation_id: uuid.UUID) -> int:
+    """
+    Delete unlabeled automatic checkpoints beyond the newest AUTOSAVE_KEEP.
+    Manual and labeled versions are left to the retention policy.
+
+    Returns:
+        Number of versions deleted
+    """
+    expired = db.execute(
+        select(PresentationVersion.id, PresentationVersion.presentation_id, PresentationVersion.version_number)
+        .where(
+            PresentationVersion.presentation_id == presentation_id,
+            PresentationVersion.autosave.is_(True),
+            PresentationVersion.label.is_(None),
+        )
+        .order_by(PresentationVersion.version_number.desc())
+        .offset(settings.autosave_keep)
+    ).all()
+    if not expired:
+        return 0
+    detach_dependents(db, expired)
+    db.execute(
+        delete(PresentationVersion)
+        .where(PresentationVersion.id.in_([row.id for row in expired]))
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    return len(expired)
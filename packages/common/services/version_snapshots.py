@@ -0,0 +1,322 @@
+"""
+Version Snapshots Service
+Keyframe + delta encoding of presentation version snapshots
+
+A presentation's versions form chains: a keyframe holds the full snapshot
+and each following version holds only a JSON Patch (RFC 6902 add/remove/
+replace subset) against the version before it. Every
+VERSION_KEYFRAME_INTERVAL-th version starts a new chain, so reconstructing
+any version replays a bounded number of patches.
+
+- Keyframe: base_version_number NULL, snapshot is the full snapshot
+- Delta: base_version_number is the previous version, snapshot is {"ops": [...]}
+- Changed slides are patched as whole slide objects (position-only moves
+  patch just the position), so body_hash / image_storage_key values always
+  appear inside objects carrying that key; the body ref-count trigger and
+  the storage orphan reference check rely on this
+- Deleting a version first turns the delta that depends on it into a
+  keyframe; re-keyframing later re-encodes such histories (and ones written
+  before deltas existed) into short chains
+"""
+import copy
+import hashlib
+import uuid
+from collections.abc import Sequence
+from difflib import SequenceMatcher
+from typing import Any
+
+import orjson
+from sqlalchemy import func, or_, select, tuple_, update
+from sqlalchemy.orm import Session, undefer
+
+from packages.common.core.config import settings
+from packages.common.models.presentation_version import PresentationVersion
+
+Snapshot = dict[str, Any]
+PatchOp = dict[str, Any]
+
+
+# JSON Patch
+def _pointer(*parts: str | int) -> str:
+    return "".join("/" + str(part).replace("~", "~0").replace("/", "~1") for part in parts)
+
+
+def _parse_pointer(path: str) -> list[str]:
+    return [part.replace("~1", "/").replace("~0", "~") for part in path.split("/")[1:]]
+
+
+def snapshot_hash(snapshot: Snapshot) -> str:
+    """SHA-256 of a full snapshot, for spotting checkpoints that change nothing"""
+    return hashlib.sha256(orjson.dumps(snapshot, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+
+def _slide_key(slide: dict[str, Any]) -> bytes:
+    """Slide identity for matching, ignoring where it sits in the deck"""
+    return orjson.dumps({k: v for k, v in slide.items() if k != "position"}, option=orjson.OPT_SORT_KEYS)
+
+
+def diff_snapshots(old: Snapshot, new: Snapshot) -> list[PatchOp]:
+    """
+    JSON Patch turning old into new.
+
+    Top-level fields are replaced individually; slides are aligned so an
+    inserted, removed or moved slide does not rewrite the rest of the deck.
+    """
+    ops: list[PatchOp] = []
+    for key in new.keys() - {"slides"}:
+        if key not in old:
+            ops.append({"op": "add", "path": _pointer(key), "value": new[key]})
+        elif old[key] != new[key]:
+            ops.append({"op": "replace", "path": _pointer(key), "value": new[key]})
+    for key in old.keys() - new.keys() - {"slides"}:
+        ops.append({"op": "remove", "path": _pointer(key)})
+
+    old_slides = old.get("slides", [])
+    new_slides = new.get("slides", [])
+    matcher = SequenceMatcher(
+        None,
+        [_slide_key(slide) for slide in old_slides],
+        [_slide_key(slide) for slide in new_slides],
+        autojunk=False,
+    )
+    # Opcodes are applied left to right, so slides[:j1] already match new
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            for offset in range(i2 - i1):
+                old_position = old_slides[i1 + offset].get("position")
+                new_position = new_slides[j1 + offset].get("position")
+                if old_position != new_position:
+                    ops.append({
+                        "op": "replace",
+                        "path": _pointer("slides", j1 + offset, "position"),
+                        "value": new_position,
+                    })
+            continue
+        replaced = min(i2 - i1, j2 - j1) if tag == "replace" else 0
+        for offset in range(replaced):
+            ops.append({"op": "replace", "path": _pointer("slides", j1 + offset), "value": new_slides[j1 + offset]})
+        for _ in range(i2 - i1 - replaced):
+            ops.append({"op": "remove", "path": _pointer("slides", j1 + replaced)})
+        for offset in range(replaced, j2 - j1):
+            ops.append({"op": "add", "path": _pointer("slides", j1 + offset), "value": new_slides[j1 + offset]})
+    return ops
+
+
+def apply_snapshot_patch(snapshot: Snapshot, ops: list[PatchOp]) -> Snapshot:
+    """Apply a JSON Patch produced by diff_snapshots, returning a new snapshot"""
+    result = copy.deepcopy(snapshot)
+    for op in ops:
+        *parents, last = _parse_pointer(op["path"])
+        target: Any = result
+        for part in parents:
+            target = target[int(part)] if isinstance(target, list) else target[part]
+        if isinstance(target, list):
+            index = int(last)
+            if op["op"] == "add":
+                target.insert(index, op["value"])
+            elif op["op"] == "remove":
+                del target[index]
+            else:
+                target[index] = op["value"]
+        elif op["op"] == "remove":
+            del target[last]
+        else:
+            target[last] = op["value"]
+    return result
+
+
+# Chains
+def _chain(db: Session, presentation_id: uuid.UUID, version_number: int | None = None) -> list[PresentationVersion]:
+    """
+    Versions from the governing keyframe up to version_number (default:
+    the latest version), oldest first, in one query.
+    """
+    bounds = [PresentationVersion.presentation_id == presentation_id]
+    if version_number is not None:
+        bounds.append(PresentationVersion.version_number <= version_number)
+    keyframe = (
+        select(func.coalesce(func.max(PresentationVersion.version_number), 0))
+        .where(*bounds, PresentationVersion.base_version_number.is_(None))
+        .scalar_subquery()
+    )
+    return list(db.scalars(
+        select(PresentationVersion)
+        .options(undefer(PresentationVersion.snapshot))
+        .where(*bounds, PresentationVersion.version_number >= keyframe)
+        .order_by(PresentationVersion.version_number)
+    ))
+
+
+def _replay(chain: list[PresentationVersion]) -> Snapshot:
+    """Reconstruct the last snapshot of a chain"""
+    snapshot: Snapshot = {}
+    previous = None
+    for version in chain:
+        if version.base_version_number is None:
+            snapshot = version.snapshot
+        else:
+            if previous is None or version.base_version_number != previous.version_number:
+                raise ValueError(
+                    f"Broken version chain: v{version.version_number} of {version.presentation_id} "
+                    f"expects base v{version.base_version_number}"
+                )
+            snapshot = apply_snapshot_patch(snapshot, version.snapshot["ops"])
+        previous = version
+    return snapshot
+
+
+def load_snapshot(db: Session, version: PresentationVersion) -> Snapshot:
+    """Full snapshot of a version (keyframes are returned without a query)"""
+    if version.base_version_number is None:
+        return version.snapshot
+    return _replay(_chain(db, version.presentation_id, version.version_number))
+
+
+def _encode(previous: Snapshot | None, snapshot: Snapshot, depth: int) -> tuple[Snapshot, bool]:
+    """
+    Stored form of snapshot given the previous version's snapshot and the
+    position in the current chain.
+
+    Returns:
+        (stored snapshot, whether it is a delta)
+    """
+    if previous is None or depth >= settings.version_keyframe_interval:
+        return snapshot, False
+    delta = {"ops": diff_snapshots(previous, snapshot)}
+    # A rewrite of most of the deck is stored in full rather than as a patch
+    if len(orjson.dumps(delta)) >= len(orjson.dumps(snapshot)):
+        return snapshot, False
+    return delta, True
+
+
+def encode_next_version(
+    db: Session, presentation_id: uuid.UUID, snapshot: Snapshot
+) -> tuple[int, Snapshot, int | None]:
+    """
+    Encode snapshot as the presentation's next version.
+
+    Returns:
+        (version_number, stored snapshot, base_version_number)
+    """
+    chain = _chain(db, presentation_id)
+    if not chain:
+        return 1, snapshot, None
+    latest = chain[-1]
+    stored, is_delta = _encode(_replay(chain), snapshot, len(chain))
+    return latest.version_number + 1, stored, latest.version_number if is_delta else None
+
+
+def detach_dependents(db: Session, versions: Sequence[Any]) -> int:
+    """
+    Turn deltas based on versions about to be deleted into keyframes.
+
+    versions may be PresentationVersion objects or rows carrying id,
+    presentation_id and version_number. Dependents that are themselves being deleted are left alone. Call
+    before deleting, in the same transaction; the rewrite is flushed so the
+    replacement references are counted before the deleted ones are released.
+
+    Returns:
+        Number of versions rewritten
+    """
+    deleted_ids = {version.id for version in versions}
+    keys = {(version.presentation_id, version.version_number) for version in versions}
+    if not keys:
+        return 0
+    dependents = db.scalars(
+        select(PresentationVersion).options(undefer(PresentationVersion.snapshot)).where(
+            tuple_(PresentationVersion.presentation_id, PresentationVersion.base_version_number).in_(list(keys))
+        )
+    ).all()
+    rewritten = 0
+    for dependent in dependents:
+        if dependent.id in deleted_ids:
+            continue
+        dependent.snapshot = load_snapshot(db, dependent)
+        dependent.base_version_number = None
+        rewritten += 1
+    db.flush()
+    return rewritten
+
+
+# Re-keyframing
+def presentations_to_rekeyframe(db: Session, limit: int) -> list[uuid.UUID]:
+    """
+    Presentations whose history is poorly encoded: far more keyframes than
+    the interval calls for (histories written before deltas, or broken up
+    by deletions), or chains longer than the interval on average.
+
+    Histories that re-keyframing already encoded and that have not changed
+    since are skipped, since re-encoding would give the same result (small decks
+    whose deltas are never smaller than a snapshot stay all keyframes).
+    Histories that have been stable longest come first.
+    """
+    interval = settings.version_keyframe_interval
+    keyframes = func.count().filter(PresentationVersion.base_version_number.is_(None))
+    changed = func.count().filter(or_(
+        PresentationVersion.rekeyframed_at.is_(None),
+        PresentationVersion.updated_at > PresentationVersion.rekeyframed_at,
+    ))
+    return list(db.scalars(
+        select(PresentationVersion.presentation_id)
+        .group_by(PresentationVersion.presentation_id)
+        .having(
+            (changed > 0)
+            & ((keyframes > func.count() / interval + 1) | (func.count() > interval * keyframes))
+        )
+        .order_by(func.max(PresentationVersion.updated_at))
+        .limit(limit)
+    ))
+
+
+def rekeyframe_presentation(db: Session, presentation_id: uuid.UUID) -> int:
+    """
+    Re-encode a presentation's whole history into chains of
+    VERSION_KEYFRAME_INTERVAL versions. Does not commit.
+
+    Returns:
+        Number of versions rewritten
+    """
+    versions = db.scalars(
+        select(PresentationVersion)
+        .options(undefer(PresentationVersion.snapshot))
+        .where(PresentationVersion.presentation_id == presentation_id)
+        .order_by(PresentationVersion.version_number)
+        .with_for_update()
+    ).all()
+
+    # Reconstruct everything before rewriting anything
+    snapshots: list[Snapshot] = []
+    for version in versions:
+        if version.base_version_number is None:
+            snapshots.append(version.snapshot)
+        else:
+            snapshots.append(apply_snapshot_patch(snapshots[-1], version.snapshot["ops"]))
+
+    rewritten = 0
+    depth = 0
+    for index, version in enumerate(versions):
+        previous = snapshots[index - 1] if index else None
+        stored, is_delta = _encode(previous, snapshots[index], depth)
+        depth = depth + 1 if is_delta else 1
+        base = versions[index - 1].version_number if is_delta else None
+        if base != version.base_version_number or stored != version.snapshot:
+            version.snapshot = stored
+            version.base_version_number = base
+            rewritten += 1
+    db.flush()
+
+    # Stamp the history as encoded; rows rewritten above share now() with
+    # the stamp, so only later changes make it a candidate again
+    db.execute(
+        update(PresentationVersion)
+        .where(
+            PresentationVersion.presentation_id == presentation_id,
+            or_(
+                PresentationVersion.rekeyframed_at.is_(None),
+                PresentationVersion.updated_at > PresentationVersion.rekeyframed_at,
+            ),
+        )
+        .values(rekeyframed_at=func.now(), updated_at=func.now())
+        .execution_options(synchronize_session=False)
+    )
+    return rewritten
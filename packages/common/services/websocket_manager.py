@@ -4,20 +4,39 @@ Manages WebSocket connections grouped by presentation (rooms)
 Supports horizontal scaling via Redis pub/sub
 """
 import asyncio
-import json
 import logging
 from dataclasses import dataclass, field
 from typing import Callable, Awaitable
 from uuid import UUID
 
 from fastapi import WebSocket
+import redis
 import redis.asyncio as aioredis
 
 from packages.common.core.config import settings
+from packages.common.core.redis_client import get_redis
+from packages.common.core.serialization import dumps, dumps_str, loads
+from packages.common.services.autosave_service import flush_autosave
 
 logger = logging.getLogger(__name__)
 
 
+def _channel_name(presentation_id: UUID) -> str:
+    """Redis channel for a presentation room"""
+    return f"presentation:{presentation_id}:sync"
+
+
+def _routed_message(presentation_id: UUID, message: dict, exclude_user_id: UUID | None) -> dict:
+    """Message with the routing metadata the Redis listener strips off"""
+    routed = {
+        **message,
+        "_presentation_id": str(presentation_id),
+    }
+    if exclude_user_id:
+        routed["_exclude_user_id"] = str(exclude_user_id)
+    return routed
+
+
 @dataclass
 class UserConnection:
     """Information about a connected user"""
@@ -125,7 +144,7 @@ class ConnectionManager:
 
     def _get_channel_name(self, presentation_id: UUID) -> str:
         """Get Redis channel name for a presentation"""
-        return f"presentation:{presentation_id}:sync"
+        return _channel_name(presentation_id)
 
     async def connect(
         self,
@@ -200,6 +219,7 @@ class ConnectionManager:
                 # Unsubscribe from Redis channel
                 channel = self._get_channel_name(presentation_id)
                 await self.pubsub.unsubscribe(channel)
+                await self._flush_autosave_if_room_empty(presentation_id, channel)
             else:
                 # Broadcast leave event
                 await self.broadcast_to_room(
@@ -219,6 +239,22 @@ class ConnectionManager:
 
         logger.info(f"User {user_id} disconnected from presentation {presentation_id}")
 
+    async def _flush_autosave_if_room_empty(self, presentation_id: UUID, channel: str) -> None:
+        """
+        Checkpoint pending edits once nobody is left in the room on any
+        instance (every instance with a connection subscribes to the channel).
+        If the count still includes this instance's unsubscribe, the idle
+        checkpoint covers the edits instead.
+        """
+        try:
+            [(_, subscribers)] = await self.redis_pub.pubsub_numsub(channel)
+        except redis.RedisError as e:
+            logger.warning(f"Autosave flush skipped for {presentation_id}: {e}")
+            return
+        if subscribers == 0:
+            # Sync Redis client and Celery send_task: keep them off the event loop
+            await asyncio.to_thread(flush_autosave, presentation_id)
+
     async def broadcast_to_room(
         self,
         presentation_id: UUID,
@@ -230,16 +266,11 @@ class ConnectionManager:
         Uses Redis pub/sub for cross-instance broadcasting.
         """
         # Add metadata for routing
-        broadcast_message = {
-            **message,
-            "_presentation_id": str(presentation_id),
-        }
-        if exclude_user_id:
-            broadcast_message["_exclude_user_id"] = str(exclude_user_id)
+        broadcast_message = _routed_message(presentation_id, message, exclude_user_id)
 
         # Publish to Redis (all instances will receive)
         channel = self._get_channel_name(presentation_id)
-        await self.redis_pub.publish(channel, json.dumps(broadcast_message))
+        await self.redis_pub.publish(channel, dumps(broadcast_message))
 
     async def send_to_user(
         self,
@@ -257,7 +288,7 @@ class ConnectionManager:
 
         websocket = room.connections[user_id]
         try:
-            await websocket.send_json(message)
+            await websocket.send_text(dumps_str(message))
         except Exception as e:
             logger.error(f"Error sending to user {user_id}: {e}")
 
@@ -273,13 +304,14 @@ class ConnectionManager:
 
         room = self.rooms[presentation_id]
         disconnected_users = []
+        payload = dumps_str(message)  # Encode once for the whole room
 
         for user_id, websocket in room.connections.items():
             if exclude_user_id and user_id == exclude_user_id:
                 continue
 
             try:
-                await websocket.send_json(message)
+                await websocket.send_text(payload)
             except Exception as e:
                 logger.error(f"Error sending to user {user_id}: {e}")
                 disconnected_users.append(user_id)
@@ -297,7 +329,7 @@ class ConnectionManager:
             async for message in self.pubsub.listen():
                 if message["type"] == "message":
                     try:
-                        data = json.loads(message["data"])
+                        data = loads(message["data"])
 
                         # Extract routing metadata
                         presentation_id = UUID(data.pop("_presentation_id"))
@@ -331,3 +363,22 @@ class ConnectionManager:
 
 # Singleton instance
 connection_manager = ConnectionManager()
+
+
+def publish_to_room(
+    presentation_id: UUID,
+    message: dict,
+    exclude_user_id: UUID | None = None,
+) -> None:
+    """
+    Broadcast to a presentation room from synchronous code (request
+    handlers, Celery tasks) over the channel every instance listens on.
+    Delivery is best effort: a Redis outage is logged, not raised.
+    """
+    try:
+        get_redis().publish(
+            _channel_name(presentation_id),
+            dumps(_routed_message(presentation_id, message, exclude_user_id)),
+        )
+    except redis.RedisError as e:
+        logger.warning(f"Failed to publish to presentation room {presentation_id}: {e}")
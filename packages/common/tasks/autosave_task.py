@@ -0,0 +1,80 @@
+"""
+Autosave Celery Tasks
+
+Takes automatic version checkpoints off the request path:
+- Queued by record_edit() (via presentation_changed) for the first edit
+  after a checkpoint, and by flush_autosave() when a room empties
+- Re-queues itself while edits keep coming, so a burst of edits becomes one
+  checkpoint (see services/autosave_service.py)
+- Trims automatic checkpoints to AUTOSAVE_KEEP per presentation
+"""
+import logging
+import time
+import uuid
+
+import redis
+from celery import shared_task
+
+from packages.common.core.database import get_db_context
+from packages.common.schemas.presentation_version import VersionCreate
+from packages.common.services import autosave_service
+from packages.common.services.autosave_service import AUTOSAVE_TASK_NAME
+from packages.common.services.load_profiles import LoadProfile
+from packages.common.services.presentation_service import IMPORT_IN_PROGRESS, get_presentation_by_id
+from packages.common.services.version_service import create_version, trim_autosaves
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(
+    name=AUTOSAVE_TASK_NAME,
+    autoretry_for=(ConnectionError, TimeoutError),
+    retry_backoff=True,
+    max_retries=3,
+)
+def autosave_checkpoint(presentation_id: str, force: bool = False) -> dict:
+    """
+    Checkpoint a presentation if its pending edits are due.
+
+    Args:
+        presentation_id: UUID of the presentation
+        force: Checkpoint pending edits without waiting for them to be due
+
+    Returns:
+        dict with keys: presentation_id, version_number (None if no
+        checkpoint was taken), edits, trimmed
+    """
+    result = {"presentation_id": presentation_id, "version_number": None, "edits": 0, "trimmed": 0}
+    try:
+        activity = autosave_service.peek_activity(presentation_id)
+        if activity is not None and not force:
+            wait = activity.seconds_until_due(time.time())
+            if wait > 0:
+                autosave_service.reschedule(presentation_id, wait)
+                return result
+        activity = autosave_service.claim_activity(presentation_id)
+    except redis.RedisError as e:
+        logger.warning(f"Autosave skipped for {presentation_id}: {e}")
+        return result
+
+    try:
+        if activity is not None:
+            result["edits"] = activity.edits
+            with get_db_context() as db:
+                presentation = get_presentation_by_id(db, uuid.UUID(presentation_id), profile=LoadProfile.IMAGES)
+                # Imports finish with their own committed state; checkpoint after
+                if presentation is not None and presentation.import_status != IMPORT_IN_PROGRESS:
+                    version = create_version(db, presentation, VersionCreate(), autosave=True)
+                    result["version_number"] = version.version_number
+                    result["trimmed"] = trim_autosaves(db, presentation.id)
+    except Exception:
+        # The claimed edits were not checkpointed; mark them pending again
+        autosave_service.record_edit(presentation_id)
+        raise
+    finally:
+        try:
+            autosave_service.release(presentation_id)
+        except redis.RedisError as e:
+            logger.warning(f"Autosave release failed for {presentation_id}: {e}")
+
+    return result
@@ -16,6 +16,7 @@ from celery.exceptions import MaxRetriesExceededError
 from packages.common.core.database import get_db_context
 from packages.common.services.beautify_service import (
     process_pptx_file,
+    release_session_images,
     update_session_status,
 )
 
@@ -130,8 +131,8 @@ def cleanup_expired_sessions(max_age_hours: int = 24) -> dict:
             BeautifySession.status.in_(["error", "uploading"]),  # Only cleanup failed/stale
         ).all()
 
+        release_session_images(db, old_sessions)
         for session in old_sessions:
-            # TODO: Delete stored files if using cloud storage
             db.delete(session)
             deleted_count += 1
 
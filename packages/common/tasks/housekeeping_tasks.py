@@ -0,0 +1,58 @@
+"""
+Housekeeping Celery Tasks
+
+Scheduled by Celery beat (see core/celery_app.py):
+- Deletes orphaned storage objects once nothing references them
+- Applies the version retention policy
+- Re-encodes version histories into keyframe + delta chains
+- Garbage-collects unreferenced slide bodies
+- VACUUMs the compacted tables when they have accumulated dead tuples
+"""
+import logging
+
+from celery import shared_task
+
+from packages.common.core.database import engine, get_db_context
+from packages.common.providers.provider_factory import get_image_storage_provider
+from packages.common.services.housekeeping_service import (
+    StageStats,
+    prune_slide_bodies,
+    prune_storage_orphans,
+    prune_versions,
+    rekeyframe_versions,
+    vacuum_tables,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(
+    bind=True,
+    name="packages.common.tasks.housekeeping_tasks.compact_storage",
+)
+def compact_storage(self) -> dict:
+    """
+    Run every compaction stage once, in bounded batches.
+
+    Progress is published as PROGRESS task state after each batch.
+
+    Returns:
+        dict mapping stage -> counters, plus the list of vacuumed tables
+    """
+    report: dict = {}
+
+    def on_progress(stage: str, stats: StageStats) -> None:
+        report[stage] = stats.as_dict()
+        self.update_state(state="PROGRESS", meta=report)
+
+    with get_db_context() as db:
+        report["storage_orphans"] = prune_storage_orphans(db, get_image_storage_provider(), on_progress).as_dict()
+        # Versions first: pruning them releases slide body references
+        report["versions"] = prune_versions(db, on_progress).as_dict()
+        report["rekeyframe"] = rekeyframe_versions(db, on_progress).as_dict()
+        report["slide_bodies"] = prune_slide_bodies(db, on_progress).as_dict()
+
+    report["vacuumed"] = vacuum_tables(engine)
+
+    logger.info(f"Housekeeping compaction finished: {report}", extra={"housekeeping": report})
+    return report
@@ -17,6 +17,7 @@ from packages.common.core.config import settings
 from packages.common.core.database import get_db_context
 from packages.common.models.slide import Slide
 from packages.common.providers.provider_factory import get_image_storage_provider
+from packages.common.services.presentation_events import presentation_changed
 
 logger = logging.getLogger(__name__)
 
@@ -154,6 +155,7 @@ def generate_slide_image(
                 slide.image_storage_key = storage_key
                 slide.image_task_id = None  # Clear task ID on completion
                 db.commit()
+                presentation_changed(presentation_id)
                 logger.info(f"Slide {slide_id} updated with image URL")
 
         return {
@@ -214,6 +216,7 @@ def generate_batch_images(
                 slide.image_task_id = task.id
                 db.commit()
 
+    presentation_changed(presentation_id)
     logger.info(f"Dispatched {len(task_ids)} image generation tasks for presentation {presentation_id}")
 
     return task_ids
@@ -0,0 +1,92 @@
+"""
+Thumbnail Celery Tasks
+
+Renders a presentation's first slide to a small WebP/PNG for the dashboard:
+- Queued (debounced) by presentation_changed() after committed edits
+- Skips the render when the first slide's fingerprint is unchanged
+- Uploads through the configured storage provider
+"""
+import asyncio
+import logging
+import uuid
+
+from celery import shared_task
+from sqlalchemy import select
+
+from packages.common.core.database import get_db_context
+from packages.common.models.presentation import Presentation
+from packages.common.models.slide import Slide
+from packages.common.providers.provider_factory import get_image_storage_provider
+from packages.common.services.load_profiles import LoadProfile, slide_load_options
+from packages.common.services.presentation_cache import invalidate_presentation
+from packages.common.services.thumbnail_service import (
+    THUMBNAIL_TASK_NAME,
+    ThumbnailSource,
+    is_generated_thumbnail,
+    render_thumbnail,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(
+    name=THUMBNAIL_TASK_NAME,
+    autoretry_for=(ConnectionError, TimeoutError),
+    retry_backoff=True,
+    max_retries=3,
+)
+def render_presentation_thumbnail(presentation_id: str) -> dict:
+    """
+    Render and store the thumbnail for a presentation.
+
+    Args:
+        presentation_id: UUID of the presentation
+
+    Returns:
+        dict with keys: presentation_id, thumbnail_url, rendered
+    """
+    with get_db_context() as db:
+        presentation = db.get(Presentation, uuid.UUID(presentation_id))
+        if presentation is None:
+            return {"presentation_id": presentation_id, "thumbnail_url": None, "rendered": False}
+
+        if presentation.thumbnail_url and not is_generated_thumbnail(presentation.thumbnail_url):
+            # A user- or template-supplied thumbnail wins over a rendered one
+            return {"presentation_id": presentation_id, "thumbnail_url": presentation.thumbnail_url, "rendered": False}
+
+        first_slide = db.scalars(
+            select(Slide)
+            .options(*slide_load_options(LoadProfile.IMAGES))
+            .where(Slide.presentation_id == presentation.id)
+            .order_by(Slide.position)
+            .limit(1)
+        ).first()
+
+        source = ThumbnailSource(
+            presentation_id=presentation.id,
+            title=(first_slide.title if first_slide else None) or presentation.topic or "",
+            layout_type=first_slide.layout_type if first_slide else None,
+            image_url=first_slide.image_url if first_slide else None,
+        )
+        storage_key = source.storage_key()
+
+        if presentation.thumbnail_url and presentation.thumbnail_url.endswith(storage_key):
+            return {"presentation_id": presentation_id, "thumbnail_url": presentation.thumbnail_url, "rendered": False}
+
+    # Render and upload outside the session so no connection is held meanwhile
+    storage = get_image_storage_provider()
+    image_bytes, content_type = render_thumbnail(source, storage.owns_url)
+    thumbnail_url = asyncio.run(storage.upload(storage_key, image_bytes, content_type))
+
+    with get_db_context() as db:
+        presentation = db.get(Presentation, uuid.UUID(presentation_id))
+        if presentation is None:
+            return {"presentation_id": presentation_id, "thumbnail_url": None, "rendered": False}
+        presentation.thumbnail_url = thumbnail_url
+        db.commit()
+
+    # Cache only: re-scheduling here would render again for our own write
+    invalidate_presentation(presentation_id)
+    logger.info(f"Thumbnail rendered for presentation {presentation_id}: {storage_key}")
+
+    return {"presentation_id": presentation_id, "thumbnail_url": thumbnail_url, "rendered": True}
@@ -10,6 +10,7 @@ export interface Version {
   id: string;
   versionNumber: number;
   label: string | null;
+  autosave: boolean;
   thumbnailUrl: string | null;
   createdAt: string;
 }
@@ -18,11 +19,38 @@ export interface VersionDetail extends Version {
   snapshot: Record<string, unknown>;
 }
 
+export interface FieldChange {
+  old: unknown;
+  new: unknown;
+}
+
+export interface SlideDiff {
+  status: 'added' | 'removed' | 'modified' | 'moved';
+  slideId: string | null;
+  title: string | null;
+  oldPosition: number | null;
+  newPosition: number | null;
+  moved: boolean;
+  changes: Record<string, FieldChange>;
+}
+
+export interface VersionDiff {
+  fromVersion: number;
+  toVersion: number;
+  presentation: Record<string, FieldChange>;
+  slides: SlideDiff[];
+  added: number;
+  removed: number;
+  modified: number;
+  moved: number;
+}
+
 // Backend types (snake_case)
 interface BackendVersion {
   id: string;
   version_number: number;
   label: string | null;
+  autosave: boolean;
   thumbnail_url: string | null;
   created_at: string;
 }
@@ -34,6 +62,28 @@ interface BackendVersionDetail extends BackendVersion {
 interface BackendVersionListResponse {
   items: BackendVersion[];
   total: number;
+  next_before: number | null;
+}
+
+interface BackendSlideDiff {
+  status: SlideDiff['status'];
+  slide_id: string | null;
+  title: string | null;
+  old_position: number | null;
+  new_position: number | null;
+  moved: boolean;
+  changes: Record<string, FieldChange>;
+}
+
+interface BackendVersionDiff {
+  from_version: number;
+  to_version: number;
+  presentation: Record<string, FieldChange>;
+  slides: BackendSlideDiff[];
+  added: number;
+  removed: number;
+  modified: number;
+  moved: number;
 }
 
 // ============ Conversion Helpers ============
@@ -42,6 +92,7 @@ const backendToFrontend = (v: BackendVersion): Version => ({
   id: v.id,
   versionNumber: v.version_number,
   label: v.label,
+  autosave: v.autosave,
   thumbnailUrl: v.thumbnail_url,
   createdAt: v.created_at,
 });
@@ -51,16 +102,43 @@ const backendDetailToFrontend = (v: BackendVersionDetail): VersionDetail => ({
   snapshot: v.snapshot,
 });
 
+const backendDiffToFrontend = (d: BackendVersionDiff): VersionDiff => ({
+  fromVersion: d.from_version,
+  toVersion: d.to_version,
+  presentation: d.presentation,
+  slides: d.slides.map((s) => ({
+    status: s.status,
+    slideId: s.slide_id,
+    title: s.title,
+    oldPosition: s.old_position,
+    newPosition: s.new_position,
+    moved: s.moved,
+    changes: s.changes,
+  })),
+  added: d.added,
+  removed: d.removed,
+  modified: d.modified,
+  moved: d.moved,
+});
+
 // ============ API Calls ============
 
 /**
- * List all versions for a presentation
+ * List all versions for a presentation (metadata only), following
+ * the version_number-keyed pages newest first
  */
 export const listVersions = async (presentationId: string): Promise<Version[]> => {
-  const response = await api.get<BackendVersionListResponse>(
-    `/api/v1/presentations/${presentationId}/versions`
-  );
-  return response.items.map(backendToFrontend);
+  const versions: Version[] = [];
+  let before: number | null = null;
+  do {
+    const query: string = before === null ? '' : `?before=${before}`;
+    const response: BackendVersionListResponse = await api.get<BackendVersionListResponse>(
+      `/api/v1/presentations/${presentationId}/versions${query}`
+    );
+    versions.push(...response.items.map(backendToFrontend));
+    before = response.next_before;
+  } while (before !== null);
+  return versions;
 };
 
 /**
@@ -90,6 +168,20 @@ export const getVersionDetail = async (
   return backendDetailToFrontend(response);
 };
 
+/**
+ * Slide- and field-level changes from one version to another
+ */
+export const diffVersions = async (
+  presentationId: string,
+  fromVersionId: string,
+  toVersionId: string
+): Promise<VersionDiff> => {
+  const response = await api.get<BackendVersionDiff>(
+    `/api/v1/presentations/${presentationId}/versions/${fromVersionId}/diff/${toVersionId}`
+  );
+  return backendDiffToFrontend(response);
+};
+
 /**
  * Restore presentation to a specific version
  */
@@ -114,6 +206,7 @@ export default {
   listVersions,
   createVersion,
   getVersionDetail,
+  diffVersions,
   restoreVersion,
   deleteVersion,
 };
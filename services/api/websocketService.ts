@@ -30,7 +30,8 @@ export type MessageType =
   | 'error'
   | 'image:generating'
   | 'image:completed'
-  | 'image:failed';
+  | 'image:failed'
+  | 'version:restored';
 
 export interface WebSocketMessage {
   type: MessageType;
@@ -375,6 +376,36 @@ class WebSocketService {
         break;
       }
 
+      case 'version:restored': {
+        // Compact change set: patch slides in place, then apply the final order
+        this.queryClient.setQueryData(presentationKey, (old: Presentation | undefined) => {
+          if (!old) return old;
+          const deleted = new Set(message.deleted as string[]);
+          const updates = new Map(
+            (message.updated as Array<{ slide_id: string; changes: Record<string, unknown> }>)
+              .map(u => [u.slide_id, u.changes])
+          );
+          const slideMap = new Map(
+            old.slides
+              .filter(slide => !deleted.has(slide.id))
+              .map(slide => {
+                const changes = updates.get(slide.id);
+                return [slide.id, changes ? { ...slide, ...this.convertSlideChangesFromBackend(changes) } : slide];
+              })
+          );
+          (message.created as Record<string, unknown>[]).forEach(created => {
+            const slide = this.convertSlideFromBackend(created);
+            slideMap.set(slide.id, slide);
+          });
+          const slides = (message.slide_order as string[])
+            .map(id => slideMap.get(id))
+            .filter((s): s is Slide => s !== undefined);
+          const changes = message.presentation_changes as Record<string, unknown>;
+          return { ...old, ...this.convertPresentationChangesFromBackend(changes), slides };
+        });
+        break;
+      }
+
       case 'image:failed': {
         this.queryClient.setQueryData(presentationKey, (old: Presentation | undefined) => {
           if (!old) return old;
@@ -470,6 +501,12 @@ class WebSocketService {
     if (changes.alignment !== undefined) result.alignment = changes.alignment as Slide['alignment'];
     if (changes.font_scale !== undefined) result.fontScale = changes.font_scale as Slide['fontScale'];
     if (changes.layout_variant !== undefined) result.layoutVariant = changes.layout_variant as Slide['layoutVariant'];
+    if (changes.style_overrides !== undefined) {
+      const styles = changes.style_overrides as Record<string, unknown> | null;
+      result.textStyles = styles?.textStyles as Slide['textStyles'];
+      result.imageStyles = styles?.imageStyles as Slide['imageStyles'];
+      result.contentItemStyles = styles?.contentItemStyles as Slide['contentItemStyles'];
+    }
     return result;
   }
 
@@ -0,0 +1,73 @@
+"""
+Integration test fixtures
+Sessions against the configured PostgreSQL database (DATABASE_URL)
+
+Each test runs inside one outer transaction that is rolled back afterwards;
+service-level commits only release savepoints, so nothing is persisted.
+Tests are skipped when the database is not reachable. Apply migrations
+first (make migrate), since triggers are part of the schema under test.
+"""
+import uuid
+from collections.abc import Generator
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from packages.common.core.database import SessionLocal, engine
+from packages.common.models.user import User
+
+
+class StatementLog:
+    """SQL statements sent to the database, without savepoint bookkeeping"""
+
+    def __init__(self) -> None:
+        self.statements: list[str] = []
+
+    def __len__(self) -> int:
+        return len(self.statements)
+
+    def clear(self) -> None:
+        self.statements.clear()
+
+    def record(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        if not statement.lstrip().upper().startswith(("SAVEPOINT", "RELEASE SAVEPOINT", "ROLLBACK TO SAVEPOINT")):
+            self.statements.append(statement)
+
+
+@pytest.fixture
+def db() -> Generator[Session, None, None]:
+    """Session whose commits are rolled back when the test ends"""
+    try:
+        connection = engine.connect()
+    except OperationalError as e:
+        pytest.skip(f"PostgreSQL not available: {e}")
+    transaction = connection.begin()
+    session = SessionLocal(bind=connection, join_transaction_mode="create_savepoint")
+    try:
+        yield session
+    finally:
+        session.close()
+        transaction.rollback()
+        connection.close()
+
+
+@pytest.fixture
+def statements(db: Session) -> Generator[StatementLog, None, None]:
+    """Statements executed on the test session's connection"""
+    log = StatementLog()
+    connection = db.connection()
+    event.listen(connection, "before_cursor_execute", log.record)
+    try:
+        yield log
+    finally:
+        event.remove(connection, "before_cursor_execute", log.record)
+
+
+@pytest.fixture
+def user(db: Session) -> User:
+    user = User(email=f"test-{uuid.uuid4().hex[:12]}@example.com", name="Test User")
+    db.add(user)
+    db.commit()
+    return user
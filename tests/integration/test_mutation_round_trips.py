@@ -0,0 +1,75 @@
+"""
+Round trips per simple mutation
+
+With eager_defaults, server-generated columns come back via RETURNING, so a
+simple edit is one statement plus the commit; reading the timestamps and
+counters afterwards must not need a refresh.
+"""
+import pytest
+from sqlalchemy.orm import Session
+
+from packages.common.models.user import User
+from packages.common.schemas.presentation import (
+    PresentationCreate,
+    PresentationUpdate,
+    SlideCreate,
+    SlideUpdate,
+)
+from packages.common.services import presentation_service
+from packages.common.services.load_profiles import LoadProfile
+
+
+@pytest.fixture(autouse=True)
+def no_side_effects(monkeypatch) -> None:
+    """Cache invalidation, autosave and thumbnails talk to Redis/Celery, not SQL"""
+    monkeypatch.setattr(presentation_service, "presentation_changed", lambda presentation_id: None)
+    monkeypatch.setattr(presentation_service, "schedule_thumbnail", lambda presentation_id: None)
+
+
+@pytest.fixture
+def presentation(db: Session, user: User):
+    created = presentation_service.create_presentation(
+        db, user, PresentationCreate(topic="Round trips", slides=[SlideCreate(title="First", position=0)])
+    )
+    # Inserting the slides bumped deck_version after the row came back
+    db.expire(created)
+    return presentation_service.get_presentation_by_id(db, created.id, profile=LoadProfile.FULL)
+
+
+def test_update_presentation_is_one_statement(db, statements, presentation):
+    deck_version, updated_at = presentation.deck_version, presentation.updated_at
+    statements.clear()
+    updated = presentation_service.update_presentation(db, presentation, PresentationUpdate(topic="Renamed"))
+    assert len(statements) == 1, statements.statements
+    assert statements.statements[0].lstrip().upper().startswith("UPDATE")
+
+    # Trigger-bumped and server-set values came back with the UPDATE
+    assert updated.deck_version == deck_version + 1
+    assert updated.updated_at >= updated_at
+    assert len(statements) == 1, statements.statements
+
+
+def test_update_slide_is_one_statement(db, statements, presentation):
+    slide = presentation.slides[0]
+    version, updated_at = slide.version, slide.updated_at
+    statements.clear()
+    updated = presentation_service.update_slide(db, slide, SlideUpdate(title="Retitled"))
+    assert len(statements) == 1, statements.statements
+    assert statements.statements[0].lstrip().upper().startswith("UPDATE")
+
+    assert updated.version == version
+    assert updated.updated_at >= updated_at
+    assert len(statements) == 1, statements.statements
+
+
+def test_add_slide_is_one_statement(db, statements, presentation):
+    statements.clear()
+    slide = presentation_service.add_slide(db, presentation, SlideCreate(title="Second", position=1))
+    assert len(statements) == 1, statements.statements
+    assert statements.statements[0].lstrip().upper().startswith("INSERT")
+
+    assert slide.id is not None
+    assert slide.created_at is not None
+    assert slide.updated_at is not None
+    assert slide.version == 1
+    assert len(statements) == 1, statements.statements
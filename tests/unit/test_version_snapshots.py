@@ -0,0 +1,100 @@
+"""
+Snapshot delta round trips
+
+apply_snapshot_patch(old, diff_snapshots(old, new)) must rebuild new
+exactly for any pair of snapshots, since versions are stored as these
+patches and never re-checked against the original.
+"""
+import copy
+import random
+
+import pytest
+
+from packages.common.services.version_snapshots import apply_snapshot_patch, diff_snapshots
+
+SEED_COUNT = 3000
+
+
+def _slide(rng: random.Random) -> dict:
+    slide = {
+        "id": f"slide-{rng.randrange(12)}",
+        "title": rng.choice(["Intro", "Agenda", "Results", "Q&A", None]),
+        "body_hash": rng.choice([None, "a" * 64, "b" * 64, "c" * 64]),
+        "layout_type": rng.choice(["split", "statement", "horizontal"]),
+    }
+    if rng.random() < 0.3:
+        slide["image_storage_key"] = f"presentations/p/slide-{rng.randrange(4)}.png"
+    if rng.random() < 0.2:
+        slide["title"] = "with/slash ~tilde"
+    return slide
+
+
+def _snapshot(rng: random.Random) -> dict:
+    snapshot = {
+        "topic": rng.choice(["Deck", "Deck v2", "Quarterly"]),
+        "theme_id": rng.choice(["minimal", "bold"]),
+        "slides": [_slide(rng) for _ in range(rng.randrange(8))],
+    }
+    if rng.random() < 0.3:
+        snapshot["visual_style"] = rng.choice(["clean", "retro"])
+    return snapshot
+
+
+def _edit(rng: random.Random, snapshot: dict) -> dict:
+    """A plausible next version: moved, inserted, removed and edited slides"""
+    edited = copy.deepcopy(snapshot)
+    slides = edited["slides"]
+    for _ in range(rng.randrange(4)):
+        action = rng.choice(["insert", "remove", "move", "edit", "field"])
+        if action == "insert":
+            slides.insert(rng.randrange(len(slides) + 1), _slide(rng))
+        elif action == "remove" and slides:
+            del slides[rng.randrange(len(slides))]
+        elif action == "move" and slides:
+            slides.insert(rng.randrange(len(slides)), slides.pop(rng.randrange(len(slides))))
+        elif action == "edit" and slides:
+            rng.choice(slides)["title"] = rng.choice(["Edited", None, "Intro"])
+        elif action == "field":
+            if "visual_style" in edited and rng.random() < 0.5:
+                del edited["visual_style"]
+            else:
+                edited[rng.choice(["topic", "visual_style"])] = rng.choice(["Renamed", "clean"])
+    return edited
+
+
+def _with_positions(snapshot: dict) -> dict:
+    for position, slide in enumerate(snapshot["slides"]):
+        slide["position"] = position
+    return snapshot
+
+
+@pytest.mark.parametrize("related", [True, False], ids=["edited", "unrelated"])
+def test_patch_rebuilds_new_snapshot(related):
+    rng = random.Random(41 + related)
+    for _ in range(SEED_COUNT):
+        old = _with_positions(_snapshot(rng))
+        new = _with_positions(_edit(rng, old) if related else _snapshot(rng))
+        original = copy.deepcopy(old)
+
+        ops = diff_snapshots(old, new)
+
+        assert apply_snapshot_patch(old, ops) == new, (old, new, ops)
+        assert old == original, "apply_snapshot_patch must not modify its input"
+
+
+def test_identical_snapshots_need_no_ops():
+    rng = random.Random(7)
+    snapshot = _with_positions(_snapshot(rng))
+    assert diff_snapshots(snapshot, copy.deepcopy(snapshot)) == []
+
+
+def test_moved_slide_is_not_rewritten_around():
+    slides = [{"id": str(i), "title": f"Slide {i}", "body_hash": None} for i in range(6)]
+    old = _with_positions({"topic": "Deck", "slides": copy.deepcopy(slides)})
+    new = _with_positions({"topic": "Deck", "slides": slides[1:] + slides[:1]})
+
+    ops = diff_snapshots(old, new)
+
+    assert apply_snapshot_patch(old, ops) == new
+    # One remove and one add for the moved slide, plus position updates
+    assert sum(op["op"] in ("add", "remove") for op in ops) == 2